@@ -0,0 +1,136 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import arcade
+from pyglet import media
+
+PRELOAD_WORKERS = 4
+
+
+class AssetRegistry:
+    """Текстуры и звуки, загруженные один раз на весь процесс.
+
+    Экземпляр живёт в окне (GameWindow.assets), виды получают из него
+    общие объекты. Отсутствующие файлы запоминаются, так что повторный
+    запрос не лезет на диск и не бросает исключение. Для каждого файла
+    хранится время загрузки.
+
+    preload запускает чтение и декодирование файлов в пуле потоков. Потоки
+    только готовят данные (картинку и несжатый звук в памяти), а в кэш,
+    атлас текстур и звуковую систему они попадают в poll, в главном
+    потоке. Запрос ещё не готового файла дожидается именно его.
+    """
+
+    def __init__(self):
+        self.textures = {}
+        self.sounds = {}
+        # Пути, которых нет на диске или которые не удалось прочитать
+        self.missing = set()
+        self.load_times = {}
+        self.executor = None
+        # Путь -> (кэш, future) для файлов, которые ещё грузятся в фоне
+        self.pending = {}
+        self.preload_total = 0
+
+    def _load(self, cache, loader, paths):
+        """Первый существующий файл из paths (кандидаты по порядку) или None"""
+        for path in paths:
+            if path in self.pending:
+                self._finish(path)
+            if path in cache:
+                return cache[path]
+            if path in self.missing:
+                continue
+            if not os.path.exists(path):
+                print(f"Файл не найден: {path}")
+                self.missing.add(path)
+                continue
+
+            start = time.perf_counter()
+            try:
+                asset = loader(path)
+            except Exception as e:
+                print(f"Ошибка загрузки {path}: {e}")
+                self.missing.add(path)
+                continue
+            self.load_times[path] = time.perf_counter() - start
+            print(f"Загружен {path} за {self.load_times[path] * 1000:.0f} мс")
+            cache[path] = asset
+            return asset
+        return None
+
+    def preload(self, textures=(), sounds=()):
+        """Начать фоновую загрузку файлов, не дожидаясь её"""
+        # Звуковой драйвер создаём в главном потоке, до декодирования в пуле
+        media.get_audio_driver()
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(PRELOAD_WORKERS, thread_name_prefix="preload")
+
+        for cache, loader, paths in (
+            (self.textures, arcade.load_texture, textures),
+            (self.sounds, arcade.load_sound, sounds),
+        ):
+            for path in paths:
+                if path in cache or path in self.pending or path in self.missing:
+                    continue
+                self.pending[path] = (cache, self.executor.submit(self._decode, loader, path))
+                self.preload_total += 1
+
+    @staticmethod
+    def _decode(loader, path):
+        start = time.perf_counter()
+        return loader(path), time.perf_counter() - start
+
+    def _finish(self, path):
+        """Забрать результат фоновой загрузки (в главном потоке)"""
+        cache, future = self.pending.pop(path)
+        try:
+            asset, load_time = future.result()
+        except Exception as e:
+            print(f"Ошибка загрузки {path}: {e}")
+            self.missing.add(path)
+            return
+        if cache is self.textures:
+            # Картинка уходит на видеокарту здесь, а не при первой отрисовке
+            arcade.get_window().ctx.default_atlas.add(asset)
+        self.load_times[path] = load_time
+        print(f"Загружен {path} за {load_time * 1000:.0f} мс (в фоне)")
+        cache[path] = asset
+
+    def poll(self):
+        """Принять всё, что уже догрузилось. Вызывается каждый кадр"""
+        for path in [path for path, (_, future) in self.pending.items() if future.done()]:
+            self._finish(path)
+
+    @property
+    def ready(self):
+        return not self.pending
+
+    def progress(self):
+        """Доля выполненной фоновой загрузки, от 0 до 1"""
+        if self.preload_total == 0:
+            return 1.0
+        return 1.0 - len(self.pending) / self.preload_total
+
+    def texture(self, *paths):
+        return self._load(self.textures, arcade.load_texture, paths)
+
+    def sound(self, *paths):
+        return self._load(self.sounds, arcade.load_sound, paths)
+
+    def report(self):
+        lines = [f"Ресурсов загружено: {len(self.load_times)}, за {sum(self.load_times.values()) * 1000:.0f} мс"]
+        for path, load_time in sorted(self.load_times.items(), key=lambda item: -item[1]):
+            lines.append(f"  {path}: {load_time * 1000:.0f} мс")
+        for path in sorted(self.missing):
+            lines.append(f"  не загружен: {path}")
+        return "\n".join(lines)
+
+
+def get_assets(window):
+    """Реестр окна (создаётся при первом обращении, если окно его не завело)"""
+    assets = getattr(window, "assets", None)
+    if assets is None:
+        assets = AssetRegistry()
+        window.assets = assets
+    return assets
@@ -14,6 +14,7 @@ class BeautifulButton:
         self.is_hovered = False
         self.hover_animation = 0
         self.text_object = None
+        self.text_color = BUTTON_TEXT_COLOR
 
     def create_text_object(self, batch):
         self.text_object = arcade.Text(
@@ -29,6 +30,11 @@ class BeautifulButton:
             batch=batch
         )
 
+    def reset(self):
+        """Сбросить подсветку (при повторном показе вида)"""
+        self.is_hovered = False
+        self.hover_animation = 0
+
     def draw(self):
         if self.is_hovered:
             self.hover_animation = min(1.0, self.hover_animation + 0.1)
@@ -51,10 +57,11 @@ class BeautifulButton:
         arcade.draw_lrbt_rectangle_outline(left, right, bottom, top, border_color, 2)
 
         if self.text_object:
-            if self.is_hovered:
-                self.text_object.color = (255, 255, 200)
-            else:
-                self.text_object.color = BUTTON_TEXT_COLOR
+            text_color = (255, 255, 200) if self.is_hovered else BUTTON_TEXT_COLOR
+            # Не трогаем pyglet, если цвет не поменялся
+            if self.text_color != text_color:
+                self.text_object.color = text_color
+                self.text_color = text_color
 
     def check_hover(self, x, y):
         self.is_hovered = (
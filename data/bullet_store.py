@@ -0,0 +1,165 @@
+import heapq
+import math
+import numpy as np
+
+
+def slab_window(start, velocity, low, high):
+    """Интервал времени, когда start + velocity * t лежит в (low, high)"""
+    if velocity == 0:
+        return (-math.inf, math.inf) if low < start < high else (math.inf, -math.inf)
+    t_low = (low - start) / velocity
+    t_high = (high - start) / velocity
+    return min(t_low, t_high), max(t_low, t_high)
+
+
+class BulletStore:
+    """Живые пули в предвыделенных массивах (структура массивов).
+
+    Пули [0, count) живые, остальная часть массивов - запас. Движение
+    делается одним векторным проходом, без Python-цикла по пулям.
+
+    Пуля летит по прямой, поэтому всё её будущее известно при появлении:
+    когда она уйдёт за границы (bounds) и в какое время может задеть
+    зону попаданий (zone - арена, расширенная на радиусы). Уход за границы
+    и открытие и закрытие окна зоны лежат в кучах по времени, так что за
+    тик обрабатываются только наступившие события. Пули с открытым окном
+    хранятся отдельным набором - только их и надо проверять на попадания,
+    и работа за тик зависит от них, а не от всех живых пуль.
+    """
+
+    FIELDS = {
+        "x": np.float32, "y": np.float32, "vx": np.float32, "vy": np.float32,
+        # Позиции на предыдущем тике (для интерполяции при отрисовке)
+        "prev_x": np.float32, "prev_y": np.float32,
+        "ids": np.int64,
+        # Окно, когда пуля может задеть зону попаданий
+        "touch_from": np.float64, "touch_until": np.float64,
+    }
+
+    def __init__(self, bounds, zone, capacity=256):
+        self.bounds = bounds
+        self.zone = zone
+        self.capacity = capacity
+        self.count = 0
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.next_id = 0
+        # (время ухода за границы, id), (время открытия окна, id, время
+        # закрытия) и (время закрытия окна, id)
+        self.exits = []
+        self.openings = []
+        self.windows = []
+        # id пуль с открытым окном и до какого времени окна уже закрыты
+        self.near = set()
+        self.closed_until = -math.inf
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, dtype in self.FIELDS.items():
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def clear(self):
+        self.count = 0
+        self.exits.clear()
+        self.openings.clear()
+        self.windows.clear()
+        self.near.clear()
+        self.closed_until = -math.inf
+
+    def spawn(self, x, y, vx, vy, time):
+        """Новая пуля, которая в момент time находится в (x, y)"""
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.ids[i] = bullet_id = self.next_id
+        self.next_id += 1
+        self.count += 1
+
+        # Уход за границы: первая ось, по которой пуля выходит наружу
+        left, bottom, right, top = self.bounds
+        _, exit_x = slab_window(x, vx, left, right)
+        _, exit_y = slab_window(y, vy, bottom, top)
+        exit_time = time + max(0.0, min(exit_x, exit_y))
+        heapq.heappush(self.exits, (exit_time, bullet_id))
+
+        # Окно зоны попаданий. Пуля, которая мимо зоны, миновала арену,
+        # только когда ушла за границы - тогда её окно и закрывается
+        left, bottom, right, top = self.zone
+        enter_x, leave_x = slab_window(x, vx, left, right)
+        enter_y, leave_y = slab_window(y, vy, bottom, top)
+        enter = max(enter_x, enter_y, 0.0)
+        leave = min(leave_x, leave_y)
+        if enter > leave:
+            self.touch_from[i] = math.inf
+            self.touch_until[i] = -math.inf
+            heapq.heappush(self.windows, (exit_time, bullet_id))
+            return
+        self.touch_from[i] = time + enter
+        self.touch_until[i] = time + leave
+        heapq.heappush(self.openings, (time + enter, bullet_id, time + leave))
+        heapq.heappush(self.windows, (time + leave, bullet_id))
+
+    def move(self, delta_time):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n] * delta_time
+        self.y[:n] += self.vy[:n] * delta_time
+
+    def expire(self, time):
+        """Удалить пули, ушедшие за границы к моменту time. Возвращает сколько удалено"""
+        if not self.exits or self.exits[0][0] > time:
+            return 0
+        gone = []
+        while self.exits and self.exits[0][0] <= time:
+            gone.append(heapq.heappop(self.exits)[1])
+        self.near.difference_update(gone)
+
+        n = self.count
+        keep = ~np.isin(self.ids[:n], gone)
+        kept = int(np.count_nonzero(keep))
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+        return n - kept
+
+    def close_windows(self, time):
+        """Сколько пуль к моменту time окончательно миновали зону попаданий"""
+        closed = 0
+        while self.windows and self.windows[0][0] <= time:
+            self.near.discard(heapq.heappop(self.windows)[1])
+            closed += 1
+        self.closed_until = max(self.closed_until, time)
+        return closed
+
+    def touching(self, time):
+        """Индексы пуль, чьё окно открылось к моменту time и ещё не закрыто"""
+        while self.openings and self.openings[0][0] <= time:
+            _, bullet_id, until = heapq.heappop(self.openings)
+            # Окно, целиком прошедшее без запроса, открывать уже незачем
+            if until > self.closed_until:
+                self.near.add(bullet_id)
+        if not self.near:
+            return np.zeros(0, dtype=np.intp)
+        # Пули лежат в массивах по возрастанию id: слоты находятся бинарным поиском
+        ids = np.fromiter(self.near, dtype=np.int64, count=len(self.near))
+        ids.sort()
+        return np.searchsorted(self.ids[:self.count], ids)
+
+    def interpolated(self, alpha):
+        """Позиции пуль между предыдущим и текущим тиком"""
+        n = self.count
+        xs = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        ys = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        return xs, ys
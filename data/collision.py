@@ -0,0 +1,246 @@
+import math
+import numpy as np
+from data.constants import COLLISION_GRID_MIN
+
+
+def swept_interval(start, delta, low, high):
+    """Доли тика s из [0, 1], при которых low < start + delta * s < high.
+
+    Возвращает (enter, exit) - массивы границ. Пусто, где enter > exit.
+    """
+    start, delta, low, high = np.broadcast_arrays(
+        np.asarray(start, dtype=np.float64), np.asarray(delta, dtype=np.float64),
+        np.asarray(low, dtype=np.float64), np.asarray(high, dtype=np.float64)
+    )
+    moving = delta != 0
+    safe = np.where(moving, delta, 1.0)
+    s_low = (low - start) / safe
+    s_high = (high - start) / safe
+    enter = np.where(moving, np.minimum(s_low, s_high), np.where((low < start) & (start < high), 0.0, np.inf))
+    exit_ = np.where(moving, np.maximum(s_low, s_high), np.where((low < start) & (start < high), 1.0, -np.inf))
+    return np.maximum(enter, 0.0), np.minimum(exit_, 1.0)
+
+
+def swept_circles_contact(x0, y0, dx, dy, radius, xs, ys, dxs, dys, radii):
+    """Первое касание движущегося круга с движущимися кругами за тик.
+
+    Круг идёт из (x0, y0) на (dx, dy), круги (xs, ys) - на (dxs, dys).
+    Возвращает долю тика s в [0, 1] момента касания, np.inf - касания нет.
+    """
+    px = xs - x0
+    py = ys - y0
+    vx = dxs - dx
+    vy = dys - dy
+    reach = radii + radius
+
+    a = vx * vx + vy * vy
+    b = px * vx + py * vy
+    c = px * px + py * py - reach * reach
+
+    # |p + s v|^2 = reach^2: меньший корень - момент входа
+    disc = b * b - a * c
+    moving = a > 0
+    root = np.sqrt(np.maximum(disc, 0.0))
+    enter = np.where(moving, (-b - root) / np.where(moving, a, 1.0), np.inf)
+    hit = (c < 0) | (moving & (disc > 0) & (enter >= 0) & (enter <= 1))
+    return np.where(c < 0, 0.0, np.where(hit, enter, np.inf))
+
+
+def swept_circle_contact(x0, y0, dx, dy, radius, x, y, move_x, move_y, other_radius):
+    """swept_circles_contact для одного круга на обычных числах.
+
+    На паре кругов накладные расходы numpy в разы больше самой арифметики.
+    """
+    px = x - x0
+    py = y - y0
+    reach = radius + other_radius
+    c = px * px + py * py - reach * reach
+    if c < 0:
+        return 0.0
+    vx = move_x - dx
+    vy = move_y - dy
+    a = vx * vx + vy * vy
+    b = px * vx + py * vy
+    disc = b * b - a * c
+    # Круги расходятся или проходят мимо
+    if b >= 0 or disc <= 0:
+        return math.inf
+    enter = (-b - math.sqrt(disc)) / a
+    return enter if enter <= 1 else math.inf
+
+
+class SpatialHash:
+    """Равномерная сетка над ареной для широкой фазы.
+
+    Объекты раскладываются по ячейкам по своему центру: индексы
+    сортируются по номеру ячейки, так что каждая строка ячеек в запросе -
+    один непрерывный срез. Объекты за пределами сетки попадают в крайние
+    ячейки, поэтому запрос всегда возвращает надмножество попаданий.
+    """
+
+    def __init__(self, left, bottom, right, top, cell_size):
+        self.left = left
+        self.bottom = bottom
+        self.cell_size = cell_size
+        self.cols = max(1, int(np.ceil((right - left) / cell_size)))
+        self.rows = max(1, int(np.ceil((top - bottom) / cell_size)))
+        self.order = np.zeros(0, dtype=np.intp)
+        self.sorted_cells = np.zeros(0, dtype=np.intp)
+
+    def _col(self, x):
+        return np.clip(((x - self.left) // self.cell_size).astype(np.intp), 0, self.cols - 1)
+
+    def _row(self, y):
+        return np.clip(((y - self.bottom) // self.cell_size).astype(np.intp), 0, self.rows - 1)
+
+    def build(self, xs, ys):
+        cells = self._row(np.asarray(ys)) * self.cols + self._col(np.asarray(xs))
+        self.order = np.argsort(cells, kind="stable")
+        self.sorted_cells = cells[self.order]
+
+    def query(self, left, bottom, right, top):
+        """Индексы объектов из ячеек, которые задевает прямоугольник"""
+        if len(self.order) == 0:
+            return self.order
+
+        c0, c1 = self._col(np.array([left, right]))
+        r0, r1 = self._row(np.array([bottom, top]))
+        first_cells = np.arange(r0, r1 + 1) * self.cols + c0
+        starts = np.searchsorted(self.sorted_cells, first_cells, side="left")
+        ends = np.searchsorted(self.sorted_cells, first_cells + (c1 - c0), side="right")
+
+        if len(starts) == 1:
+            return self.order[starts[0]:ends[0]]
+        return np.concatenate([self.order[s:e] for s, e in zip(starts, ends)])
+
+
+class CollisionLayer:
+    """Слой кругов со своей сеткой"""
+
+    def __init__(self, grid):
+        self.grid = grid
+        # xs, ys и радиус (число или массив на каждый круг)
+        self.data = ((), (), 0.0)
+        # Смещения кругов за тик (None - круги стоят)
+        self.motion = None
+        # Сетка строится, только если кругов много
+        self.use_grid = False
+        # Наибольший радиус и наибольшие смещения - на столько расширяется
+        # рамка запроса к сетке
+        self.pad = 0.0
+        self.move_x = 0.0
+        self.move_y = 0.0
+
+
+class CollisionWorld:
+    """Все опасности-круги арены и единый запрос попаданий по сердцу.
+
+    Каждый тик слои заполняются текущими позициями и смещениями за тик
+    (set_circles), а query_swept_circle за один вызов возвращает попадания
+    по всем слоям. Проверяется движение за весь тик, а не только конечные
+    позиции: быстрая пуля не проскочит сердце даже при большом шаге.
+    Палки сюда не входят - коридор проверяется как карта высот
+    (check_stick_collisions).
+
+    Сетка и векторная проверка окупаются только на многих кругах: слой
+    меньше grid_min проверяется по одному кругу на обычных числах, без
+    сетки и без накладных расходов numpy.
+    """
+
+    def __init__(self, left, bottom, right, top, cell_size=64, grid_min=COLLISION_GRID_MIN):
+        self.bounds = (left, bottom, right, top)
+        self.cell_size = cell_size
+        self.grid_min = grid_min
+        self.layers = {}
+
+    def _layer(self, name):
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = CollisionLayer(SpatialHash(*self.bounds, self.cell_size))
+            self.layers[name] = layer
+        return layer
+
+    def set_circles(self, name, xs, ys, radius, dxs=None, dys=None):
+        """Круги слоя. radius - общий или на каждый круг, dxs, dys - смещение каждого за тик"""
+        layer = self._layer(name)
+        layer.data = (xs, ys, radius)
+        layer.motion = None if dxs is None else (dxs, dys)
+        layer.use_grid = len(xs) > 0 and len(xs) >= self.grid_min
+        if not layer.use_grid:
+            return
+
+        radii = np.broadcast_to(np.asarray(radius, dtype=np.float32), np.shape(xs))
+        layer.data = (xs, ys, radii)
+        layer.pad = float(radii.max())
+        if dxs is None:
+            layer.move_x = layer.move_y = 0.0
+        else:
+            layer.move_x = float(np.abs(dxs).max())
+            layer.move_y = float(np.abs(dys).max())
+        layer.grid.build(xs, ys)
+
+    def query_swept_circle(self, x0, y0, x1, y1, radius):
+        """Попадания по кругу, который за тик прошёл из (x0, y0) в (x1, y1).
+
+        Возвращает {имя слоя: (индексы, доли тика касания)}, попадания
+        отсортированы по времени касания - первое раньше всех.
+        """
+        hits = {}
+        for name, layer in self.layers.items():
+            if layer.use_grid:
+                hits[name] = self._query_grid(layer, x0, y0, x1, y1, radius)
+            else:
+                hits[name] = self._query_each(layer, x0, y0, x1, y1, radius)
+        return hits
+
+    def _query_each(self, layer, x0, y0, x1, y1, radius):
+        """Малый слой: каждый круг отдельно, на обычных числах"""
+        xs, ys, radii = layer.data
+        count = len(xs)
+        if count == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        xs, ys = xs.tolist(), ys.tolist()
+        radii = np.broadcast_to(radii, count).tolist() if np.ndim(radii) else [float(radii)] * count
+        if layer.motion is None:
+            dxs = dys = [0.0] * count
+        else:
+            dxs, dys = layer.motion[0].tolist(), layer.motion[1].tolist()
+
+        found = []
+        for index in range(count):
+            fraction = swept_circle_contact(
+                x0, y0, x1 - x0, y1 - y0, radius,
+                xs[index], ys[index], dxs[index], dys[index], radii[index]
+            )
+            if fraction <= 1:
+                found.append((fraction, index))
+        found.sort()
+        return (
+            np.array([index for _, index in found], dtype=np.intp),
+            np.array([fraction for fraction, _ in found], dtype=np.float64)
+        )
+
+    def _query_grid(self, layer, x0, y0, x1, y1, radius):
+        """Большой слой: кандидаты из сетки, затем векторная проверка"""
+        reach_x = radius + layer.pad + layer.move_x
+        reach_y = radius + layer.pad + layer.move_y
+        candidates = layer.grid.query(
+            min(x0, x1) - reach_x, min(y0, y1) - reach_y,
+            max(x0, x1) + reach_x, max(y0, y1) + reach_y
+        )
+        if len(candidates) == 0:
+            return candidates, np.zeros(0)
+
+        xs, ys, radii = layer.data
+        if layer.motion is None:
+            dxs = dys = 0.0
+        else:
+            dxs = layer.motion[0][candidates]
+            dys = layer.motion[1][candidates]
+        times = swept_circles_contact(
+            x0, y0, x1 - x0, y1 - y0, radius,
+            xs[candidates], ys[candidates], dxs, dys, radii[candidates]
+        )
+        mask = np.isfinite(times)
+        order = np.argsort(times[mask], kind="stable")
+        return candidates[mask][order], times[mask][order]
@@ -22,4 +22,39 @@ DOT_OUTLINE_COLOR = arcade.color.DARK_RED
 PAUSE_OVERLAY_COLOR = (0, 0, 0, 180)
 SQUARE_COLOR = arcade.color.WHITE
 
-SOUND_VOLUME = 0.5
\ No newline at end of file
+SOUND_VOLUME = 0.5
+
+# Симуляция
+SIM_TICK_RATE = 120  # Тиков симуляции в секунду
+SIM_MAX_TICKS_PER_FRAME = 30  # Не больше 0.25 сек симуляции за один кадр
+PARTICLE_POOL_SIZE = 256  # Максимум одновременно живых частиц удара
+FRAME_BUDGET = 1 / 30  # Кадр дольше этого считается рывком
+COLLISION_GRID_MIN = 32  # Меньше объектов в слое - сетка не строится, проверяются все
+
+# Ресурсы, которые начинают грузиться в фоне сразу при запуске
+MUSIC_PATH = "materials/sounds/btt.mp3"
+PRELOAD_TEXTURES = (
+    "materials/images/heart.png",
+    "materials/images/heartN2.png",
+)
+PRELOAD_SOUNDS = (
+    MUSIC_PATH,
+    "materials/sounds/shoot.wav",
+    "materials/sounds/hit.mp3",
+    "materials/sounds/win.wav",
+    "materials/sounds/lose.wav",
+)
+
+# Звуковые эффекты: голосов на категорию и окно склейки одинаковых звуков
+MIXER_VOICES = {"shoot": 4, "hit": 3, "result": 1, "ui": 2}
+MIXER_DEDUP_WINDOW = 0.03  # сек
+
+# Доимпортировать модули остальных видов в свободные кадры меню
+PREIMPORT_VIEWS = True
+MENU_PARTICLE_COUNT = 128  # Точек фона меню (примерно столько жило у старого эмиттера)
+DISPLAY_GAMMA = 1.0  # Гамма вывода кадра (1.0 - без коррекции)
+
+# Настройки: файл (колонки по порядку схемы) и задержка склейки записей
+SETTINGS_FILE = "settings.csv"
+SETTINGS_SAVE_DELAY = 0.5  # сек после последнего изменения
+REPLAY_PATH = "replays/last_fight.rpl"  # Запись последнего боя (перезаписывается)
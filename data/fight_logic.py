@@ -0,0 +1,859 @@
+import arcade
+import math
+import random
+import numpy as np
+from data.bullet_store import BulletStore
+from data.collision import CollisionWorld, swept_interval
+from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT, PARTICLE_POOL_SIZE
+from data.particle_pool import ParticlePool
+from data.sim_clock import SimulationClock
+from data.stick_corridor import StickCorridor
+from data.timeline import Timeline, load_timeline, timeline_texts
+
+INSTRUCTION_TEXT = "Уклоняйтесь от пуль! ESC - пауза"
+
+# Сценарий боя с солнцем: фазы, реплики, движения солнца и камеры
+FIGHT_TIMELINE = load_timeline("sun_boss")
+
+# Все реплики солнца и надписи-баннеры боя (GameView раскладывает их заранее)
+STORY_DIALOGS = timeline_texts(FIGHT_TIMELINE, "dialog")
+BANNER_MESSAGES = timeline_texts(FIGHT_TIMELINE, "banner")
+
+# Пули живут, пока не уйдут за этот прямоугольник (x0, y0, x1, y1)
+HAZARD_BOUNDS = (-100, -100, SCREEN_WIDTH + 100, SCREEN_HEIGHT + 100)
+
+MOVEMENT_KEYS = (
+    arcade.key.LEFT, arcade.key.A, arcade.key.RIGHT, arcade.key.D,
+    arcade.key.UP, arcade.key.W, arcade.key.DOWN, arcade.key.S
+)
+
+
+class FightLogic:
+    """Логика боя с боссом без окна, текстур, звуков и текста.
+
+    Всё, что связано с отображением, вынесено в методы-хуки (play_sound,
+    on_hp_changed, show_banner, ...), которые GameView переопределяет,
+    а headless-режим оставляет пустыми.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        # --- БАЛАНС ИГРЫ (Настраивай здесь) ---
+        self.DEFAULT_WAVE_SPEED = 2.1  # Скорость волны палок (было 1.5, просил 1.0)
+        self.DEFAULT_STICK_INTERVAL = 0.05  # Интервал спавна палок (в секундах времени симуляции)
+        self.wave_speed = self.DEFAULT_WAVE_SPEED
+        self.stick_spawn_interval = self.DEFAULT_STICK_INTERVAL
+        # --------------------------------------
+
+        self.particles = ParticlePool(PARTICLE_POOL_SIZE)
+        self.particle_colors = [
+            (255, 50, 50),
+            (255, 100, 100),
+            (255, 150, 150),
+        ]
+        self.game_active = True
+        self.game_time = 30.0
+        self.start_time = None
+        self.paused = False
+        self.victory = False
+
+        # Фиксированный шаг симуляции: всё игровое время считается в тиках, а не по time.time()
+        self.clock = SimulationClock()
+
+        # Все случайности боя - из своего генератора. Бой однозначно задаётся
+        # зерном и вводом по тикам (см. data/replay.py)
+        self.seed = 0
+        self.rng = random.Random(self.seed)
+
+        self.player_hp = 92
+        self.max_hp = 92
+        self.last_damage_time = 0
+        self.damage_interval = 0.1
+
+        self.arena_width = 600
+        self.arena_height = 250
+        self.arena_left = SCREEN_WIDTH // 2 - self.arena_width // 2
+        self.arena_right = SCREEN_WIDTH // 2 + self.arena_width // 2
+        self.arena_bottom = SCREEN_HEIGHT // 2 - self.arena_height // 2
+        self.arena_top = SCREEN_HEIGHT // 2 + self.arena_height // 2
+        self.original_arena_left = self.arena_left
+        self.original_arena_right = self.arena_right
+        self.original_arena_bottom = self.arena_bottom
+        self.original_arena_top = self.arena_top
+
+        self.heart_x = SCREEN_WIDTH // 2
+        self.heart_y = SCREEN_HEIGHT // 2
+        self.heart_size = 25
+        self.heart_speed = 200
+        self.heart_rotation = 0
+        # Позиция сердца на предыдущем тике (для интерполяции при отрисовке)
+        self.prev_heart_x = self.heart_x
+        self.prev_heart_y = self.heart_y
+
+        self.heart_pulse = 0.0
+        self.heart_pulse_speed = 2.5
+        self.heart_pulse_min = 0.9
+        self.heart_pulse_max = 1.0
+
+        self.bullet_timer = 0
+        self.bullets_dodged = 0
+        self.total_bullets = 0
+        self.bullet_radius = 35
+
+        # Сердце не выходит за арену, поэтому пуля может его задеть, только
+        # пока её центр в арене, расширенной на оба радиуса
+        reach = self.bullet_radius + self.heart_size * self.heart_pulse_max
+        self.bullets = BulletStore(HAZARD_BOUNDS, (
+            self.arena_left - reach, self.arena_bottom - reach,
+            self.arena_right + reach, self.arena_top + reach
+        ))
+
+        # Пули проверяются одним запросом к миру столкновений (палки - по карте высот коридора)
+        self.collision_world = CollisionWorld(*HAZARD_BOUNDS)
+
+        self.decor_exists = True
+        self.decor_x = 50
+        self.decor_y = SCREEN_HEIGHT - 50
+        self.decor_radius = 15
+        self.decor_color = arcade.color.GOLD
+        self.decor_angle = 0
+        self.prev_decor_x = self.decor_x
+        self.prev_decor_y = self.decor_y
+
+        self.keys_pressed = set()
+
+        self.sun_has_eyes = False
+        self.sun_is_angry = False
+        self.sun_is_red = False
+        self.sun_size_multiplier = 1.0
+        self.sun_target_x = None
+        self.sun_target_y = None
+        self.sun_move_speed = 400
+        self.sun_at_center = False
+        # Запомненная позиция солнца (действие save_sun_position)
+        self.sun_original_x = 0
+        self.sun_original_y = 0
+
+        self.camera_zoom_target = 1.0
+        self.camera_zoom = 1.0
+        self.camera_zoom_speed = 2.0
+
+        self.hard_mode_message = ""
+        self.sun_exhausted = False
+
+        self.camera_target_sun = False
+
+        # Диалоговое окно
+        self.dialog_box_visible = False
+        self.dialog_text = ""
+
+        # Сценарий боя: шаги из data/timelines и отложенные события
+        self.timeline = Timeline(FIGHT_TIMELINE)
+        self.timeline.validate(self)
+        self.dialog_hide_event = None
+        self.banner_hide_event = None
+
+        # Режимы, которые сценарий включает и выключает, а тик просто исполняет
+        self.shooting_interval = None  # Пауза между выстрелами (None - не стреляем)
+        self.shooting_extra_chance = 0.0  # Шанс второй пули в том же выстреле
+        self.sticks_active = False
+        self.stick_timer = 0  # Время коридора палок (от него считается x палок)
+        self.control_mode = "free"  # free, sideways (гравитация вправо), charge_jump
+
+        self.gravity_enabled = False
+        self.gravity_direction = "down"
+        self.heart_velocity_x = 0
+        self.heart_velocity_y = 0
+        self.gravity_strength = 200
+        self.shake_amount = 0
+        self.camera_follow_heart = False
+        self.arena_wall_move_speed = 500
+        self.stick_width = self.heart_size * 0.6
+        self.sticks = StickCorridor(self.arena_wall_move_speed)
+        self.phase_3_texture_changed = False
+        self.phase_3_heart_grounded = False
+        self.jump_power = 0
+        self.jump_key_pressed = False
+        self.jump_time = 0
+        self.max_jump_time = 0.5
+        self.max_jump_height = 0
+        self.next_stick_time = 0
+        self.stick_x_offset = 0
+        self.can_jump_this_ground = True  # Можно ли прыгнуть в текущем нахождении на земле
+        self.jump_lock = False  # Блокировка прыжка
+
+        self.game_stats = None
+
+    def reset_game(self, seed=None):
+        """Начать бой заново. Без seed зерно выбирается случайно"""
+        # Зерно приводится к 32 битам: столько под него места в записи боя
+        self.seed = (seed if seed is not None else random.randrange(1 << 32)) & 0xFFFFFFFF
+        self.rng.seed(self.seed)
+        self.heart_x = SCREEN_WIDTH // 2
+        self.heart_y = SCREEN_HEIGHT // 2
+        self.bullets.clear()
+        self.bullet_timer = 0
+        self.bullets_dodged = 0
+        self.total_bullets = 0
+        self.player_hp = self.max_hp
+        self.clock.reset()
+        self.last_damage_time = -self.damage_interval
+        self.start_time = self.clock.time
+        self.game_active = True
+        self.victory = False
+        self.keys_pressed.clear()
+        self.heart_pulse = 0.0
+        self.heart_rotation = 0
+        self.particles.clear()
+        self.decor_angle = 0
+        self.decor_x = 50
+        self.decor_y = SCREEN_HEIGHT - 50
+        self.decor_color = arcade.color.GOLD
+
+        self.dialog_box_visible = False
+        self.dialog_text = ""
+        self.sun_has_eyes = False
+        self.sun_is_angry = False
+        self.sun_is_red = False
+        self.sun_size_multiplier = 1.0
+        self.sun_target_x = None
+        self.sun_target_y = None
+        self.sun_at_center = False
+        self.sun_original_x = 0
+        self.sun_original_y = 0
+        self.camera_zoom_target = 1.0
+        self.camera_zoom = 1.0
+        self.hard_mode_message = ""
+        self.sun_exhausted = False
+
+        self.save_previous_state()
+        self.game_stats = None
+
+        self.camera_target_sun = False
+
+        self.shooting_interval = None
+        self.shooting_extra_chance = 0.0
+        self.sticks_active = False
+        self.stick_timer = 0
+        self.control_mode = "free"
+        self.gravity_enabled = False
+        self.gravity_direction = "down"
+        self.heart_velocity_x = 0
+        self.heart_velocity_y = 0
+        self.shake_amount = 0
+        self.camera_follow_heart = False
+        self.sticks.clear()
+        self.phase_3_texture_changed = False
+        self.phase_3_heart_grounded = False
+        self.jump_power = 0
+        self.jump_key_pressed = False
+        self.jump_time = 0
+        self.max_jump_height = (self.arena_top - self.arena_bottom) * 0.8
+        self.next_stick_time = 0
+        self.stick_x_offset = 0
+        self.jump_lock = False
+
+        # ИСПРАВЛЕНИЕ: Используем константы из __init__, а не жесткие значения
+        self.wave_speed = self.DEFAULT_WAVE_SPEED
+        self.stick_spawn_interval = self.DEFAULT_STICK_INTERVAL
+
+        # Сценарий начинается заново (первый шаг ставит инструкцию и стрельбу)
+        self.dialog_hide_event = None
+        self.banner_hide_event = None
+        self.timeline.start(self, self.clock.time)
+        self.timeline.update(self.clock.time)
+
+    def show_dialog(self, text, duration=4.0):  # Все диалоги по 4 секунды
+        """Показывает диалоговое окно с текстом на указанное время"""
+        self.dialog_box_visible = True
+        self.dialog_text = text
+
+        # Прячем инструкцию во время диалога
+        self.set_instruction_visible(False)
+
+        # Прошлая реплика могла ещё ждать скрытия - оно отменяется
+        self.timeline.cancel(self.dialog_hide_event)
+        self.dialog_hide_event = self.timeline.after(duration, [("hide_dialog", {})])
+
+    def hide_dialog(self):
+        """Скрывает диалоговое окно"""
+        self.dialog_box_visible = False
+        self.dialog_text = ""
+        self.timeline.cancel(self.dialog_hide_event)
+        self.dialog_hide_event = None
+
+    def update_sun_movement(self, delta_time):
+        if self.sun_target_x is None or self.sun_target_y is None:
+            return
+
+        self.camera_target_sun = True
+
+        dx = self.sun_target_x - self.decor_x
+        dy = self.sun_target_y - self.decor_y
+        distance = math.sqrt(dx * dx + dy * dy)
+
+        # При большом шаге не перелетаем цель, а сразу встаём в неё
+        if distance > 5 and distance > self.sun_move_speed * delta_time:
+            if distance > 0:
+                dx /= distance
+                dy /= distance
+            self.decor_x += dx * self.sun_move_speed * delta_time
+            self.decor_y += dy * self.sun_move_speed * delta_time
+        else:
+            self.decor_x = self.sun_target_x
+            self.decor_y = self.sun_target_y
+            self.sun_at_center = True
+            self.sun_target_x = None
+            self.sun_target_y = None
+
+    # ===== ДЕЙСТВИЯ СЦЕНАРИЯ (шаги data/timelines/*.json) =====
+
+    def action_set(self, **values):
+        """Выставить поля боя как есть (флаги солнца, камеры, гравитации)"""
+        for name, value in values.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"У боя нет поля {name}")
+            setattr(self, name, value)
+
+    def action_instruction(self, visible):
+        self.set_instruction_visible(visible)
+
+    def action_dialog(self, text, duration=4.0):
+        self.show_dialog(text, duration)
+
+    def action_hide_dialog(self):
+        self.hide_dialog()
+
+    def action_banner(self, text, duration=None):
+        self.show_banner(text, duration)
+
+    def action_hide_banner(self):
+        self.hide_banner()
+
+    def action_shooting(self, interval, extra_chance=0.0):
+        """Стрелять раз в interval секунд (None - прекратить)"""
+        self.shooting_interval = interval
+        self.shooting_extra_chance = extra_chance
+
+    def action_clear_bullets(self):
+        self.bullets.clear()
+
+    def action_heal(self, fraction):
+        self.player_hp = min(self.max_hp, self.player_hp + int(self.max_hp * fraction))
+        self.on_hp_changed()
+
+    def action_save_sun_position(self):
+        self.sun_original_x = self.decor_x
+        self.sun_original_y = self.decor_y
+
+    def action_move_sun(self, x, y, speed, dx=0, dy=0):
+        """Отправить солнце в точку. x и y - число или имя точки (см. sun_anchor)"""
+        self.sun_target_x = self.sun_anchor(x, "x") + dx
+        self.sun_target_y = self.sun_anchor(y, "y") + dy
+        self.sun_move_speed = speed
+        self.camera_target_sun = True
+
+    def sun_anchor(self, value, axis):
+        if not isinstance(value, str):
+            return value
+        anchors = {
+            "sun": (self.decor_x, self.decor_y),
+            "saved": (self.sun_original_x, self.sun_original_y),
+            "center_x": (SCREEN_WIDTH // 2, None),
+            "top": (None, SCREEN_HEIGHT),
+            "arena_top": (None, self.arena_top),
+        }
+        return anchors[value][0 if axis == "x" else 1]
+
+    def action_heart_to_floor(self):
+        visual_height = self.heart_size * 1.8
+        self.heart_y = self.arena_bottom + visual_height / 2
+
+    def action_shake(self, amount, duration):
+        self.shake_amount = amount
+        self.timeline.after(duration, [("set", {"shake_amount": 0})])
+
+    def action_sticks(self, active):
+        """Включить или убрать коридор палок"""
+        self.sticks_active = active
+        self.sticks.clear()
+        if active:
+            self.stick_x_offset = 0
+            self.stick_timer = 0
+            self.next_stick_time = self.stick_spawn_interval
+
+    def action_victory(self):
+        self.bullets.clear()
+        self.victory = True
+        self.game_active = False
+        self.end_game()
+
+    def condition_sun_arrived(self):
+        return self.sun_target_x is None
+
+    def condition_bullets_cleared(self):
+        return len(self.bullets) == 0
+
+    # ===== РЕЖИМЫ, ВКЛЮЧАЕМЫЕ СЦЕНАРИЕМ =====
+
+    def update_shooting(self, delta_time):
+        if self.shooting_interval is None:
+            return
+        self.bullet_timer += delta_time
+        if self.bullet_timer >= self.shooting_interval:
+            self.create_bullet()
+            if self.shooting_extra_chance and self.rng.random() < self.shooting_extra_chance:
+                self.create_bullet()
+            self.bullet_timer = 0
+            self.total_bullets += 1
+
+    def update_sticks(self, delta_time):
+        """Коридор палок: палки "едут" влево, их x считается от времени появления"""
+        if not self.sticks_active:
+            return
+        self.stick_timer += delta_time
+
+        # Удаляем палки за левой границей
+        self.sticks.expire(self.stick_timer, self.arena_left - 50)
+
+        # Спавн новых палок по времени симуляции, а не по кадрам
+        while self.next_stick_time <= self.stick_timer:
+            self.stick_x_offset += 3.0  # 3 пикселя между палками
+
+            # Создаем новую пару палок
+            self.add_stick_pair(self.next_stick_time, self.arena_right + self.stick_x_offset)
+            self.next_stick_time += self.stick_spawn_interval
+
+        # Сердце всегда по середине по горизонтали
+        self.heart_x = self.arena_left + (self.arena_right - self.arena_left) / 2
+
+    def update_gravity(self, delta_time):
+        """Обработка гравитации"""
+        if not (self.gravity_enabled and self.game_active and not self.paused):
+            return
+
+        if self.gravity_direction == "down":
+            visual_height = self.heart_size * 1.8
+            bottom_boundary = self.arena_bottom + visual_height / 2
+            top_boundary = self.arena_top - visual_height / 2
+
+            # Проверка: на полу ли сердце (с небольшим допуском)
+            on_ground = abs(self.heart_y - bottom_boundary) < 2
+
+            # Если на полу - снимаем блокировку прыжка
+            if on_ground:
+                self.jump_lock = False
+
+            # Прыжок: только если на полу, нет блокировки и нажата вверх
+            if on_ground and not self.jump_lock and (
+                    arcade.key.UP in self.keys_pressed or arcade.key.W in self.keys_pressed):
+                self.heart_velocity_y = 150
+                # Важно: не добавляем импульс повторно, пока держим кнопку
+
+            # Гравитация всегда действует вниз
+            self.heart_velocity_y -= self.gravity_strength * delta_time
+            self.heart_y += self.heart_velocity_y * delta_time
+
+            # Границы арены
+            if self.heart_y < bottom_boundary:
+                self.heart_y = bottom_boundary
+                self.heart_velocity_y = 0
+            if self.heart_y > top_boundary:
+                self.heart_y = top_boundary
+                self.heart_velocity_y = 0
+
+        elif self.gravity_direction == "right":
+            # Гравитация вправо
+            self.heart_velocity_x += self.gravity_strength * delta_time
+            self.heart_x += self.heart_velocity_x * delta_time
+
+            # Ограничиваем по границам
+            visual_width = self.heart_size * 1.8
+            right_boundary = self.arena_right - visual_width / 2
+            if self.heart_x > right_boundary:
+                self.heart_x = right_boundary
+                self.heart_velocity_x = 0
+
+            left_boundary = self.arena_left + visual_width / 2
+            if self.heart_x < left_boundary:
+                self.heart_x = left_boundary
+                self.heart_velocity_x = 0
+
+    def add_stick_pair(self, spawn_time, x):
+        """Добавляет пару палок с пустым пространством 35% и медленной волной от 5% до 95%"""
+        arena_height = self.arena_top - self.arena_bottom
+
+        # МЕДЛЕННАЯ ВОЛНА - используем wave_speed
+        # Пустое пространство движется от 5% до 95% высоты арены
+        wave_pos = 0.5 + 0.45 * math.sin(spawn_time * self.wave_speed)
+
+        # УВЕЛИЧЕННОЕ ПУСТОЕ ПРОСТРАНСТВО - 35% от высоты арены
+        empty_height = arena_height * 0.35
+
+        # Центр пустого пространства
+        empty_center_y = self.arena_bottom + arena_height * wave_pos
+
+        # Верхняя граница пустого пространства
+        empty_top = empty_center_y + empty_height / 2
+        # Нижняя граница пустого пространства
+        empty_bottom = empty_center_y - empty_height / 2
+
+        # Верхняя палочка - от верха арены до верхней границы пустого пространства
+        top_height = self.arena_top - empty_top
+        if top_height <= 5:  # Минимальная высота
+            top_height = 0
+
+        # Нижняя палочка - от нижней границы пустого пространства до низа арены
+        bottom_height = empty_bottom - self.arena_bottom
+        if bottom_height <= 5:  # Минимальная высота
+            bottom_height = 0
+
+        # ИСПРАВЛЕНИЕ: Храним время удара внутри палки
+        self.sticks.push(spawn_time, x, top_height, bottom_height, -self.damage_interval)
+
+    def query_hazards(self):
+        """Все попадания по сердцу за тик одним запросом: {"bullets": (индексы, доли тика)}.
+
+        Вызывается после движения сердца и до движения пуль: сердце прошло
+        путь prev_heart -> heart, а пули пройдут v * dt от текущих позиций.
+        Проверяются только пули, которые в этот тик могут быть у арены
+        (индексы - среди них).
+        """
+        dt = self.clock.dt
+        near = self.bullets.touching(self.clock.time)
+        self.collision_world.set_circles(
+            "bullets", self.bullets.x[near], self.bullets.y[near], self.bullet_radius,
+            self.bullets.vx[near] * dt, self.bullets.vy[near] * dt
+        )
+
+        heart_radius = self.heart_size * self.heart_pulse_max
+        return self.collision_world.query_swept_circle(
+            self.prev_heart_x, self.prev_heart_y, self.heart_x, self.heart_y, heart_radius
+        )
+
+    def contact_time(self, fraction):
+        """Время симуляции в доле fraction текущего тика"""
+        return self.clock.time - (1 - fraction) * self.clock.dt
+
+    def contact_point(self, fraction):
+        """Где было сердце в доле fraction текущего тика"""
+        return (
+            self.prev_heart_x + (self.heart_x - self.prev_heart_x) * fraction,
+            self.prev_heart_y + (self.heart_y - self.prev_heart_y) * fraction
+        )
+
+    def check_bullet_collisions(self):
+        """Урон от пуль с общим кулдауном. Возвращает True, если сердце погибло"""
+        slots, fractions = self.query_hazards()["bullets"]
+        if len(slots) == 0:
+            return False
+
+        # Урон считается с момента первого касания внутри тика
+        first = float(fractions[0])
+        current_time = self.contact_time(first)
+        if current_time - self.last_damage_time >= self.damage_interval:
+            self.last_damage_time = current_time
+            return self.take_damage(*self.contact_point(first))
+        return False
+
+    def check_stick_collisions(self):
+        """Попадания палок за тик: палки едут влево, сердце идёт prev_heart -> heart.
+
+        Возвращает True, если сердце погибло.
+        """
+        heart_radius = self.heart_size * self.heart_pulse_max
+        reach = heart_radius + self.stick_width / 2
+        travel = self.sticks.speed * self.clock.dt  # Палки за тик сдвинулись влево на travel
+        x0, y0 = self.prev_heart_x, self.prev_heart_y
+        x1, y1 = self.heart_x, self.heart_y
+
+        # Палки, которые за тик могли пройти через сердце по горизонтали
+        left = min(x0, x1) - reach - travel
+        right = max(x0, x1) + reach
+
+        # Коридор как карта высот: смотрим только палки над путём сердца
+        floor, ceiling = self.sticks.limits(self.stick_timer, left, right, self.arena_bottom, self.arena_top)
+        if floor < min(y0, y1) - heart_radius and max(y0, y1) + heart_radius < ceiling:
+            return False
+
+        # Всё считаем относительно палки: сердце смещается на (x1 - x0 + travel, y1 - y0)
+        slots = self.sticks.span_slots(self.stick_timer, left, right)
+        start_x = self.sticks.x_of(slots, self.stick_timer) + travel
+        enter_x, exit_x = swept_interval(x0 - start_x, x1 - x0 + travel, -reach, reach)
+        top_edge = self.arena_top - self.sticks.top_height[slots]
+        bottom_edge = self.arena_bottom + self.sticks.bottom_height[slots]
+        enter_top, exit_top = swept_interval(y0, y1 - y0, top_edge - heart_radius, np.inf)
+        enter_bottom, exit_bottom = swept_interval(y0, y1 - y0, -np.inf, bottom_edge + heart_radius)
+
+        hits = []
+        for last_hit, heights, enter_y, exit_y in (
+            (self.sticks.top_last_hit, self.sticks.top_height, enter_top, exit_top),
+            (self.sticks.bottom_last_hit, self.sticks.bottom_height, enter_bottom, exit_bottom),
+        ):
+            enter = np.maximum(enter_x, enter_y)
+            touched = (enter <= np.minimum(exit_x, exit_y)) & (heights[slots] > 0)
+            hits += [(float(enter[i]), last_hit, slots[i]) for i in np.flatnonzero(touched)]
+
+        # Удары по порядку касания внутри тика
+        for fraction, last_hit, slot in sorted(hits, key=lambda hit: hit[0]):
+            current_time = self.contact_time(fraction)
+            # Проверяем кулдаун внутри самой палки
+            if current_time - last_hit[slot] >= self.damage_interval:
+                # Обновляем время удара для ЭТОЙ конкретной палки
+                last_hit[slot] = current_time
+
+                if self.take_damage(*self.contact_point(fraction)):
+                    return True
+        return False
+
+    def step(self):
+        """Выполнить ровно один тик симуляции"""
+        self.save_previous_state()
+        self.clock.tick()
+        self.update_simulation(self.clock.dt)
+
+    def save_previous_state(self):
+        """Запоминает позиции перед тиком, чтобы on_draw мог интерполировать"""
+        self.prev_heart_x = self.heart_x
+        self.prev_heart_y = self.heart_y
+        self.prev_decor_x = self.decor_x
+        self.prev_decor_y = self.decor_y
+
+    def update_simulation(self, delta_time):
+        """Один тик симуляции боя"""
+        self.update_camera(delta_time)
+        self.heart_pulse += delta_time * self.heart_pulse_speed
+        self.decor_angle += delta_time * 45
+
+        self.particles.update(delta_time)
+
+        # Сценарий: только наступившие события и одно ожидаемое условие
+        self.timeline.update(self.clock.time)
+        if not self.game_active:
+            return
+
+        self.update_shooting(delta_time)
+        self.update_sun_movement(delta_time)
+        self.update_sticks(delta_time)
+        self.update_gravity(delta_time)
+
+        # Движение с клавиатуры
+        speed = self.heart_speed * delta_time
+
+        visual_width = self.heart_size * 1.8
+        visual_height = self.heart_size * 1.8
+
+        left_boundary = self.arena_left + visual_width / 2
+        right_boundary = self.arena_right - visual_width / 2
+        bottom_boundary = self.arena_bottom + visual_height / 2
+        top_boundary = self.arena_top - visual_height / 2
+
+        if self.control_mode == "sideways":
+            # В режиме гравитации вправо - движение вверх/вниз клавишами ВЛЕВО/ВПРАВО (наоборот)
+            if arcade.key.LEFT in self.keys_pressed or arcade.key.A in self.keys_pressed:
+                self.heart_y = max(bottom_boundary, self.heart_y - speed)  # ВЛЕВО = ВНИЗ
+                self.heart_velocity_y = 0
+            if arcade.key.RIGHT in self.keys_pressed or arcade.key.D in self.keys_pressed:
+                self.heart_y = min(top_boundary, self.heart_y + speed)  # ВПРАВО = ВВЕРХ
+                self.heart_velocity_y = 0
+            # Горизонтальное движение заблокировано полностью
+            self.heart_velocity_x = 0
+        elif self.control_mode == "charge_jump":
+            # В режиме прыжков - движение влево/вправо
+            if arcade.key.LEFT in self.keys_pressed or arcade.key.A in self.keys_pressed:
+                self.heart_x = max(left_boundary, self.heart_x - speed)
+            if arcade.key.RIGHT in self.keys_pressed or arcade.key.D in self.keys_pressed:
+                self.heart_x = min(right_boundary, self.heart_x + speed)
+            # Прыжок клавишей ВВЕРХ - зарядка прыжка
+            if arcade.key.UP in self.keys_pressed or arcade.key.W in self.keys_pressed:
+                if self.heart_y <= bottom_boundary + 1:
+                    self.jump_time += delta_time
+                    if self.jump_time > self.max_jump_time:
+                        self.jump_time = self.max_jump_time
+            else:
+                if self.jump_time > 0 and self.heart_y <= bottom_boundary + 1:
+                    # Совершаем прыжок при отпускании
+                    jump_power = (self.jump_time / self.max_jump_time) * 700
+                    self.heart_velocity_y = jump_power
+                    self.jump_time = 0
+        else:
+            # Обычный режим
+            if arcade.key.LEFT in self.keys_pressed or arcade.key.A in self.keys_pressed:
+                self.heart_x = max(left_boundary, self.heart_x - speed)
+            if arcade.key.RIGHT in self.keys_pressed or arcade.key.D in self.keys_pressed:
+                self.heart_x = min(right_boundary, self.heart_x + speed)
+            if arcade.key.UP in self.keys_pressed or arcade.key.W in self.keys_pressed:
+                self.heart_y = min(top_boundary, self.heart_y + speed)
+            if arcade.key.DOWN in self.keys_pressed or arcade.key.S in self.keys_pressed:
+                self.heart_y = max(bottom_boundary, self.heart_y - speed)
+
+        # ХИТБОКС В ЦЕНТРЕ: проверяется весь путь за тик, а не только конечные позиции
+        if self.sticks_active and self.check_stick_collisions():
+            return
+        if self.check_bullet_collisions():
+            return
+
+        # Движение пуль одним векторным проходом. Уход за экран и пролёт мимо
+        # арены известны заранее и достаются из куч только когда наступили
+        self.bullets.move(delta_time)
+        self.bullets.expire(self.clock.time)
+        dodged = self.bullets.close_windows(self.clock.time)
+        if dodged:
+            self.bullets_dodged += dodged
+            self.on_dodge_counted()
+
+    def create_hit_particles(self, x, y):
+        dxs, dys, sizes, lifetimes, colors = [], [], [], [], []
+        for _ in range(8):
+            angle = self.rng.uniform(0, 2 * math.pi)
+            speed = self.rng.uniform(1, 4)
+            dxs.append(math.cos(angle) * speed)
+            dys.append(math.sin(angle) * speed)
+            sizes.append(self.rng.uniform(3, 8))
+            lifetimes.append(self.rng.uniform(0.5, 1.5))
+            colors.append(self.rng.choice(self.particle_colors))
+
+        self.particles.spawn(
+            x, y,
+            np.array(dxs), np.array(dys), np.array(sizes), np.array(lifetimes), np.array(colors)
+        )
+
+    def create_bullet(self):
+        side = self.rng.randint(0, 3)
+
+        if side == 0:
+            start_x = self.rng.randint(50, SCREEN_WIDTH - 50)
+            start_y = SCREEN_HEIGHT + 50
+        elif side == 1:
+            start_x = SCREEN_WIDTH + 50
+            start_y = self.rng.randint(50, SCREEN_HEIGHT - 50)
+        elif side == 2:
+            start_x = self.rng.randint(50, SCREEN_WIDTH - 50)
+            start_y = -50
+        else:
+            start_x = -50
+            start_y = self.rng.randint(50, SCREEN_HEIGHT - 50)
+
+        target_x = self.rng.randint(
+            int(self.arena_left + 30),
+            int(self.arena_right - 30)
+        )
+        target_y = self.rng.randint(
+            int(self.arena_bottom + 30),
+            int(self.arena_top - 30)
+        )
+
+        dx = target_x - start_x
+        dy = target_y - start_y
+        length = math.sqrt(dx * dx + dy * dy)
+
+        if length > 0:
+            dx /= length
+            dy /= length
+
+        dx += self.rng.uniform(-0.15, 0.15)
+        dy += self.rng.uniform(-0.15, 0.15)
+
+        length = math.sqrt(dx * dx + dy * dy)
+        if length > 0:
+            dx /= length
+            dy /= length
+
+        speed = self.rng.uniform(180, 220)
+        # Пуля сдвинется в конце этого тика, так что в (start_x, start_y) она в его начале
+        self.bullets.spawn(start_x, start_y, dx * speed, dy * speed, self.clock.time - self.clock.dt)
+
+        self.play_sound("shoot", volume=0.3)
+
+    def end_game(self):
+        elapsed = self.clock.time - self.start_time if self.start_time is not None else 0
+
+        self.game_stats = {
+            "victory": self.victory,
+            "time_survived": elapsed,
+            "bullets_dodged": self.bullets_dodged,
+            "total_bullets": self.total_bullets,
+            "hp_remaining": self.player_hp,
+            "sun_exhausted": self.sun_exhausted
+        }
+
+        self.play_sound("win" if self.victory else "lose")
+        self.on_game_over()
+
+    def press_key(self, key):
+        """Нажатие клавиши движения"""
+        if not self.paused and self.game_active and key in MOVEMENT_KEYS:
+            self.keys_pressed.add(key)
+
+    def release_key(self, key):
+        """Отпускание клавиши движения"""
+        if key in MOVEMENT_KEYS:
+            self.keys_pressed.discard(key)
+
+        # Если отпустили вверх в воздухе - блокируем прыжки до земли
+        if key in [arcade.key.UP, arcade.key.W]:
+            visual_height = self.heart_size * 1.8
+            bottom_boundary = self.arena_bottom + visual_height / 2
+            if abs(self.heart_y - bottom_boundary) >= 2:  # в воздухе
+                self.jump_lock = True
+
+    def apply_input(self, keys):
+        """Привести набор нажатых клавиш к keys (для скриптового ввода)"""
+        for key in self.keys_pressed - set(keys):
+            self.release_key(key)
+        for key in keys:
+            if key not in self.keys_pressed:
+                self.press_key(key)
+
+    def take_damage(self, x=None, y=None):
+        """Снимает 1 HP. (x, y) - точка удара, по умолчанию сердце.
+
+        Возвращает True, если сердце погибло и бой окончен.
+        """
+        self.player_hp -= 1
+        self.on_hp_changed()
+        self.play_sound("hit", volume=0.25)
+        self.create_hit_particles(self.heart_x if x is None else x, self.heart_y if y is None else y)
+
+        if self.player_hp <= 0:
+            self.player_hp = 0
+            self.game_active = False
+            self.victory = False
+            self.end_game()
+            return True
+        return False
+
+    # ===== ХУКИ ОТОБРАЖЕНИЯ (переопределяются в GameView) =====
+
+    def update_camera(self, delta_time):
+        pass
+
+    def play_sound(self, name, volume=1.0):
+        pass
+
+    def on_hp_changed(self):
+        pass
+
+    def on_dodge_counted(self):
+        pass
+
+    def set_instruction_visible(self, visible):
+        pass
+
+    def show_banner(self, message, duration=None):
+        """Крупная красная надпись внизу экрана (без duration - до hide_banner)"""
+        self.hard_mode_message = message
+        self.timeline.cancel(self.banner_hide_event)
+        self.banner_hide_event = None
+        if duration is not None:
+            self.banner_hide_event = self.timeline.after(duration, [("hide_banner", {})])
+
+    def hide_banner(self):
+        self.hard_mode_message = ""
+        self.timeline.cancel(self.banner_hide_event)
+        self.banner_hide_event = None
+
+    def on_game_over(self):
+        pass
+
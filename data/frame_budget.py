@@ -0,0 +1,39 @@
+from data.constants import FRAME_BUDGET
+
+
+class FrameBudget:
+    """Счётчик кадров, вышедших за бюджет времени.
+
+    record получает время работы кадра (on_update + on_draw, замеренные
+    через perf_counter) и время боя, в которое он закончился. По отчёту
+    видно, были ли после начала боя рывки и когда именно - например, при
+    первом показе диалога.
+    """
+
+    def __init__(self, budget=FRAME_BUDGET):
+        self.budget = budget
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.worst = 0.0
+        self.worst_time = 0.0
+        # (время боя, длительность кадра) для кадров сверх бюджета
+        self.over_budget = []
+
+    def record(self, frame_time, fight_time):
+        self.frames += 1
+        if frame_time > self.worst:
+            self.worst = frame_time
+            self.worst_time = fight_time
+        if frame_time > self.budget:
+            self.over_budget.append((fight_time, frame_time))
+
+    def report(self):
+        lines = [
+            f"Кадров: {self.frames}, сверх бюджета {self.budget * 1000:.0f} мс: {len(self.over_budget)}",
+            f"Худший кадр: {self.worst * 1000:.1f} мс на {self.worst_time:.1f} сек",
+        ]
+        for fight_time, frame_time in self.over_budget[:10]:
+            lines.append(f"  {fight_time:.2f} сек: {frame_time * 1000:.1f} мс")
+        return "\n".join(lines)
@@ -1,97 +1,55 @@
 import arcade
 import math
 import random
-import time
 import os
+import struct
+import time
 from collections import namedtuple
 from pyglet.graphics import Batch
+from data.assets import get_assets
 from data.beautiful_button import BeautifulButton
+from data.fight_logic import FightLogic, INSTRUCTION_TEXT, STORY_DIALOGS, BANNER_MESSAGES, MOVEMENT_KEYS
+from data.frame_budget import FrameBudget
+from data.gl_batches import CircleBatch, SpriteBatch, StickMesh, ring_image
+from data.hud import HudLayer
+from data.mixer import get_mixer
+from data.replay import ReplayRecorder, ReplayInput
+from data.sim_clock import lerp
+from data.stick_corridor import StickCorridor
+from data.sun_sprite import SunSprite
+from data.text_binding import TextBindings
+from data.views import get_views
 from data.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BUTTON_WIDTH, BUTTON_HEIGHT,
     BUTTON_SPACING, BACKGROUND_COLOR, SQUARE_COLOR,
-    PAUSE_OVERLAY_COLOR
+    PAUSE_OVERLAY_COLOR, PARTICLE_POOL_SIZE, REPLAY_PATH
 )
 
 Rect = namedtuple('Rect', ['x', 'y', 'width', 'height'])
 
+# Категория голосов микшера для каждого звука боя
+SOUND_CATEGORIES = {"shoot": "shoot", "hit": "hit", "win": "result", "lose": "result"}
 
-class GameView(arcade.View):
+
+class GameView(FightLogic, arcade.View):
     def __init__(self):
         super().__init__()
 
-        # --- БАЛАНС ИГРЫ (Настраивай здесь) ---
-        self.DEFAULT_WAVE_SPEED = 2.1  # Скорость волны палок (было 1.5, просил 1.0)
-        self.DEFAULT_STICK_INTERVAL = 3  # Интервал спавна палок (в кадрах)
-        self.wave_speed = self.DEFAULT_WAVE_SPEED
-        self.stick_spawn_interval = self.DEFAULT_STICK_INTERVAL
-        # --------------------------------------
-
-        self.particles = []
-        self.particle_colors = [
-            (255, 50, 50),
-            (255, 100, 100),
-            (255, 150, 150),
-        ]
         self.shoot_sound = None
         self.hit_sound = None
         self.win_sound = None
         self.lose_sound = None
         self.background_music = None
         self.sound_enabled = True
-        self.game_active = True
-        self.game_time = 30.0
-        self.start_time = None
-        self.paused = False
-        self.pause_start_time = None
-        self.victory = False
-
-        self.player_hp = 92
-        self.max_hp = 92
-        self.last_damage_time = 0
-        self.damage_interval = 0.1
-
-        self.arena_width = 600
-        self.arena_height = 250
-        self.arena_left = SCREEN_WIDTH // 2 - self.arena_width // 2
-        self.arena_right = SCREEN_WIDTH // 2 + self.arena_width // 2
-        self.arena_bottom = SCREEN_HEIGHT // 2 - self.arena_height // 2
-        self.arena_top = SCREEN_HEIGHT // 2 + self.arena_height // 2
-        self.original_arena_left = self.arena_left
-        self.original_arena_right = self.arena_right
-        self.original_arena_bottom = self.arena_bottom
-        self.original_arena_top = self.arena_top
-
-        self.heart_x = SCREEN_WIDTH // 2
-        self.heart_y = SCREEN_HEIGHT // 2
-        self.heart_size = 25
-        self.heart_speed = 200
+        self.mixer = None
+
         self.heart_texture = None
         self.heart_texture2 = None
-        self.heart_rotation = 0
-
-        self.heart_pulse = 0.0
-        self.heart_pulse_speed = 2.5
-        self.heart_pulse_min = 0.9
-        self.heart_pulse_max = 1.0
-
-        self.bullets = []
-        self.bullet_timer = 0
-        self.bullet_spawn_rate = 0.6
-        self.bullets_dodged = 0
-        self.total_bullets = 0
-        self.bullet_radius = 35
-
         self.heart_sprite = None
-        self.bullet_sprites = arcade.SpriteList()
-
-        self.decor_exists = True
-        self.decor_x = 50
-        self.decor_y = SCREEN_HEIGHT - 50
-        self.decor_radius = 15
-        self.decor_color = arcade.color.GOLD
-        self.decor_angle = 0
-
-        self.keys_pressed = set()
+        self.bullet_batch = None
+        self.stick_mesh = None
+        self.sun_sprite = SunSprite()
+        self.hud = HudLayer()
 
         self.batch = None
         self.timer_text = None
@@ -103,120 +61,55 @@ class GameView(arcade.View):
         self.stats_text = None
         self.hp_text = None
 
-        self.story_active = False
-        self.story_step = 0
-        self.story_timer = 0
-        self.story_text = ""
-        self.sun_has_eyes = False
-        self.sun_is_angry = False
-        self.sun_is_red = False
-        self.sun_size_multiplier = 1.0
-        self.sun_target_x = None
-        self.sun_target_y = None
-        self.sun_move_speed = 400
-        self.sun_at_center = False
-        self.sun_return_timer = 0
-        self.sun_return_delay = 0.2
-        self.sun_original_y = 0
-        self.sun_first_move_done = False
-        self.sun_original_speed = 200
+        # Строки текстов обновляются через привязки и раскладываются раз за кадр
+        self.texts = None
+        self.timer_label = None
+        self.instruction_label = None
+        self.stats_label = None
+        self.hp_label = None
 
         self.camera = arcade.camera.Camera2D()
-        self.camera_zoom_target = 1.0
-        self.camera_zoom = 1.0
-        self.camera_zoom_speed = 2.0
-
-        self.hard_mode = False
-        self.hard_mode_timer = 0
-        self.hard_mode_message = ""
-        self.hard_mode_message_timer = 0
+        self.particle_batch = CircleBatch(self.window.ctx, PARTICLE_POOL_SIZE)
+        # Все пули - одна текстура (жёлтый круг с оранжевой обводкой) и один вызов отрисовки
+        bullet_image = ring_image(self.bullet_radius, arcade.color.YELLOW, arcade.color.ORANGE, 3)
+        self.bullet_batch = SpriteBatch(self.window.ctx, bullet_image, bullet_image.width / 2)
+        self.stick_mesh = StickMesh(self.window.ctx, self.sticks, self.stick_width)
         self.hard_mode_text = None
-
-        self.first_wave_complete = False
-        self.first_phase_duration = 15.0  # Первая фаза 15 секунд
-        self.first_phase_timer = 0
-
-        self.sun_exhausted = False
-        self.sun_exhaust_timer = 0
-        self.sun_exhaust_time = 30.0  # Вторая фаза 30 секунд
-
-        self.camera_target_sun = False
-
-        # Диалоговое окно
-        self.dialog_box_visible = False
-        self.dialog_text = ""
-        self.dialog_timer = 0
-        self.dialog_duration = 0
         self.dialog_text_object = None
-
-        # Третья фаза
-        self.phase_3_active = False
-        self.phase_3_timer = 0
-        self.phase_3_duration = 15.0
-        self.phase_3_step = 0
-        self.phase_3_wait_for_bullets = False
-        self.phase_3_step7_duration = 30.0  # Четвертая фаза 30 секунд
-        self.phase_3_step7_message_shown = False  # Флаг для показа "я устал"
-        self.gravity_enabled = False
-        self.gravity_direction = "down"
-        self.heart_velocity_x = 0
-        self.heart_velocity_y = 0
-        self.gravity_strength = 200
-        self.shake_timer = 0
-        self.shake_amount = 0
-        self.camera_follow_heart = False
-        self.arena_wall_move_speed = 500
-        self.sticks = []
-        self.phase_3_texture_changed = False
-        self.phase_3_heart_grounded = False
-        self.sun_pre_attack_y = 0
-        self.jump_power = 0
-        self.jump_key_pressed = False
-        self.jump_time = 0
-        self.max_jump_time = 0.5
-        self.max_jump_height = 0
-        self.stick_spawn_counter = 0
-        self.stick_x_offset = 0
-        self.phase_3_wait_timer = 0
-        self.can_jump_this_ground = True  # Можно ли прыгнуть в текущем нахождении на земле
-        self.jump_lock = False  # Блокировка прыжка
+        # Готовые тексты реплик и баннеров по строке (раскладываются в warm_up)
+        self.dialog_texts = {}
+        self.banner_texts = {}
+        self.frame_budget = FrameBudget()
+        # Время работы on_update текущего кадра (None - кадр не считается)
+        self.update_work = None
+
+        # Ввод: зажатые клавиши применяются к бою в начале каждого тика,
+        # так же как при воспроизведении записи
+        self.held_keys = set()
+        self.input_source = self.live_input
+        self.recorder = ReplayRecorder()
+        # Запись, которую нужно проиграть при следующем показе вида
+        self.replay = None
+        # Тряска сердца - только эффект отрисовки, у неё свой генератор
+        self.shake_rng = random.Random()
 
     def setup(self):
-        try:
-            possible_paths = [
-                "materials/images/heart.png",
-                "../materials/heart.png",
-                os.path.join(os.path.dirname(__file__), "../materials/heart.png")
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    self.heart_texture = arcade.load_texture(path)
-                    print(f"Текстура сердца загружена из: {path}")
-                    break
-
-            if self.heart_texture is None:
-                print("Файл heart.png не найден. Используется запасной вариант.")
-
-        except Exception as e:
-            print(f"Ошибка при загрузке текстуры: {e}")
-            self.heart_texture = None
-
-        try:
-            self.heart_texture2 = arcade.load_texture("materials/images/heartN2.png")
-            print("Текстура сердца heartN2 загружена")
-        except:
-            print("Файл heartN2.png не найден")
-            self.heart_texture2 = None
-
-        try:
-            self.shoot_sound = arcade.load_sound("materials/sounds/shoot.wav")
-            self.hit_sound = arcade.load_sound("materials/sounds/hit.mp3")
-            self.win_sound = arcade.load_sound("materials/sounds/win.wav")
-            self.lose_sound = arcade.load_sound("materials/sounds/lose.wav")
-        except Exception as e:
-            print(f"Ошибка при загрузке звуков: {e}")
-            self.sound_enabled = False
+        # Всё берётся из общего реестра окна: с диска читается только первый раз
+        assets = get_assets(self.window)
+        self.heart_texture = assets.texture(
+            "materials/images/heart.png",
+            "../materials/heart.png",
+            os.path.join(os.path.dirname(__file__), "../materials/heart.png")
+        )
+        if self.heart_texture is None:
+            print("Файл heart.png не найден. Используется запасной вариант.")
+        self.heart_texture2 = assets.texture("materials/images/heartN2.png")
+
+        self.mixer = get_mixer(self.window)
+        self.shoot_sound = assets.sound("materials/sounds/shoot.wav")
+        self.hit_sound = assets.sound("materials/sounds/hit.mp3")
+        self.win_sound = assets.sound("materials/sounds/win.wav")
+        self.lose_sound = assets.sound("materials/sounds/lose.wav")
 
         if self.heart_texture:
             try:
@@ -245,7 +138,7 @@ class GameView(arcade.View):
         )
 
         self.instruction_text = arcade.Text(
-            "Уклоняйтесь от пуль! ESC - пауза",
+            INSTRUCTION_TEXT,
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 80,
             arcade.color.LIGHT_GRAY,
@@ -273,6 +166,12 @@ class GameView(arcade.View):
             batch=self.batch
         )
 
+        self.texts = TextBindings()
+        self.timer_label = self.texts.bind(self.timer_text)
+        self.instruction_label = self.texts.bind(self.instruction_text)
+        self.stats_label = self.texts.bind(self.stats_text)
+        self.hp_label = self.texts.bind(self.hp_text)
+
         self.pause_title_text = arcade.Text(
             "ПАУЗА",
             SCREEN_WIDTH // 2,
@@ -311,141 +210,194 @@ class GameView(arcade.View):
         self.camera.position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.camera.zoom = 1.0
 
-        self.reset_game()
-
-    def reset_game(self):
-        self.heart_x = SCREEN_WIDTH // 2
-        self.heart_y = SCREEN_HEIGHT // 2
-        self.bullets = []
-        self.bullet_sprites.clear()
-        self.bullet_timer = 0
-        self.bullets_dodged = 0
-        self.total_bullets = 0
-        self.player_hp = self.max_hp
-        self.last_damage_time = 0
-        self.start_time = time.time()
-        self.game_active = True
-        self.victory = False
-        self.keys_pressed.clear()
-        self.heart_pulse = 0.0
-        self.heart_rotation = 0
-        self.decor_angle = 0
-        self.decor_x = 50
-        self.decor_y = SCREEN_HEIGHT - 50
-        self.decor_color = arcade.color.GOLD
-
-        self.story_active = False
-        self.story_step = 0
-        self.story_timer = 0
-        self.story_text = ""
-        self.dialog_box_visible = False
-        self.dialog_text = ""
-        self.dialog_timer = 0
-        self.dialog_text_object = None
-        self.sun_has_eyes = False
-        self.sun_is_angry = False
-        self.sun_is_red = False
-        self.sun_size_multiplier = 1.0
-        self.sun_target_x = None
-        self.sun_target_y = None
-        self.sun_at_center = False
-        self.sun_return_timer = 0
-        self.sun_original_y = 0
-        self.sun_first_move_done = False
-        self.camera_zoom_target = 1.0
-        self.camera_zoom = 1.0
-        self.hard_mode = False
-        self.hard_mode_timer = 0
-        self.hard_mode_message = ""
-        self.hard_mode_message_timer = 0
-        self.hard_mode_text = None
+        self.warm_up()
+
+    def warm_up(self):
+        """Сделать заранее всё, что иначе случилось бы впервые посреди боя.
+
+        Раскладываются все реплики и баннеры, каждый примитив и батч
+        рисуется один раз во внеэкранный буфер (компиляция шейдеров,
+        загрузка текстур), а звуковые плееры запускаются без звука.
+        """
+        start = time.perf_counter()
+
+        for text in STORY_DIALOGS:
+            self.get_dialog_text(text)
+        for message in BANNER_MESSAGES:
+            self.get_banner_text(message)
+
+        ctx = self.window.ctx
+        target = ctx.framebuffer(color_attachments=[ctx.texture((64, 64), components=4)])
+        with target.activate():
+            target.clear()
+            arcade.draw_lrbt_rectangle_filled(0, 10, 0, 10, arcade.color.WHITE)
+            arcade.draw_lrbt_rectangle_outline(0, 10, 0, 10, arcade.color.WHITE, 2)
+            arcade.draw_circle_filled(5, 5, 5, arcade.color.RED)
+            arcade.draw_circle_outline(5, 5, 5, arcade.color.WHITE, 1)
+            arcade.draw_line(0, 0, 10, 10, arcade.color.WHITE, 3)
+            for texture in (self.heart_texture, self.heart_texture2):
+                if texture:
+                    arcade.draw_texture_rect(texture, Rect(x=0, y=0, width=10, height=10))
+
+            # Все варианты солнца, которые встречаются за бой
+            radius = self.decor_radius
+            for variant in (
+                (radius, False, False, False),
+                (radius, False, True, False),
+                (radius * 1.8, True, True, True),
+            ):
+                self.sun_sprite.set_variant(*variant)
+                self.sun_sprite.draw(5, 5, 0)
+
+            self.particle_batch.update([5], [5], [3], [(255, 255, 255, 255)])
+            self.particle_batch.draw()
+            self.particle_batch.update([], [], [], [])
+            self.bullet_batch.update([5], [5])
+            self.bullet_batch.draw()
+            self.bullet_batch.update([], [])
+            # Палки - на отдельном коридоре, чтобы не трогать синхронизацию боевого
+            sticks = StickCorridor(self.arena_wall_move_speed, capacity=1)
+            sticks.push(0, 5, 5, 5, 0)
+            StickMesh(ctx, sticks, self.stick_width).draw(0, 0, 10, 0)
+
+            self.hud.update(self.player_hp, self.max_hp, self.arena_bottom)
+            self.hud.draw()
+            self.batch.draw()
+            self.pause_batch.draw()
+            self.pause_title_text.draw()
+            for text in list(self.dialog_texts.values()) + list(self.banner_texts.values()):
+                text.draw()
+
+        # Голоса микшера получают свои звуки заранее
+        if self.sound_enabled:
+            for name in SOUND_CATEGORIES:
+                self.play_sound(name, volume=0)
+            self.mixer.stop_all()
 
-        self.first_wave_complete = False
-        self.first_phase_timer = 0
+        print(f"Прогрев перед боем: {(time.perf_counter() - start) * 1000:.0f} мс")
 
-        self.sun_exhausted = False
-        self.sun_exhaust_timer = 0
-        self.sun_exhaust_time = 30.0
+    def on_show_view(self):
+        # Вид переиспользуется между боями: каждый показ - новый бой
+        self.paused = False
+        for button in self.pause_buttons:
+            button.reset()
+        self.held_keys.clear()
+
+        if self.replay:
+            print(f"Воспроизведение записи: зерно {self.replay.seed}, {self.replay.ticks} тиков")
+            self.reset_game(self.replay.seed)
+            self.input_source = ReplayInput(self.replay)
+            self.replay = None
+        else:
+            self.reset_game()
+            self.input_source = self.live_input
+            self.recorder.start(self.seed, self.clock.tick_rate)
+
+    def on_hide_view(self):
+        arcade.unschedule(self.show_results)
+        # Брошенный бой не сохраняется
+        self.recorder.finish(None)
+
+    def live_input(self, fight):
+        return self.held_keys
+
+    def reset_game(self, seed=None):
+        super().reset_game(seed)
+        self.shake_rng.seed(self.seed)
+        self.hard_mode_text = None
+        self.dialog_text_object = None
+        self.frame_budget.reset()
+        self.update_work = None
 
         if self.heart_sprite:
             self.heart_sprite.center_x = self.heart_x
             self.heart_sprite.center_y = self.heart_y
 
-        self.timer_text.text = f"0.0 сек"
-        self.stats_text.text = f"Уклонений: 0"
-        self.hp_text.text = f"HP: {self.player_hp}/{self.max_hp}"
+        self.timer_label.set(f"0.0 сек")
+        self.stats_label.set(f"Уклонений: 0")
+        self.hp_label.set(f"HP: {self.player_hp}/{self.max_hp}")
 
-        self.camera_target_sun = False
         self.camera.position = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.camera.zoom = 1.0
-        self.camera_zoom = 1.0
-        self.camera_zoom_target = 1.0
-
-        # Показываем инструкцию при старте
-        if self.instruction_text:
-            self.instruction_text.text = "Уклоняйтесь от пуль! ESC - пауза"
-
-        # Сброс параметров третьей фазы
-        self.phase_3_active = False
-        self.phase_3_timer = 0
-        self.phase_3_step = 0
-        self.phase_3_wait_for_bullets = False
-        self.phase_3_step7_message_shown = False
-        self.gravity_enabled = False
-        self.gravity_direction = "down"
-        self.heart_velocity_x = 0
-        self.heart_velocity_y = 0
-        self.shake_timer = 0
-        self.shake_amount = 0
-        self.camera_follow_heart = False
-        self.sticks = []
-        self.phase_3_texture_changed = False
-        self.phase_3_heart_grounded = False
-        self.sun_pre_attack_y = 0
-        self.jump_power = 0
-        self.jump_key_pressed = False
-        self.jump_time = 0
-        self.max_jump_height = (self.arena_top - self.arena_bottom) * 0.8
-        self.stick_spawn_counter = 0
-        self.stick_x_offset = 0
-        self.jump_lock = False
-
-        # ИСПРАВЛЕНИЕ: Используем константы из __init__, а не жесткие значения
-        self.wave_speed = self.DEFAULT_WAVE_SPEED
-        self.stick_spawn_interval = self.DEFAULT_STICK_INTERVAL
-
-    def show_dialog(self, text, duration=4.0):  # Все диалоги по 4 секунды
-        """Показывает диалоговое окно с текстом на указанное время"""
-        self.dialog_box_visible = True
-        self.dialog_text = text
-        self.dialog_timer = 0
-        self.dialog_duration = duration
-
-        # Создаем Text объект для диалога
-        self.dialog_text_object = arcade.Text(
-            text,
-            0, 0,  # Временные координаты, обновятся в draw_dialog_box
-            arcade.color.WHITE,
-            20,
-            width=360,
-            multiline=True,
-            align="center",
-            font_name="Comic Sans MS"
-        )
 
-        # Прячем инструкцию во время диалога
-        if self.instruction_text:
-            self.instruction_text.text = ""
+    def show_dialog(self, text, duration=4.0):
+        super().show_dialog(text, duration)
+
+        self.dialog_text_object = self.get_dialog_text(text)
+
+    def get_dialog_text(self, text):
+        if text not in self.dialog_texts:
+            self.dialog_texts[text] = arcade.Text(
+                text,
+                0, 0,  # Временные координаты, обновятся в draw_dialog_box
+                arcade.color.WHITE,
+                20,
+                width=360,
+                multiline=True,
+                align="center",
+                font_name="Comic Sans MS"
+            )
+        return self.dialog_texts[text]
 
     def hide_dialog(self):
-        """Скрывает диалоговое окно и возвращает инструкцию"""
-        self.dialog_box_visible = False
-        self.dialog_text = ""
+        super().hide_dialog()
         self.dialog_text_object = None
 
-        # Возвращаем инструкцию, только если игра активна, не на паузе и не в режиме истории
-        if self.instruction_text and not self.paused and self.game_active and not self.story_active:
-            self.instruction_text.text = "Уклоняйтесь от пуль! ESC - пауза"
+    def show_banner(self, message, duration=None):
+        super().show_banner(message, duration)
+
+        self.hard_mode_text = self.get_banner_text(message)
+
+    def get_banner_text(self, message):
+        if message not in self.banner_texts:
+            self.banner_texts[message] = arcade.Text(
+                message,
+                SCREEN_WIDTH // 2,
+                115,
+                arcade.color.RED,
+                36,
+                anchor_x="center",
+                anchor_y="center",
+                font_name="Arial",
+                bold=True
+            )
+        return self.banner_texts[message]
+
+    def hide_banner(self):
+        super().hide_banner()
+        self.hard_mode_text = None
+
+    def set_instruction_visible(self, visible):
+        if self.instruction_label:
+            self.instruction_label.set(INSTRUCTION_TEXT if visible else "")
+
+    def play_sound(self, name, volume=1.0):
+        sounds = {
+            "shoot": self.shoot_sound,
+            "hit": self.hit_sound,
+            "win": self.win_sound,
+            "lose": self.lose_sound,
+        }
+        sound = sounds.get(name)
+        if self.sound_enabled and sound:
+            self.mixer.play(SOUND_CATEGORIES[name], sound, volume)
+
+    def on_hp_changed(self):
+        self.hp_label.set(f"HP: {self.player_hp}/{self.max_hp}")
+
+    def on_dodge_counted(self):
+        self.stats_label.set(f"Уклонений: {self.bullets_dodged}")
+
+    def on_game_over(self):
+        replay = self.recorder.finish(self.game_stats)
+        if replay:
+            try:
+                replay.save(REPLAY_PATH)
+                print(f"Запись боя сохранена: {REPLAY_PATH} ({len(replay.to_bytes())} байт)")
+            except (OSError, struct.error) as e:
+                # Запись - не повод ронять конец боя
+                print(f"Не удалось сохранить запись боя: {e}")
+        arcade.schedule(self.show_results, 2.0)
 
     def draw_dialog_box(self):
         """Отрисовывает диалоговое окно в стиле поля сердечка, перекрывающее арену"""
@@ -479,97 +431,36 @@ class GameView(arcade.View):
         self.dialog_text_object.y = box_y + box_height // 2 - 15
         self.dialog_text_object.draw()
 
-    def draw_star(self, x, y, size, color):
-        """Рисует звезду как у солнца"""
-        for i in range(5):
-            angle = self.decor_angle + i * 72
-            dx = math.cos(math.radians(angle)) * size * 2
-            dy = math.sin(math.radians(angle)) * size * 2
-            arcade.draw_line(x, y, x + dx, y + dy, color, 2)
-        arcade.draw_circle_filled(x, y, size, color)
-
     def on_draw(self):
+        started = time.perf_counter()
         self.clear()
         self.camera.use()
         arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, BACKGROUND_COLOR)
 
+        # Доля тика, прошедшая после последнего шага симуляции
+        alpha = self.clock.alpha
+
         if self.decor_exists:
-            if self.sun_is_red:
-                sun_color = arcade.color.RED
-            else:
-                sun_color = arcade.color.GOLD
-
-            current_radius = self.decor_radius * self.sun_size_multiplier
-
-            for i in range(5):
-                angle = self.decor_angle + i * 72
-                dx = math.cos(math.radians(angle)) * current_radius * 1.5
-                dy = math.sin(math.radians(angle)) * current_radius * 1.5
-                arcade.draw_line(
-                    self.decor_x, self.decor_y,
-                    self.decor_x + dx, self.decor_y + dy,
-                    sun_color, 3
-                )
-
-            arcade.draw_circle_filled(
-                self.decor_x, self.decor_y,
-                current_radius,
-                sun_color
+            self.sun_sprite.set_variant(
+                self.decor_radius * self.sun_size_multiplier,
+                self.sun_is_red, self.sun_has_eyes, self.sun_is_angry
+            )
+            self.sun_sprite.draw(
+                lerp(self.prev_decor_x, self.decor_x, alpha),
+                lerp(self.prev_decor_y, self.decor_y, alpha),
+                self.decor_angle
             )
 
-            if self.sun_has_eyes:
-                arcade.draw_circle_filled(
-                    self.decor_x - current_radius * 0.4,
-                    self.decor_y + current_radius * 0.3,
-                    current_radius * 0.2,
-                    arcade.color.BLACK
-                )
-                arcade.draw_circle_filled(
-                    self.decor_x + current_radius * 0.4,
-                    self.decor_y + current_radius * 0.3,
-                    current_radius * 0.2,
-                    arcade.color.BLACK
-                )
-                pupil_color = arcade.color.RED if self.sun_is_angry else arcade.color.WHITE
-                arcade.draw_circle_filled(
-                    self.decor_x - current_radius * 0.4,
-                    self.decor_y + current_radius * 0.3,
-                    current_radius * 0.1,
-                    pupil_color
-                )
-                arcade.draw_circle_filled(
-                    self.decor_x + current_radius * 0.4,
-                    self.decor_y + current_radius * 0.3,
-                    current_radius * 0.1,
-                    pupil_color
-                )
-
-        # Отрисовка палочек с звездочками
-        for stick in self.sticks:
-            stick_width = self.heart_size * 0.6
-
-            if stick["type"] == "top":
-                arcade.draw_lrbt_rectangle_filled(
-                    stick["x"] - stick_width / 2,
-                    stick["x"] + stick_width / 2,
-                    self.arena_top - stick["height"],
-                    self.arena_top,
-                    arcade.color.WHITE
-                )
-                self.draw_star(stick["x"], self.arena_top - stick["height"], 6, arcade.color.RED)
-
-            elif stick["type"] == "bottom":
-                arcade.draw_lrbt_rectangle_filled(
-                    stick["x"] - stick_width / 2,
-                    stick["x"] + stick_width / 2,
-                    self.arena_bottom,
-                    self.arena_bottom + stick["height"],
-                    arcade.color.WHITE
-                )
-                self.draw_star(stick["x"], self.arena_bottom + stick["height"], 6, arcade.color.RED)
+        # Палочки со звездочками - одним буфером на видеокарте
+        # Палки считаются от времени, поэтому интерполируем само время
+        stick_time = self.stick_timer - (1 - alpha) * self.clock.dt
+        self.stick_mesh.draw(
+            stick_time, self.arena_bottom, self.arena_top, self.decor_angle,
+            arcade.color.WHITE, arcade.color.RED
+        )
 
         # ЧЕРНЫЕ ПРЯМОУГОЛЬНИКИ (только во время летящих палочек)
-        if self.phase_3_active and self.phase_3_step == 5:
+        if self.sticks_active:
             arcade.draw_lrbt_rectangle_filled(
                 0, self.arena_left,
                 0, SCREEN_HEIGHT,
@@ -587,15 +478,15 @@ class GameView(arcade.View):
             SQUARE_COLOR, 3
         )
 
-        for bullet in self.bullets:
-            arcade.draw_circle_filled(bullet["x"], bullet["y"], self.bullet_radius, arcade.color.YELLOW)
-            arcade.draw_circle_outline(bullet["x"], bullet["y"], self.bullet_radius, arcade.color.ORANGE, 3)
+        bullet_xs, bullet_ys = self.bullets.interpolated(alpha)
+        self.bullet_batch.update(bullet_xs, bullet_ys)
+        self.bullet_batch.draw()
 
-        draw_x = self.heart_x
-        draw_y = self.heart_y
-        if self.shake_timer > 0:
-            draw_x += random.randint(-self.shake_amount, self.shake_amount)
-            draw_y += random.randint(-self.shake_amount, self.shake_amount)
+        draw_x = lerp(self.prev_heart_x, self.heart_x, alpha)
+        draw_y = lerp(self.prev_heart_y, self.heart_y, alpha)
+        if self.shake_amount > 0:
+            draw_x += self.shake_rng.randint(-self.shake_amount, self.shake_amount)
+            draw_y += self.shake_rng.randint(-self.shake_amount, self.shake_amount)
 
         if self.heart_texture2 and self.phase_3_texture_changed:
             pulse_progress = (math.sin(self.heart_pulse) + 1) / 2
@@ -635,54 +526,21 @@ class GameView(arcade.View):
             arcade.draw_circle_filled(draw_x, draw_y, radius, arcade.color.RED)
             arcade.draw_circle_outline(draw_x, draw_y, radius, arcade.color.WHITE, 1)
 
-        for p in self.particles:
-            alpha = int(255 * (p["lifetime"] / p["max_lifetime"]))
-            color_with_alpha = (p["color"][0], p["color"][1], p["color"][2], alpha)
-            arcade.draw_circle_filled(p["x"], p["y"], p["size"], color_with_alpha)
-
-        hp_bar_y = self.arena_bottom - 40
-        hp_bar_width = 400
-        hp_bar_height = 20
-        hp_bar_x = SCREEN_WIDTH // 2 - hp_bar_width // 2
-
-        arcade.draw_lrbt_rectangle_filled(
-            hp_bar_x, hp_bar_x + hp_bar_width,
-            hp_bar_y, hp_bar_y + hp_bar_height,
-            (60, 60, 60)
-        )
-
-        hp_percentage = self.player_hp / self.max_hp
-        hp_fill_width = hp_bar_width * hp_percentage
-
-        if hp_percentage > 0.6:
-            hp_color = arcade.color.GREEN
-        elif hp_percentage > 0.3:
-            hp_color = arcade.color.YELLOW
-        else:
-            hp_color = arcade.color.RED
-
-        arcade.draw_lrbt_rectangle_filled(
-            hp_bar_x, hp_bar_x + hp_fill_width,
-            hp_bar_y, hp_bar_y + hp_bar_height,
-            hp_color
-        )
-
-        arcade.draw_lrbt_rectangle_outline(
-            hp_bar_x, hp_bar_x + hp_bar_width,
-            hp_bar_y, hp_bar_y + hp_bar_height,
-            arcade.color.WHITE, 2
-        )
-
-        arcade.draw_lrbt_rectangle_filled(
-            SCREEN_WIDTH - 150, SCREEN_WIDTH - 20,
-            20, 60,
-            (0, 0, 0, 150)
-        )
+        # Все частицы - одним вызовом отрисовки из пула
+        self.particle_batch.update(*self.particles.visible())
+        self.particle_batch.draw()
 
+        # Интерфейс рисуется в экранных координатах, мимо зума камеры
+        self.window.default_camera.use()
+        self.hud.update(self.player_hp, self.max_hp, self.arena_bottom)
+        self.hud.draw()
+        self.texts.flush()
         self.batch.draw()
+        self.camera.use()
+
         self.draw_dialog_box()
 
-        if self.hard_mode_message and self.hard_mode_message_timer > 0 and self.hard_mode_text:
+        if self.hard_mode_message and self.hard_mode_text:
             self.hard_mode_text.draw()
 
         if self.paused:
@@ -694,6 +552,11 @@ class GameView(arcade.View):
             self.pause_batch.draw()
             self.camera.use()
 
+        if self.update_work is not None:
+            frame_work = self.update_work + time.perf_counter() - started
+            self.frame_budget.record(frame_work, self.clock.time - self.start_time)
+            self.update_work = None
+
     def update_camera(self, delta_time):
         if not self.camera:
             return
@@ -724,750 +587,42 @@ class GameView(arcade.View):
         new_y = current_y + (target_y - current_y) * smooth_speed * delta_time
         self.camera.position = (new_x, new_y)
 
-    def update_sun_movement(self, delta_time):
-        if self.sun_target_x is None or self.sun_target_y is None:
-            return
-
-        self.camera_target_sun = True
-
-        dx = self.sun_target_x - self.decor_x
-        dy = self.sun_target_y - self.decor_y
-        distance = math.sqrt(dx * dx + dy * dy)
-
-        if distance > 5:
-            if distance > 0:
-                dx /= distance
-                dy /= distance
-            self.decor_x += dx * self.sun_move_speed * delta_time
-            self.decor_y += dy * self.sun_move_speed * delta_time
-        else:
-            self.decor_x = self.sun_target_x
-            self.decor_y = self.sun_target_y
-            self.sun_at_center = True
-            self.sun_target_x = None
-            self.sun_target_y = None
-
-    def update_story(self, delta_time):
-        self.story_timer += delta_time
-
-        if self.story_step == 1:
-            if self.sun_at_center:
-                self.sun_has_eyes = True
-                self.show_dialog("Пора повеселиться!", 4.0)  # 4 секунды
-                self.story_step = 2
-                self.story_timer = 0
-                self.camera_zoom_target = 1.8
-        elif self.story_step == 2:
-            if self.story_timer >= 4.0:  # 4 секунды
-                self.show_dialog("Может я не так силён, но...", 4.0)  # 4 секунды
-                self.story_step = 3
-                self.story_timer = 0
-                self.camera_zoom_target = 2.0
-        elif self.story_step == 3:
-            if self.story_timer >= 4.0:  # 4 секунды
-                self.sun_is_angry = True
-                self.sun_is_red = True
-                self.sun_size_multiplier = 1.8
-                self.show_dialog("Я постараюсь >:)", 4.0)  # 4 секунды
-                self.story_step = 4
-                self.story_timer = 0
-        elif self.story_step == 4:
-            if self.story_timer >= 4.0:  # 4 секунды
-                self.hide_dialog()
-                self.hard_mode = True
-                self.hard_mode_timer = 0
-                self.hard_mode_message = "ТЕБЕ КОНЕЦ, МЕЛОЧЬ!"
-                self.hard_mode_message_timer = 3.0
-
-                # Создаем Text объект для сообщения хард мода
-                self.hard_mode_text = arcade.Text(
-                    self.hard_mode_message,
-                    SCREEN_WIDTH // 2,
-                    115,
-                    arcade.color.RED,
-                    36,
-                    anchor_x="center",
-                    anchor_y="center",
-                    font_name="Arial",
-                    bold=True
-                )
-
-                self.story_step = 5
-                self.camera_zoom_target = 1.0
-                self.control_locked = False
-                self.camera_target_sun = False
-        elif self.story_step == 5:
-            self.story_active = False
-
-    def update_hard_mode(self, delta_time):
-        self.hard_mode_timer += delta_time
-
-        if not self.sun_exhausted and self.hard_mode_timer >= self.sun_exhaust_time:
-            self.sun_exhausted = True
-            self.sun_exhaust_timer = 0
-            self.phase_3_wait_for_bullets = True
-            self.hard_mode_message = ""
-            self.hard_mode_text = None
-
-        if self.phase_3_wait_for_bullets and len(self.bullets) == 0:
-            self.start_phase_3()
-
-        if self.sun_exhausted:
-            self.sun_exhaust_timer += delta_time
-
-        if self.hard_mode_message_timer > 0:
-            self.hard_mode_message_timer -= delta_time
-            if self.hard_mode_message_timer <= 0:
-                self.hard_mode_text = None
-                self.hard_mode_message = ""
-
-        if not self.sun_exhausted and self.hard_mode_timer >= 3.0:
-            self.bullet_timer += delta_time
-            if self.bullet_timer >= 0.4:
-                self.create_bullet()
-                if random.random() < 0.3:
-                    self.create_bullet()
-                self.bullet_timer = 0
-                self.total_bullets += 1
-
-    def start_phase_3(self):
-        """Запуск третьей фазы"""
-        self.phase_3_active = True
-        self.phase_3_timer = 0
-        self.phase_3_step = 1
-        self.phase_3_wait_for_bullets = False
-        self.phase_3_step7_message_shown = False  # Сбрасываем флаг сообщения
-
-        # Прибавляем 0.5 * максимального хп
-        self.player_hp = min(self.max_hp, self.player_hp + int(self.max_hp * 0.5))
-        self.hp_text.text = f"HP: {self.player_hp}/{self.max_hp}"
-
-        # Выводим красным текстом "А теперь.."
-        self.hard_mode_message = "А теперь.."
-        self.hard_mode_message_timer = 2.0
-        self.hard_mode_text = arcade.Text(
-            self.hard_mode_message,
-            SCREEN_WIDTH // 2,
-            115,
-            arcade.color.RED,
-            36,
-            anchor_x="center",
-            anchor_y="center",
-            font_name="Arial",
-            bold=True
-        )
-
-        # Сохраняем оригинальную позицию солнца
-        self.sun_original_y = self.decor_y
-        self.sun_pre_attack_y = self.decor_y + 30
-
-        # Используем обычную скорость солнца
-        self.sun_move_speed = 200
-
-        # Первый рывок - поднимается выше
-        self.sun_target_x = self.decor_x
-        self.sun_target_y = self.sun_pre_attack_y
-        self.camera_target_sun = True
-        self.sun_first_move_done = False
-
-    def update_phase_3(self, delta_time):
-        """Обновление третьей фазы"""
-        self.phase_3_timer += delta_time
-
-        if self.shake_timer > 0:
-            self.shake_timer -= delta_time
-            if self.shake_timer <= 0:
-                self.shake_amount = 0
-
-        # Шаг 1: Солнце поднимается выше
-        if self.phase_3_step == 1:
-            if abs(self.decor_y - self.sun_pre_attack_y) < 5 and self.sun_target_y is not None:
-                self.phase_3_step = 2
-                # Резкий рывок в самый низ
-                self.sun_target_x = self.decor_x
-                self.sun_target_y = self.arena_top - 20
-                self.sun_move_speed = 400
-        # Шаг 2: Солнце резко вниз
-        elif self.phase_3_step == 2:
-            if abs(self.decor_y - self.sun_target_y) < 5 and self.sun_target_y is not None:
-                # В этот момент меняем текстуру и включаем гравитацию
-                if not self.phase_3_texture_changed:
-                    self.phase_3_texture_changed = True
-                    self.gravity_enabled = True
-                    self.gravity_direction = "down"
-                    self.heart_velocity_y = -300
-                    # Прижимаем к полу
-                    visual_height = self.heart_size * 1.8
-                    self.heart_y = self.arena_bottom + visual_height / 2
-                    # Эффект удара об пол
-                    self.shake_timer = 0.5
-                    self.shake_amount = 12
-                    self.phase_3_heart_grounded = True
-
-                self.phase_3_step = 3
-                # Возвращаем солнце на место
-                self.sun_target_x = self.decor_x
-                self.sun_target_y = self.sun_original_y
-                self.sun_move_speed = 200
-        # Шаг 3: Солнце возвращается обратно
-        elif self.phase_3_step == 3:
-            if abs(self.decor_y - self.sun_original_y) < 5 and self.sun_target_y is not None:
-                self.phase_3_step = 4
-                # Солнце делает рывок вправо
-                self.sun_target_x = self.decor_x + 100
-                self.sun_target_y = self.decor_y
-                self.sun_move_speed = 300
-        # Шаг 4: Солнце движется вправо
-        elif self.phase_3_step == 4:
-            if abs(self.decor_x - self.sun_target_x) < 5 and self.sun_target_x is not None:
-                self.phase_3_step = 5
-                # Меняем гравитацию на право
-                self.gravity_direction = "right"
-                self.heart_velocity_x = 200
-                self.heart_velocity_y = 0
-                self.camera_follow_heart = True
-                # Скрываем надпись "А теперь.." в середине третьей фазы
-                self.hard_mode_message = ""
-                self.hard_mode_text = None
-                # Сбрасываем позицию палок
-                self.sticks = []
-                self.stick_spawn_counter = 0
-                self.stick_x_offset = 0
-                self.phase_3_timer = 0
-                self.sun_move_speed = 200
-        # Шаг 5: Основная фаза - палки двигаются влево
-        elif self.phase_3_step == 5:
-            # Двигаем палки влево с увеличенной скоростью
-            for stick in self.sticks:
-                stick["x"] -= self.arena_wall_move_speed * delta_time
-
-            # Удаляем палки за левой границей
-            self.sticks = [stick for stick in self.sticks if stick["x"] > self.arena_left - 50]
-
-            # Спавн новых палок
-            self.stick_spawn_counter += 1
-            if self.stick_spawn_counter >= self.stick_spawn_interval:
-                self.stick_spawn_counter = 0
-                self.stick_x_offset += 3.0  # 3 пикселя между палками
-
-                # Создаем новую пару палок
-                self.add_stick_pair(self.arena_right + self.stick_x_offset)
-
-            # Проверяем столкновения
-            self.check_stick_collisions()
-
-            # Сердце всегда по середине по горизонтали
-            visual_width = self.heart_size * 1.8
-            self.heart_x = self.arena_left + (self.arena_right - self.arena_left) / 2
-
-            # Завершаем фазу палок
-            if self.phase_3_timer >= self.phase_3_duration:
-                # Полностью останавливаем движение палок
-                self.sticks = []
-
-                # Возвращаем нормальное движение сердца (отключаем гравитацию)
-                self.gravity_enabled = False
-                self.heart_velocity_x = 0
-                self.heart_velocity_y = 0
-
-                # Меняем картинку сердца на первую
-                self.phase_3_texture_changed = False
-
-                # Солнце делает рывок вверх (как в начале третьей фазы)
-                self.sun_target_x = self.decor_x
-                self.sun_target_y = self.sun_pre_attack_y  # рывок вверх
-                self.sun_move_speed = 400
-                self.camera_target_sun = True
-
-                self.phase_3_timer = 0
-                self.phase_3_step = 6
-
-        # Шаг 6: Возвращаем солнце обратно
-        elif self.phase_3_step == 6:
-            if abs(self.decor_y - self.sun_pre_attack_y) < 5:
-                self.sun_target_x = SCREEN_WIDTH // 2
-                self.sun_target_y = SCREEN_HEIGHT - 150
-                self.sun_move_speed = 200
-                self.camera_target_sun = False
-
-                # Переходим к повтору второй фазы (пули), но остаёмся в phase_3
-                self.phase_3_step = 7
-                self.phase_3_timer = 0
-                self.bullet_spawn_rate = 0.4
-                self.bullets = []
-                self.phase_3_step7_message_shown = False  # Сбрасываем флаг для сообщения "я устал"
-
-        # Шаг 7: Повтор второй фазы (пули) - четвертая фаза 30 секунд
-        elif self.phase_3_step == 7:
-            self.phase_3_timer += delta_time
-
-            # Показываем "я устал" на 20-й секунде
-            if self.phase_3_timer >= 20.0 and not self.phase_3_step7_message_shown:
-                self.phase_3_step7_message_shown = True
-                self.hard_mode_message = "я устал"
-                self.hard_mode_message_timer = 2.0
-                self.hard_mode_text = arcade.Text(
-                    self.hard_mode_message,
-                    SCREEN_WIDTH // 2,
-                    115,
-                    arcade.color.RED,
-                    36,
-                    anchor_x="center",
-                    anchor_y="center",
-                    font_name="Arial",
-                    bold=True
-                )
-
-            # Стрельба пулями как во второй фазе
-            self.bullet_timer += delta_time
-            if self.bullet_timer >= self.bullet_spawn_rate:
-                self.create_bullet()
-                if random.random() < 0.3:
-                    self.create_bullet()
-                self.bullet_timer = 0
-                self.total_bullets += 1
-
-            # Проверка урона от пуль
-            current_time = time.time()
-            collision_detected = False
-
-            for bullet in self.bullets:
-                distance = math.sqrt((bullet["x"] - self.heart_x) ** 2 + (bullet["y"] - self.heart_y) ** 2)
-                current_heart_radius = self.heart_size * self.heart_pulse_max
-                if distance < current_heart_radius + self.bullet_radius:
-                    collision_detected = True
-                    break
-
-            if collision_detected:
-                if current_time - self.last_damage_time >= self.damage_interval:
-                    self.player_hp -= 1
-                    self.last_damage_time = current_time
-                    self.hp_text.text = f"HP: {self.player_hp}/{self.max_hp}"
-
-                    if self.sound_enabled and self.hit_sound:
-                        arcade.play_sound(self.hit_sound, volume=0.25)
-
-                    self.create_hit_particles(self.heart_x, self.heart_y)
-
-                    if self.player_hp <= 0:
-                        self.player_hp = 0
-                        self.game_active = False
-                        self.victory = False
-                        self.end_game()
-                        return
-
-            # Завершаем фазу пуль через 30 секунд
-            if self.phase_3_timer >= self.phase_3_step7_duration:
-                # Очищаем пули и переходим к следующему шагу
-                self.bullets = []
-                self.phase_3_step = 8
-                self.phase_3_timer = 0
-
-                # Если дошли до конца – победа
-                self.victory = True
-                self.game_active = False
-                self.end_game()
-
-        # Обработка гравитации
-        if self.gravity_enabled and self.game_active and not self.paused:
-            if self.gravity_direction == "down":
-                visual_height = self.heart_size * 1.8
-                bottom_boundary = self.arena_bottom + visual_height / 2
-                top_boundary = self.arena_top - visual_height / 2
-
-                # Проверка: на полу ли сердце (с небольшим допуском)
-                on_ground = abs(self.heart_y - bottom_boundary) < 2
-
-                # Если на полу - снимаем блокировку прыжка
-                if on_ground:
-                    self.jump_lock = False
-
-                # Прыжок: только если на полу, нет блокировки и нажата вверх
-                if on_ground and not self.jump_lock and (
-                        arcade.key.UP in self.keys_pressed or arcade.key.W in self.keys_pressed):
-                    self.heart_velocity_y = 150
-                    # Важно: не добавляем импульс повторно, пока держим кнопку
-
-                # Гравитация всегда действует вниз
-                self.heart_velocity_y -= self.gravity_strength * delta_time
-                self.heart_y += self.heart_velocity_y * delta_time
-
-                # Границы арены
-                if self.heart_y < bottom_boundary:
-                    self.heart_y = bottom_boundary
-                    self.heart_velocity_y = 0
-                if self.heart_y > top_boundary:
-                    self.heart_y = top_boundary
-                    self.heart_velocity_y = 0
-
-            elif self.gravity_direction == "right":
-                # Гравитация вправо
-                self.heart_velocity_x += self.gravity_strength * delta_time
-                self.heart_x += self.heart_velocity_x * delta_time
-
-                # Ограничиваем по границам
-                visual_width = self.heart_size * 1.8
-                right_boundary = self.arena_right - visual_width / 2
-                if self.heart_x > right_boundary:
-                    self.heart_x = right_boundary
-                    self.heart_velocity_x = 0
-
-                left_boundary = self.arena_left + visual_width / 2
-                if self.heart_x < left_boundary:
-                    self.heart_x = left_boundary
-                    self.heart_velocity_x = 0
-
-    def add_stick_pair(self, x):
-        """Добавляет пару палок с пустым пространством 35% и медленной волной от 5% до 95%"""
-        stick_width = self.heart_size * 0.6
-        arena_height = self.arena_top - self.arena_bottom
-
-        # МЕДЛЕННАЯ ВОЛНА - используем wave_speed
-        # Пустое пространство движется от 5% до 95% высоты арены
-        wave_pos = 0.5 + 0.45 * math.sin(self.phase_3_timer * self.wave_speed)
-
-        # УВЕЛИЧЕННОЕ ПУСТОЕ ПРОСТРАНСТВО - 35% от высоты арены
-        empty_height = arena_height * 0.35
-
-        # Центр пустого пространства
-        empty_center_y = self.arena_bottom + arena_height * wave_pos
-
-        # Верхняя граница пустого пространства
-        empty_top = empty_center_y + empty_height / 2
-        # Нижняя граница пустого пространства
-        empty_bottom = empty_center_y - empty_height / 2
-
-        # Верхняя палочка - от верха арены до верхней границы пустого пространства
-        top_height = self.arena_top - empty_top
-        if top_height > 5:  # Минимальная высота
-            self.sticks.append({
-                "x": x,
-                "type": "top",
-                "height": top_height,
-                "width": stick_width,
-                "active": True,
-                "last_hit": 0  # ИСПРАВЛЕНИЕ: Храним время удара внутри палки
-            })
-
-        # Нижняя палочка - от нижней границы пустого пространства до низа арены
-        bottom_height = empty_bottom - self.arena_bottom
-        if bottom_height > 5:  # Минимальная высота
-            self.sticks.append({
-                "x": x,
-                "type": "bottom",
-                "height": bottom_height,
-                "width": stick_width,
-                "active": True,
-                "last_hit": 0  # ИСПРАВЛЕНИЕ: Храним время удара внутри палки
-            })
-
-    def check_stick_collisions(self):
-        """Проверка столкновений с палочками (Исправленная версия)"""
-        current_time = time.time()
-        heart_radius = self.heart_size * self.heart_pulse_max
-
-        for stick in self.sticks:
-            if not stick["active"]:
-                continue
-
-            collision = False
-
-            if stick["type"] == "top":
-                if (abs(self.heart_x - stick["x"]) < (heart_radius + stick["width"] / 2) and
-                        self.heart_y + heart_radius > self.arena_top - stick["height"]):
-                    collision = True
-
-            elif stick["type"] == "bottom":
-                if (abs(self.heart_x - stick["x"]) < (heart_radius + stick["width"] / 2) and
-                        self.heart_y - heart_radius < self.arena_bottom + stick["height"]):
-                    collision = True
-
-            if collision:
-                # Проверяем кулдаун внутри самой палки
-                if current_time - stick.get("last_hit", 0) >= self.damage_interval:
-                    self.player_hp -= 1
-                    self.hp_text.text = f"HP: {self.player_hp}/{self.max_hp}"
-
-                    # Обновляем время удара для ЭТОЙ конкретной палки
-                    stick["last_hit"] = current_time
-
-                    if self.sound_enabled and self.hit_sound:
-                        arcade.play_sound(self.hit_sound, volume=0.25)
-
-                    self.create_hit_particles(self.heart_x, self.heart_y)
-
-                    if self.player_hp <= 0:
-                        self.player_hp = 0
-                        self.game_active = False
-                        self.victory = False
-                        self.end_game()
-                        return
-
     def on_update(self, delta_time):
         if not self.game_active or self.paused:
             return
+        started = time.perf_counter()
 
-        self.update_camera(delta_time)
-        self.heart_pulse += delta_time * self.heart_pulse_speed
-        self.decor_angle += delta_time * 45
-
-        # Обновление таймера диалога
-        if self.dialog_box_visible:
-            self.dialog_timer += delta_time
-            if self.dialog_timer >= self.dialog_duration:
-                self.hide_dialog()
+        # Симуляция идёт только целыми тиками фиксированной длины
+        for _ in range(self.clock.advance(delta_time)):
+            keys = self.input_source(self)
+            self.recorder.record(keys)
+            self.apply_input(keys)
+            self.step()
+            if not self.game_active:
+                break
 
         if self.heart_sprite:
             self.heart_sprite.center_x = self.heart_x
             self.heart_sprite.center_y = self.heart_y
 
-        particles_to_remove = []
-        for i, p in enumerate(self.particles):
-            p["x"] += p["dx"]
-            p["y"] += p["dy"]
-            p["lifetime"] -= delta_time
-            p["dy"] -= 0.1
-            if p["lifetime"] <= 0:
-                particles_to_remove.append(i)
-        for i in sorted(particles_to_remove, reverse=True):
-            self.particles.pop(i)
-
-        current_time = time.time()
-
-        if self.start_time:
-            elapsed = current_time - self.start_time
-            self.timer_text.text = f"{elapsed:.1f} сек"
-
-        # Первая фаза - 15 секунд
-        if not self.first_wave_complete:
-            self.first_phase_timer += delta_time
-            self.bullet_timer += delta_time
-            if self.bullet_timer >= self.bullet_spawn_rate:
-                self.create_bullet()
-                self.bullet_timer = 0
-                self.total_bullets += 1
-
-            if self.first_phase_timer >= self.first_phase_duration:
-                self.first_wave_complete = True
-                self.story_active = True
-                self.story_step = 1
-                self.story_timer = 0
-                self.sun_target_x = SCREEN_WIDTH // 2
-                self.sun_target_y = SCREEN_HEIGHT - 100
-                self.sun_move_speed = 200
-                if self.instruction_text:
-                    self.instruction_text.text = ""
-
-        if self.story_active:
-            self.update_story(delta_time)
-
-        self.update_sun_movement(delta_time)
-
-        if self.phase_3_active:
-            self.update_phase_3(delta_time)
-        elif self.hard_mode:
-            self.update_hard_mode(delta_time)
-
-        # Движение с клавиатуры
-        speed = self.heart_speed * delta_time
-
-        visual_width = self.heart_size * 1.8
-        visual_height = self.heart_size * 1.8
-
-        left_boundary = self.arena_left + visual_width / 2
-        right_boundary = self.arena_right - visual_width / 2
-        bottom_boundary = self.arena_bottom + visual_height / 2
-        top_boundary = self.arena_top - visual_height / 2
-
-        if self.gravity_direction == "right" and self.phase_3_step == 5:
-            # В режиме гравитации вправо - движение вверх/вниз клавишами ВЛЕВО/ВПРАВО (наоборот)
-            if arcade.key.LEFT in self.keys_pressed or arcade.key.A in self.keys_pressed:
-                self.heart_y = max(bottom_boundary, self.heart_y - speed)  # ВЛЕВО = ВНИЗ
-                self.heart_velocity_y = 0
-            if arcade.key.RIGHT in self.keys_pressed or arcade.key.D in self.keys_pressed:
-                self.heart_y = min(top_boundary, self.heart_y + speed)  # ВПРАВО = ВВЕРХ
-                self.heart_velocity_y = 0
-            # Горизонтальное движение заблокировано полностью
-            self.heart_velocity_x = 0
-        elif self.phase_3_step == 6:
-            # В режиме прыжков - движение влево/вправо
-            if arcade.key.LEFT in self.keys_pressed or arcade.key.A in self.keys_pressed:
-                self.heart_x = max(left_boundary, self.heart_x - speed)
-            if arcade.key.RIGHT in self.keys_pressed or arcade.key.D in self.keys_pressed:
-                self.heart_x = min(right_boundary, self.heart_x + speed)
-            # Прыжок клавишей ВВЕРХ - зарядка прыжка
-            if arcade.key.UP in self.keys_pressed or arcade.key.W in self.keys_pressed:
-                if self.heart_y <= bottom_boundary + 1:
-                    self.jump_time += delta_time
-                    if self.jump_time > self.max_jump_time:
-                        self.jump_time = self.max_jump_time
-            else:
-                if self.jump_time > 0 and self.heart_y <= bottom_boundary + 1:
-                    # Совершаем прыжок при отпускании
-                    jump_power = (self.jump_time / self.max_jump_time) * 700
-                    self.heart_velocity_y = jump_power
-                    self.jump_time = 0
-        else:
-            # Обычный режим
-            if arcade.key.LEFT in self.keys_pressed or arcade.key.A in self.keys_pressed:
-                self.heart_x = max(left_boundary, self.heart_x - speed)
-            if arcade.key.RIGHT in self.keys_pressed or arcade.key.D in self.keys_pressed:
-                self.heart_x = min(right_boundary, self.heart_x + speed)
-            if arcade.key.UP in self.keys_pressed or arcade.key.W in self.keys_pressed:
-                self.heart_y = min(top_boundary, self.heart_y + speed)
-            if arcade.key.DOWN in self.keys_pressed or arcade.key.S in self.keys_pressed:
-                self.heart_y = max(bottom_boundary, self.heart_y - speed)
-
-        # ХИТБОКС В ЦЕНТРЕ
-        if not self.phase_3_active:
-            collision_detected = False
-
-            for bullet in self.bullets:
-                distance = math.sqrt((bullet["x"] - self.heart_x) ** 2 + (bullet["y"] - self.heart_y) ** 2)
-                current_heart_radius = self.heart_size * self.heart_pulse_max
-                if distance < current_heart_radius + self.bullet_radius:
-                    collision_detected = True
-                    break
-
-            if collision_detected:
-                if current_time - self.last_damage_time >= self.damage_interval:
-                    self.player_hp -= 1
-                    self.last_damage_time = current_time
-                    self.hp_text.text = f"HP: {self.player_hp}/{self.max_hp}"
-
-                    if self.sound_enabled and self.hit_sound:
-                        arcade.play_sound(self.hit_sound, volume=0.25)
-
-                    self.create_hit_particles(self.heart_x, self.heart_y)
-
-                    if self.player_hp <= 0:
-                        self.player_hp = 0
-                        self.game_active = False
-                        self.victory = False
-                        self.end_game()
-                        return
-
-        bullets_to_remove = []
-        for i, bullet in enumerate(self.bullets):
-            bullet["x"] += bullet["dx"] * bullet["speed"] * delta_time
-            bullet["y"] += bullet["dy"] * bullet["speed"] * delta_time
-
-            if (bullet["x"] < -100 or bullet["x"] > SCREEN_WIDTH + 100 or
-                    bullet["y"] < -100 or bullet["y"] > SCREEN_HEIGHT + 100):
-                bullets_to_remove.append(i)
-                self.bullets_dodged += 1
-                self.stats_text.text = f"Уклонений: {self.bullets_dodged}"
-
-        for i in sorted(bullets_to_remove, reverse=True):
-            self.bullets.pop(i)
-
-    def create_hit_particles(self, x, y):
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-            size = random.uniform(3, 8)
-            lifetime = random.uniform(0.5, 1.5)
-            color = random.choice(self.particle_colors)
-
-            self.particles.append({
-                "x": x,
-                "y": y,
-                "dx": dx,
-                "dy": dy,
-                "size": size,
-                "lifetime": lifetime,
-                "max_lifetime": lifetime,
-                "color": color
-            })
-
-    def create_bullet(self):
-        side = random.randint(0, 3)
-
-        if side == 0:
-            start_x = random.randint(50, SCREEN_WIDTH - 50)
-            start_y = SCREEN_HEIGHT + 50
-        elif side == 1:
-            start_x = SCREEN_WIDTH + 50
-            start_y = random.randint(50, SCREEN_HEIGHT - 50)
-        elif side == 2:
-            start_x = random.randint(50, SCREEN_WIDTH - 50)
-            start_y = -50
-        else:
-            start_x = -50
-            start_y = random.randint(50, SCREEN_HEIGHT - 50)
-
-        target_x = random.randint(
-            int(self.arena_left + 30),
-            int(self.arena_right - 30)
-        )
-        target_y = random.randint(
-            int(self.arena_bottom + 30),
-            int(self.arena_top - 30)
-        )
-
-        dx = target_x - start_x
-        dy = target_y - start_y
-        length = math.sqrt(dx * dx + dy * dy)
-
-        if length > 0:
-            dx /= length
-            dy /= length
-
-        dx += random.uniform(-0.15, 0.15)
-        dy += random.uniform(-0.15, 0.15)
-
-        length = math.sqrt(dx * dx + dy * dy)
-        if length > 0:
-            dx /= length
-            dy /= length
-
-        self.bullets.append({
-            "x": start_x,
-            "y": start_y,
-            "dx": dx,
-            "dy": dy,
-            "speed": random.uniform(180, 220)
-        })
-
-        if self.sound_enabled and self.shoot_sound:
-            arcade.play_sound(self.shoot_sound, volume=0.3)
-
-    def end_game(self):
-        elapsed = time.time() - self.start_time if self.start_time else 0
-
-        self.game_stats = {
-            "victory": self.victory,
-            "time_survived": elapsed,
-            "bullets_dodged": self.bullets_dodged,
-            "total_bullets": self.total_bullets,
-            "hp_remaining": self.player_hp,
-            "sun_exhausted": self.sun_exhausted
-        }
-
-        if self.sound_enabled:
-            if self.victory and self.win_sound:
-                arcade.play_sound(self.win_sound)
-            elif not self.victory and self.lose_sound:
-                arcade.play_sound(self.lose_sound)
-
-        arcade.schedule(self.show_results, 2.0)
+        self.timer_label.set(f"{self.clock.time - self.start_time:.1f} сек")
+        # В бюджет кадра идёт сама работа, а не delta_time (он включает ожидание vsync)
+        self.update_work = time.perf_counter() - started
 
     def show_results(self, delta_time):
         arcade.unschedule(self.show_results)
-        from data.result_view import ResultView
+        print(self.frame_budget.report())
 
         stats = self.game_stats
-        result_view = ResultView(
+        views = get_views(self.window)
+        views.get("results").set_results(
             elapsed_time=stats["time_survived"],
             victory=stats["victory"],
             bullets_dodged=stats["bullets_dodged"],
             total_bullets=stats["total_bullets"],
             hp_remaining=stats["hp_remaining"]
         )
-        result_view.setup()
-        self.window.show_view(result_view)
+        views.show("results")
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.ESCAPE:
@@ -1475,33 +630,21 @@ class GameView(arcade.View):
             if self.sun_target_x is not None or self.dialog_box_visible:
                 return  # Игнорируем ESC
 
-            if not self.paused:
-                self.paused = True
-                self.pause_start_time = time.time()
-            else:
-                self.paused = False
-                if self.pause_start_time:
-                    pause_duration = time.time() - self.pause_start_time
-                    self.start_time += pause_duration
-                    self.pause_start_time = None
+            # Часы симуляции на паузе не идут, поэтому таймер компенсировать не нужно
+            self.paused = not self.paused
+            if self.paused:
+                # Ввод с паузы не должен ни попасть в запись, ни сработать после неё
+                self.held_keys.clear()
+            return
+
+        if self.paused:
             return
 
-        if not self.paused and self.game_active:
-            if key in [arcade.key.LEFT, arcade.key.A, arcade.key.RIGHT, arcade.key.D,
-                       arcade.key.UP, arcade.key.W, arcade.key.DOWN, arcade.key.S]:
-                self.keys_pressed.add(key)
+        if key in MOVEMENT_KEYS:
+            self.held_keys.add(key)
 
     def on_key_release(self, key, modifiers):
-        if key in [arcade.key.LEFT, arcade.key.A, arcade.key.RIGHT, arcade.key.D,
-                   arcade.key.UP, arcade.key.W, arcade.key.DOWN, arcade.key.S]:
-            self.keys_pressed.discard(key)
-
-        # Если отпустили вверх в воздухе - блокируем прыжки до земли
-        if key in [arcade.key.UP, arcade.key.W]:
-            visual_height = self.heart_size * 1.8
-            bottom_boundary = self.arena_bottom + visual_height / 2
-            if abs(self.heart_y - bottom_boundary) >= 2:  # в воздухе
-                self.jump_lock = True
+        self.held_keys.discard(key)
 
     def on_mouse_motion(self, x, y, dx, dy):
         if self.paused:
@@ -1512,16 +655,6 @@ class GameView(arcade.View):
         if self.paused and button == arcade.MOUSE_BUTTON_LEFT:
             if self.resume_button.check_click(x, y):
                 self.paused = False
-                if self.pause_start_time:
-                    pause_duration = time.time() - self.pause_start_time
-                    self.start_time += pause_duration
-                    self.pause_start_time = None
             elif self.menu_button.check_click(x, y):
                 self.game_active = False
-                if self.pause_start_time:
-                    pause_duration = time.time() - self.pause_start_time
-                    self.start_time += pause_duration
-                from data.main_menu_view import MainMenuView
-                menu_view = MainMenuView()
-                menu_view.setup()
-                self.window.show_view(menu_view)
+                get_views(self.window).show("menu")
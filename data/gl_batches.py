@@ -0,0 +1,570 @@
+import math
+from functools import lru_cache
+import numpy as np
+from PIL import Image, ImageDraw
+from arcade.gl import BufferDescription
+
+# Общий вершинный шейдер: просто передаёт атрибуты точки в геометрический
+CIRCLE_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_position;
+in float in_radius;
+in vec4 in_color;
+
+out vec2 v_position;
+out float v_radius;
+out vec4 v_color;
+
+void main() {
+    v_position = in_position;
+    v_radius = in_radius;
+    v_color = in_color;
+}
+"""
+
+# Из каждой точки строится квадрат 2r x 2r в мировых координатах камеры
+CIRCLE_GEOMETRY_SHADER = """
+#version 330
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 4) out;
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 v_position[];
+in float v_radius[];
+in vec4 v_color[];
+
+out vec2 uv;
+out vec4 color;
+
+void main() {
+    mat4 mvp = window.projection * window.view;
+    vec2 center = v_position[0];
+    float r = v_radius[0];
+
+    uv = vec2(-1.0, 1.0);
+    color = v_color[0];
+    gl_Position = mvp * vec4(center + vec2(-r, r), 0.0, 1.0);
+    EmitVertex();
+
+    uv = vec2(-1.0, -1.0);
+    color = v_color[0];
+    gl_Position = mvp * vec4(center + vec2(-r, -r), 0.0, 1.0);
+    EmitVertex();
+
+    uv = vec2(1.0, 1.0);
+    color = v_color[0];
+    gl_Position = mvp * vec4(center + vec2(r, r), 0.0, 1.0);
+    EmitVertex();
+
+    uv = vec2(1.0, -1.0);
+    color = v_color[0];
+    gl_Position = mvp * vec4(center + vec2(r, -r), 0.0, 1.0);
+    EmitVertex();
+
+    EndPrimitive();
+}
+"""
+
+CIRCLE_FRAGMENT_SHADER = """
+#version 330
+
+in vec2 uv;
+in vec4 color;
+
+out vec4 fragColor;
+
+void main() {
+    if (dot(uv, uv) > 1.0) {
+        discard;
+    }
+    fragColor = color;
+}
+"""
+
+CIRCLE_DTYPE = np.dtype([
+    ("position", np.float32, 2),
+    ("radius", np.float32),
+    ("color", np.uint8, 4),
+])
+
+
+class CircleBatch:
+    """Много залитых кругов разного размера и цвета за один вызов отрисовки"""
+
+    def __init__(self, ctx, capacity=256):
+        self.ctx = ctx
+        self.capacity = capacity
+        self.count = 0
+        self.data = np.zeros(capacity, dtype=CIRCLE_DTYPE)
+        self.program = ctx.program(
+            vertex_shader=CIRCLE_VERTEX_SHADER,
+            geometry_shader=CIRCLE_GEOMETRY_SHADER,
+            fragment_shader=CIRCLE_FRAGMENT_SHADER,
+        )
+        self.buffer = ctx.buffer(reserve=capacity * CIRCLE_DTYPE.itemsize, usage="stream")
+        self.geometry = ctx.geometry(
+            [BufferDescription(self.buffer, "2f 1f 4f1", ["in_position", "in_radius", "in_color"])],
+            mode=ctx.POINTS,
+        )
+
+    def update(self, xs, ys, radii, colors):
+        """Загрузить круги на видеокарту одной записью в буфер"""
+        count = len(xs)
+        self.count = count
+        if count == 0:
+            # Пустой список цветов numpy не разложит по полю (0, 4)
+            return
+        if count > self.capacity:
+            self.capacity = max(count, self.capacity * 2)
+            self.data = np.zeros(self.capacity, dtype=CIRCLE_DTYPE)
+            self.buffer.orphan(size=self.capacity * CIRCLE_DTYPE.itemsize)
+
+        data = self.data[:count]
+        data["position"][:, 0] = xs
+        data["position"][:, 1] = ys
+        data["radius"] = radii
+        data["color"] = colors
+        self.buffer.write(data.tobytes())
+
+    def draw(self):
+        if self.count:
+            self.geometry.render(self.program, vertices=self.count)
+
+
+# Тот же квадрат из точки, но с текстурными координатами 0..1
+SPRITE_GEOMETRY_SHADER = """
+#version 330
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 4) out;
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+uniform float half_size;
+
+in vec2 v_position[];
+
+out vec2 uv;
+
+void main() {
+    mat4 mvp = window.projection * window.view;
+    vec2 center = v_position[0];
+    float r = half_size;
+
+    uv = vec2(0.0, 1.0);
+    gl_Position = mvp * vec4(center + vec2(-r, r), 0.0, 1.0);
+    EmitVertex();
+
+    uv = vec2(0.0, 0.0);
+    gl_Position = mvp * vec4(center + vec2(-r, -r), 0.0, 1.0);
+    EmitVertex();
+
+    uv = vec2(1.0, 1.0);
+    gl_Position = mvp * vec4(center + vec2(r, r), 0.0, 1.0);
+    EmitVertex();
+
+    uv = vec2(1.0, 0.0);
+    gl_Position = mvp * vec4(center + vec2(r, -r), 0.0, 1.0);
+    EmitVertex();
+
+    EndPrimitive();
+}
+"""
+
+SPRITE_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_position;
+
+out vec2 v_position;
+
+void main() {
+    v_position = in_position;
+}
+"""
+
+SPRITE_FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D sprite_texture;
+
+in vec2 uv;
+
+out vec4 fragColor;
+
+void main() {
+    vec4 color = texture(sprite_texture, uv);
+    if (color.a == 0.0) {
+        discard;
+    }
+    fragColor = color;
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def ring_image(radius, fill, outline, outline_width, supersample=4):
+    """Картинка круга с обводкой (как draw_circle_filled + draw_circle_outline).
+
+    Рисуется в увеличенном масштабе и уменьшается, чтобы края были сглажены.
+    Результат кэшируется: одинаковые круги рисуются один раз за процесс.
+    """
+    half = radius + outline_width / 2
+    size = math.ceil(half * 2)
+    big = size * supersample
+    center = big / 2
+    image = Image.new("RGBA", (big, big), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    outer = half * supersample
+    draw.ellipse((center - outer, center - outer, center + outer, center + outer), fill=tuple(outline))
+    inner = (radius - outline_width / 2) * supersample
+    draw.ellipse((center - inner, center - inner, center + inner, center + inner), fill=tuple(fill))
+    return image.resize((size, size), Image.LANCZOS)
+
+
+class SpriteBatch:
+    """Много одинаковых спрайтов с общей текстурой за один вызов отрисовки.
+
+    На видеокарту каждый кадр уходят только центры спрайтов, квадраты
+    строит геометрический шейдер.
+    """
+
+    def __init__(self, ctx, image, half_size, capacity=256):
+        self.ctx = ctx
+        self.capacity = capacity
+        self.count = 0
+        self.data = np.zeros((capacity, 2), dtype=np.float32)
+        self.texture = ctx.texture(image.size, components=4, data=image.tobytes())
+        self.program = ctx.program(
+            vertex_shader=SPRITE_VERTEX_SHADER,
+            geometry_shader=SPRITE_GEOMETRY_SHADER,
+            fragment_shader=SPRITE_FRAGMENT_SHADER,
+        )
+        self.program["half_size"] = half_size
+        self.program["sprite_texture"] = 0
+        self.buffer = ctx.buffer(reserve=capacity * self.data.itemsize * 2, usage="stream")
+        self.geometry = ctx.geometry(
+            [BufferDescription(self.buffer, "2f", ["in_position"])],
+            mode=ctx.POINTS,
+        )
+
+    def update(self, xs, ys):
+        count = len(xs)
+        if count > self.capacity:
+            self.capacity = max(count, self.capacity * 2)
+            self.data = np.zeros((self.capacity, 2), dtype=np.float32)
+            self.buffer.orphan(size=self.capacity * self.data.itemsize * 2)
+
+        data = self.data[:count]
+        data[:, 0] = xs
+        data[:, 1] = ys
+        self.count = count
+        if count:
+            self.buffer.write(data.tobytes())
+
+    def draw(self):
+        if self.count:
+            self.texture.use(0)
+            self.geometry.render(self.program, vertices=self.count)
+
+
+# Пара палок третьей фазы: x считается из времени появления прямо на видеокарте
+STICK_VERTEX_SHADER = """
+#version 330
+
+uniform float time;
+uniform float speed;
+
+in float in_spawn_x;
+in float in_spawn_time;
+in float in_top_height;
+in float in_bottom_height;
+
+out float v_x;
+out float v_top_height;
+out float v_bottom_height;
+
+void main() {
+    v_x = in_spawn_x - speed * (time - in_spawn_time);
+    v_top_height = in_top_height;
+    v_bottom_height = in_bottom_height;
+}
+"""
+
+# Из каждой пары строятся до четырёх квадратов в порядке старой отрисовки:
+# верхняя палка, её звёздочка, нижняя палка, её звёздочка
+STICK_GEOMETRY_SHADER = """
+#version 330
+
+layout (points) in;
+layout (triangle_strip, max_vertices = 16) out;
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+uniform float arena_top;
+uniform float arena_bottom;
+uniform float half_width;
+uniform float star_reach;
+
+in float v_x[];
+in float v_top_height[];
+in float v_bottom_height[];
+
+out vec2 local;
+flat out int is_star;
+
+void quad(vec2 lb, vec2 rt, vec2 origin, int star) {
+    mat4 mvp = window.projection * window.view;
+    is_star = star;
+    local = vec2(lb.x, rt.y) - origin;
+    gl_Position = mvp * vec4(lb.x, rt.y, 0.0, 1.0);
+    EmitVertex();
+    is_star = star;
+    local = lb - origin;
+    gl_Position = mvp * vec4(lb, 0.0, 1.0);
+    EmitVertex();
+    is_star = star;
+    local = rt - origin;
+    gl_Position = mvp * vec4(rt, 0.0, 1.0);
+    EmitVertex();
+    is_star = star;
+    local = vec2(rt.x, lb.y) - origin;
+    gl_Position = mvp * vec4(rt.x, lb.y, 0.0, 1.0);
+    EmitVertex();
+    EndPrimitive();
+}
+
+void star(vec2 center) {
+    quad(center - vec2(star_reach), center + vec2(star_reach), center, 1);
+}
+
+void main() {
+    float x = v_x[0];
+
+    if (v_top_height[0] > 0.0) {
+        float y = arena_top - v_top_height[0];
+        quad(vec2(x - half_width, y), vec2(x + half_width, arena_top), vec2(0.0), 0);
+        star(vec2(x, y));
+    }
+
+    if (v_bottom_height[0] > 0.0) {
+        float y = arena_bottom + v_bottom_height[0];
+        quad(vec2(x - half_width, arena_bottom), vec2(x + half_width, y), vec2(0.0), 0);
+        star(vec2(x, y));
+    }
+}
+"""
+
+# Звёздочка как у солнца: круг и пять лучей, повёрнутых на star_angle
+STICK_FRAGMENT_SHADER = """
+#version 330
+
+uniform vec4 bar_color;
+uniform vec4 star_color;
+uniform float star_size;
+uniform float star_angle;
+
+in vec2 local;
+flat in int is_star;
+
+out vec4 fragColor;
+
+void main() {
+    if (is_star == 0) {
+        fragColor = bar_color;
+        return;
+    }
+
+    bool inside = length(local) <= star_size;
+    for (int i = 0; i < 5; i++) {
+        float angle = star_angle + radians(72.0 * float(i));
+        vec2 ray = vec2(cos(angle), sin(angle));
+        float along = clamp(dot(local, ray), 0.0, star_size * 2.0);
+        if (length(local - ray * along) <= 1.0) {
+            inside = true;
+        }
+    }
+    if (!inside) {
+        discard;
+    }
+    fragColor = star_color;
+}
+"""
+
+STICK_DTYPE = np.dtype([
+    ("spawn_x", np.float32),
+    ("spawn_time", np.float32),
+    ("top_height", np.float32),
+    ("bottom_height", np.float32),
+])
+
+
+class StickMesh:
+    """Коридор палок третьей фазы одним буфером на видеокарте.
+
+    Буфер повторяет кольцевой буфер StickCorridor слот в слот. Палки не
+    двигаются в памяти, поэтому за кадр в буфер дописываются только новые
+    пары, а ушедшие просто выпадают из рисуемого диапазона [head, tail).
+    """
+
+    def __init__(self, ctx, sticks, stick_width, star_size=6):
+        self.ctx = ctx
+        self.sticks = sticks
+        self.synced_tail = 0
+        self.synced_generation = sticks.generation
+        self.program = ctx.program(
+            vertex_shader=STICK_VERTEX_SHADER,
+            geometry_shader=STICK_GEOMETRY_SHADER,
+            fragment_shader=STICK_FRAGMENT_SHADER,
+        )
+        self.program["speed"] = sticks.speed
+        self.program["half_width"] = stick_width / 2
+        self.program["star_size"] = star_size
+        self.program["star_reach"] = star_size * 2 + 1
+        self.buffer = ctx.buffer(reserve=sticks.capacity * STICK_DTYPE.itemsize, usage="dynamic")
+        self.geometry = ctx.geometry(
+            [BufferDescription(
+                self.buffer, "1f 1f 1f 1f",
+                ["in_spawn_x", "in_spawn_time", "in_top_height", "in_bottom_height"]
+            )],
+            mode=ctx.POINTS,
+        )
+
+    def _write_slots(self, first, last):
+        """Записать пары с номерами [first, last), которые идут подряд в кольце"""
+        slots = slice(first % self.sticks.capacity, (last - 1) % self.sticks.capacity + 1)
+        data = np.empty(last - first, dtype=STICK_DTYPE)
+        data["spawn_x"] = self.sticks.spawn_x[slots]
+        data["spawn_time"] = self.sticks.spawn_time[slots]
+        data["top_height"] = self.sticks.top_height[slots]
+        data["bottom_height"] = self.sticks.bottom_height[slots]
+        self.buffer.write(data.tobytes(), offset=slots.start * STICK_DTYPE.itemsize)
+
+    def sync(self):
+        """Дописать в буфер пары, появившиеся после прошлой синхронизации"""
+        sticks = self.sticks
+        if sticks.generation != self.synced_generation:
+            # Коридор очистили - всё записанное раньше устарело
+            self.synced_generation = sticks.generation
+            self.synced_tail = sticks.head
+        first = max(self.synced_tail, sticks.tail - sticks.capacity)
+        while first < sticks.tail:
+            # Кусок до конца кольца, остаток - следующим проходом с нулевого слота
+            last = min(sticks.tail, (first // sticks.capacity + 1) * sticks.capacity)
+            self._write_slots(first, last)
+            first = last
+        self.synced_tail = sticks.tail
+
+    def draw(self, time, arena_bottom, arena_top, star_angle,
+             bar_color=(255, 255, 255, 255), star_color=(255, 0, 0, 255)):
+        sticks = self.sticks
+        if len(sticks) == 0:
+            return
+        self.sync()
+        self.program["time"] = time
+        self.program["arena_top"] = arena_top
+        self.program["arena_bottom"] = arena_bottom
+        self.program["star_angle"] = math.radians(star_angle)
+        self.program["bar_color"] = tuple(c / 255 for c in bar_color)
+        self.program["star_color"] = tuple(c / 255 for c in star_color)
+
+        # Живые пары занимают в кольце один или два непрерывных куска
+        first = sticks.head % sticks.capacity
+        count = len(sticks)
+        head_part = min(count, sticks.capacity - first)
+        self.geometry.render(self.program, first=first, vertices=head_part)
+        if count > head_part:
+            self.geometry.render(self.program, first=0, vertices=count - head_part)
+
+
+# Фоновые частицы меню: всё считается из номера цикла и времени, без состояния на CPU
+FIELD_VERTEX_SHADER = """
+#version 330
+
+uniform float time;
+uniform vec2 area;
+uniform float max_speed;
+
+in vec2 in_seed;
+in float in_lifetime;
+in float in_radius;
+in vec4 in_color;
+
+out vec2 v_position;
+out float v_radius;
+out vec4 v_color;
+
+float hash(vec2 p) {
+    return fract(sin(dot(p, vec2(12.9898, 78.233))) * 43758.5453);
+}
+
+void main() {
+    // Каждая точка бесконечно перерождается: номер цикла задаёт новое
+    // место и скорость, доля прожитого цикла - положение и прозрачность
+    float age = time + in_seed.x * in_lifetime;
+    float cycle = floor(age / in_lifetime);
+    float t = age - cycle * in_lifetime;
+    vec2 key = in_seed + vec2(cycle * 0.137, cycle * 0.291);
+
+    vec2 start = vec2(hash(key), hash(key + 1.7)) * area;
+    vec2 velocity = (vec2(hash(key + 3.1), hash(key + 5.3)) * 2.0 - 1.0) * max_speed;
+
+    v_position = start + velocity * t;
+    v_radius = in_radius;
+    v_color = vec4(in_color.rgb, in_color.a * (1.0 - t / in_lifetime));
+}
+"""
+
+FIELD_DTYPE = np.dtype([
+    ("seed", np.float32, 2),
+    ("lifetime", np.float32),
+    ("radius", np.float32),
+    ("color", np.uint8, 4),
+])
+
+
+class ParticleField:
+    """Неизменный набор точек, которые двигаются и гаснут целиком в шейдере.
+
+    Буфер заполняется один раз при создании, за кадр на видеокарту уходит
+    только время. Процессор не создаёт и не обновляет ни одной частицы.
+    """
+
+    def __init__(self, ctx, count, width, height, colors, radii, lifetime=(2.0, 3.0), max_speed=1800):
+        self.ctx = ctx
+        data = np.zeros(count, dtype=FIELD_DTYPE)
+        data["seed"] = np.random.random((count, 2))
+        data["lifetime"] = np.random.uniform(lifetime[0], lifetime[1], count)
+        kinds = np.random.randint(0, len(colors), count)
+        data["radius"] = np.asarray(radii, dtype=np.float32)[kinds]
+        data["color"] = np.asarray(colors, dtype=np.uint8)[kinds]
+        self.count = count
+
+        self.program = ctx.program(
+            vertex_shader=FIELD_VERTEX_SHADER,
+            geometry_shader=CIRCLE_GEOMETRY_SHADER,
+            fragment_shader=CIRCLE_FRAGMENT_SHADER,
+        )
+        self.program["area"] = (width, height)
+        self.program["max_speed"] = max_speed
+        self.buffer = ctx.buffer(data=data.tobytes())
+        self.geometry = ctx.geometry(
+            [BufferDescription(self.buffer, "2f 1f 1f 4f1", ["in_seed", "in_lifetime", "in_radius", "in_color"])],
+            mode=ctx.POINTS,
+        )
+
+    def draw(self, time):
+        self.program["time"] = time
+        self.geometry.render(self.program, vertices=self.count)
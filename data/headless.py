@@ -0,0 +1,97 @@
+import argparse
+import time
+from data.fight_logic import FightLogic
+from data.replay import Replay, ReplayInput
+
+
+def null_input(fight):
+    """Источник ввода, который никогда ничего не нажимает"""
+    return ()
+
+
+class ScriptedInput:
+    """Ввод по сценарию: список (время начала в секундах, набор клавиш)"""
+
+    def __init__(self, script):
+        self.script = sorted(script, key=lambda item: item[0])
+
+    def __call__(self, fight):
+        keys = ()
+        for start, step_keys in self.script:
+            if start > fight.clock.time:
+                break
+            keys = step_keys
+        return keys
+
+
+class HeadlessFight(FightLogic):
+    """Бой без окна: все хуки отображения пустые, время идёт тиками без ожидания"""
+
+    def __init__(self, input_source=None):
+        super().__init__()
+        self.input_source = input_source or null_input
+
+    def run(self, max_time=600.0, seed=None):
+        """Прогнать бой до конца и вернуть game_stats"""
+        self.reset_game(seed)
+
+        while self.game_active and self.clock.time < max_time:
+            self.apply_input(self.input_source(self))
+            self.step()
+
+        # Бой не закончился за отведённое время - считаем поражением
+        if self.game_stats is None:
+            self.game_active = False
+            self.victory = False
+            self.end_game()
+        return self.game_stats
+
+
+def run_headless_fight(input_source=None, max_time=600.0, seed=None):
+    return HeadlessFight(input_source).run(max_time, seed)
+
+
+def play_replay(replay, max_time=600.0):
+    """Прогнать запись боя без окна, с максимальной скоростью"""
+    return HeadlessFight(ReplayInput(replay)).run(max_time, replay.seed)
+
+
+def check_replay(path):
+    """Воспроизвести файл записи и сравнить итог с записанным. True - совпал"""
+    replay = Replay.load(path)
+    stats = play_replay(replay)
+    recorded = replay.stats
+    print(f"Запись {path}: зерно {replay.seed}, {replay.ticks} тиков")
+    mismatched = [name for name in recorded if stats[name] != recorded[name]]
+    for name in recorded:
+        print(f"  {name}: записано {recorded[name]}, получено {stats[name]}")
+    print("Итог совпал" if not mismatched else f"Расхождение: {', '.join(mismatched)}")
+    return not mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Прогон боя без окна")
+    parser.add_argument("--fights", type=int, default=1, help="Сколько боёв прогнать")
+    parser.add_argument("--seed", type=int, default=None, help="Зерно первого боя (следующие - по порядку)")
+    parser.add_argument("--replay", nargs="+", help="Воспроизвести записи боёв и сверить итог")
+    args = parser.parse_args()
+
+    if args.replay:
+        results = [check_replay(path) for path in args.replay]
+        raise SystemExit(0 if all(results) else 1)
+
+    start = time.perf_counter()
+    wins = 0
+    for index in range(args.fights):
+        seed = args.seed + index if args.seed is not None else None
+        stats = run_headless_fight(seed=seed)
+        wins += stats["victory"]
+    elapsed = time.perf_counter() - start
+
+    print(f"Боёв: {args.fights}, побед: {wins}")
+    print(f"Время: {elapsed:.2f} сек ({args.fights / elapsed:.1f} боёв/сек)")
+    print(f"Последний бой: {stats}")
+
+
+if __name__ == "__main__":
+    main()
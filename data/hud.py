@@ -0,0 +1,59 @@
+import arcade
+from arcade.shape_list import ShapeElementList, create_rectangle_filled, create_rectangle_outline
+from data.constants import SCREEN_WIDTH
+
+HP_BAR_WIDTH = 400
+HP_BAR_HEIGHT = 20
+
+
+def _lrbt_filled(left, right, bottom, top, color):
+    return create_rectangle_filled((left + right) / 2, (bottom + top) / 2, right - left, top - bottom, color)
+
+
+def _lrbt_outline(left, right, bottom, top, color, border_width):
+    return create_rectangle_outline(
+        (left + right) / 2, (bottom + top) / 2, right - left, top - bottom, color, border_width
+    )
+
+
+class HudLayer:
+    """Полоска HP и подложка таймера одним готовым набором фигур.
+
+    Фигуры пересобираются только когда меняется HP или положение арены,
+    в остальные кадры список рисуется как есть. Рисовать нужно в экранных
+    координатах, чтобы зум камеры не двигал интерфейс.
+    """
+
+    def __init__(self):
+        self.shapes = ShapeElementList()
+        self.state = None
+
+    def update(self, player_hp, max_hp, arena_bottom):
+        state = (player_hp, max_hp, arena_bottom)
+        if state == self.state:
+            return
+        self.state = state
+
+        hp_bar_y = arena_bottom - 40
+        hp_bar_x = SCREEN_WIDTH // 2 - HP_BAR_WIDTH // 2
+        hp_bar_right = hp_bar_x + HP_BAR_WIDTH
+        hp_bar_top = hp_bar_y + HP_BAR_HEIGHT
+
+        hp_percentage = player_hp / max_hp
+        if hp_percentage > 0.6:
+            hp_color = arcade.color.GREEN
+        elif hp_percentage > 0.3:
+            hp_color = arcade.color.YELLOW
+        else:
+            hp_color = arcade.color.RED
+
+        self.shapes.clear()
+        self.shapes.append(_lrbt_filled(hp_bar_x, hp_bar_right, hp_bar_y, hp_bar_top, (60, 60, 60)))
+        hp_fill_width = HP_BAR_WIDTH * hp_percentage
+        if hp_fill_width > 0:
+            self.shapes.append(_lrbt_filled(hp_bar_x, hp_bar_x + hp_fill_width, hp_bar_y, hp_bar_top, hp_color))
+        self.shapes.append(_lrbt_outline(hp_bar_x, hp_bar_right, hp_bar_y, hp_bar_top, arcade.color.WHITE, 2))
+        self.shapes.append(_lrbt_filled(SCREEN_WIDTH - 150, SCREEN_WIDTH - 20, 20, 60, (0, 0, 0, 150)))
+
+    def draw(self):
+        self.shapes.draw()
@@ -1,30 +1,25 @@
 import arcade
-import random
 from pyglet.graphics import Batch
-from arcade.particles import FadeParticle, Emitter, EmitInterval
+from data.assets import get_assets
 from data.beautiful_button import BeautifulButton
-from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_SPACING, BACKGROUND_COLOR
-
-
-PARTICLE_TEXTURES = [
-    arcade.make_circle_texture(4, (255, 200, 100, 255)),
-    arcade.make_circle_texture(5, (255, 150, 50, 255)),
-    arcade.make_circle_texture(3, (255, 100, 50, 255)),
-    arcade.make_circle_texture(4, (255, 220, 150, 255)),
+from data.gl_batches import ParticleField
+from data.settings_store import get_settings
+from data.text_binding import TextBindings
+from data.views import get_views
+from data.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_SPACING, BACKGROUND_COLOR,
+    MENU_PARTICLE_COUNT
+)
+
+
+# Фоновые частицы меню: цвета и радиусы (как у прежних текстур-кругов)
+MENU_PARTICLE_COLORS = [
+    (255, 200, 100, 255),
+    (255, 150, 50, 255),
+    (255, 100, 50, 255),
+    (255, 220, 150, 255),
 ]
-
-
-def particle_factory(center_x, center_y):
-    texture = random.choice(PARTICLE_TEXTURES)
-    particle = FadeParticle(
-        filename_or_texture=texture,
-        change_xy=(random.uniform(-30, 30), random.uniform(-30, 30)),
-        lifetime=random.uniform(2.0, 3.0),
-        mutation_callback=None
-    )
-    particle.center_x = center_x
-    particle.center_y = center_y
-    return particle
+MENU_PARTICLE_RADII = [2, 2.5, 1.5, 2]
 
 
 class MainMenuView(arcade.View):
@@ -33,7 +28,11 @@ class MainMenuView(arcade.View):
         self.buttons = []
         self.batch = None
         self.title_text = None
+        self.loading_text = None
+        self.texts = None
+        self.loading_label = None
         self.emitter = None
+        self.menu_time = 0.0
         self.background_music = None
         self.sound_enabled = True
 
@@ -46,9 +45,10 @@ class MainMenuView(arcade.View):
         if hasattr(self.window, 'background_music'):
             self.background_music = self.window.background_music
 
-        # Загружаем настройки для звуков эффектов
-        if hasattr(self.window, 'sounds_enabled'):
-            self.sound_enabled = self.window.sounds_enabled
+        # Настройки звуков эффектов: текущее значение и подписка на изменения
+        settings = get_settings(self.window)
+        self.sound_enabled = settings.get("sounds_enabled")
+        settings.subscribe(self.on_setting_changed)
 
         # ===== КНОПКИ =====
         self.play_button = BeautifulButton(
@@ -95,51 +95,71 @@ class MainMenuView(arcade.View):
             batch=self.batch
         )
 
+        # ===== ПРОГРЕСС ФОНОВОЙ ЗАГРУЗКИ =====
+        self.loading_text = arcade.Text(
+            "",
+            SCREEN_WIDTH // 2,
+            30,
+            arcade.color.LIGHT_GRAY,
+            16,
+            anchor_x="center",
+            anchor_y="center",
+            font_name="Arial",
+            batch=self.batch
+        )
+        self.texts = TextBindings()
+        self.loading_label = self.texts.bind(self.loading_text)
+        self.update_loading_text()
+
         # ===== ЭМИТТЕР ФОНОВЫХ ЧАСТИЦ =====
         self.setup_emitter()
 
     def setup_emitter(self):
-        def emit_position(emitter):
-            return random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)
-
-        self.emitter = Emitter(
-            center_xy=(0, 0),
-            emit_controller=EmitInterval(0.02),
-            particle_factory=lambda e: particle_factory(*emit_position(e))
+        self.emitter = ParticleField(
+            self.window.ctx, MENU_PARTICLE_COUNT,
+            SCREEN_WIDTH, SCREEN_HEIGHT,
+            MENU_PARTICLE_COLORS, MENU_PARTICLE_RADII
         )
 
+    def update_loading_text(self):
+        assets = get_assets(self.window)
+        if assets.ready:
+            self.loading_label.set("")
+        else:
+            self.loading_label.set(f"Загрузка: {int(assets.progress() * 100)}%")
+
+    def on_show_view(self):
+        # Вид переиспользуется: музыка могла догрузиться, настройки - измениться
+        self.background_music = getattr(self.window, 'background_music', None)
+        self.apply_sound_settings()
+        for button in self.buttons:
+            button.reset()
+        self.update_loading_text()
+
     def apply_sound_settings(self):
         """Применить настройки звука из window"""
-        if hasattr(self.window, 'sounds_enabled'):
-            self.sound_enabled = self.window.sounds_enabled
+        self.sound_enabled = get_settings(self.window).get("sounds_enabled")
+
+    def on_setting_changed(self, name, value):
+        if name == "sounds_enabled":
+            self.sound_enabled = value
 
     def on_draw(self):
         self.clear()
         arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, BACKGROUND_COLOR)
 
         if self.emitter:
-            self.emitter.draw()
+            self.emitter.draw(self.menu_time)
 
         for button in self.buttons:
             button.draw()
+        self.texts.flush()
         self.batch.draw()
 
-        darkness = getattr(self.window, 'darkness_factor', 0)
-        if darkness > 0:
-            alpha = int(255 * darkness)
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH,
-                0, SCREEN_HEIGHT,
-                (0, 0, 0, alpha)
-            )
-
     def on_update(self, delta_time):
-        if hasattr(self.window, 'sounds_enabled'):
-            if self.sound_enabled != self.window.sounds_enabled:
-                self.apply_sound_settings()
+        self.menu_time += delta_time
 
-        if self.emitter:
-            self.emitter.update(delta_time)
+        self.update_loading_text()
 
     def on_mouse_motion(self, x, y, dx, dy):
         for button in self.buttons:
@@ -148,14 +168,8 @@ class MainMenuView(arcade.View):
     def on_mouse_press(self, x, y, button, modifiers):
         if button == arcade.MOUSE_BUTTON_LEFT:
             if self.play_button.check_click(x, y):
-                from data.game_view import GameView
-                game_view = GameView()
-                game_view.setup()
-                self.window.show_view(game_view)
+                get_views(self.window).show("game")
             elif self.settings_button.check_click(x, y):
-                from data.settings_view import SettingsView
-                settings_view = SettingsView()
-                settings_view.setup()
-                self.window.show_view(settings_view)
+                get_views(self.window).show("settings")
             elif self.exit_button.check_click(x, y):
                 arcade.exit()
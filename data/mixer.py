@@ -0,0 +1,80 @@
+import time
+from pyglet import media
+from data.constants import MIXER_VOICES, MIXER_DEDUP_WINDOW
+
+
+class Voice:
+    """Один плеер pyglet, который переиспользуется для разных звуков"""
+
+    def __init__(self):
+        self.player = media.Player()
+        self.sound = None
+        self.volume = 0.0
+        self.started = 0.0
+
+    @property
+    def busy(self):
+        return self.player.playing and self.player.source is not None
+
+
+class Mixer:
+    """Звуковые эффекты через фиксированный набор голосов на категорию.
+
+    Эффекты должны быть загружены целиком в память (streaming=False), тогда
+    запуск - это только перемотка уже декодированного звука. Если все голоса
+    категории заняты, забирается самый тихий (из равных - самый старый).
+    Один и тот же звук, запущенный повторно в пределах dedup_window,
+    не играет второй раз, а лишь может стать громче.
+    """
+
+    def __init__(self, voices=MIXER_VOICES, dedup_window=MIXER_DEDUP_WINDOW):
+        self.dedup_window = dedup_window
+        self.pools = {category: [Voice() for _ in range(count)] for category, count in voices.items()}
+
+    def play(self, category, sound, volume=1.0):
+        if sound is None:
+            return None
+        now = time.perf_counter()
+        pool = self.pools[category]
+
+        for voice in pool:
+            if voice.sound is sound and voice.busy and now - voice.started < self.dedup_window:
+                if volume > voice.volume:
+                    voice.volume = voice.player.volume = volume
+                return voice
+
+        idle = [voice for voice in pool if not voice.busy]
+        if idle:
+            voice = idle[0]
+        else:
+            voice = min(pool, key=lambda v: (v.volume, v.started))
+        self._start(voice, sound, volume, now)
+        return voice
+
+    def _start(self, voice, sound, volume, now):
+        player = voice.player
+        if voice.sound is sound and player.source is not None:
+            player.seek(0.0)
+        else:
+            if player.source is not None:
+                # Сбрасываем прошлый звук, плеер остаётся тем же
+                player.next_source()
+            player.queue(sound.source)
+        voice.sound = sound
+        voice.volume = player.volume = volume
+        voice.started = now
+        player.play()
+
+    def stop_all(self):
+        for pool in self.pools.values():
+            for voice in pool:
+                voice.player.pause()
+
+
+def get_mixer(window):
+    """Микшер окна (создаётся при первом обращении, если окно его не завело)"""
+    mixer = getattr(window, "mixer", None)
+    if mixer is None:
+        mixer = Mixer()
+        window.mixer = mixer
+    return mixer
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class ParticlePool:
+    """Пул частиц фиксированного размера на массивах NumPy.
+
+    Частица жива, пока lifetime > 0. Новые частицы занимают свободные
+    места, а если пул заполнен - перезаписывают самые старые.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.dx = np.zeros(capacity, dtype=np.float32)
+        self.dy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.max_lifetime = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        # Порядковый номер рождения, чтобы знать, какая частица старше
+        self.born = np.zeros(capacity, dtype=np.int64)
+        self.spawned = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.lifetime > 0))
+
+    def clear(self):
+        self.lifetime[:] = 0
+
+    def spawn(self, x, y, dx, dy, size, lifetime, color):
+        """Добавить пачку частиц (dx, dy, size, lifetime, color - массивы одной длины)"""
+        count = min(len(dx), self.capacity)
+        free = np.flatnonzero(self.lifetime <= 0)[:count]
+        if len(free) < count:
+            # Пул полон - перезаписываем самые старые живые частицы
+            alive = np.flatnonzero(self.lifetime > 0)
+            oldest = alive[np.argsort(self.born[alive], kind="stable")[:count - len(free)]]
+            free = np.concatenate([free, oldest])
+
+        self.x[free] = x
+        self.y[free] = y
+        self.dx[free] = dx[:count]
+        self.dy[free] = dy[:count]
+        self.size[free] = size[:count]
+        self.lifetime[free] = lifetime[:count]
+        self.max_lifetime[free] = lifetime[:count]
+        self.color[free] = color[:count]
+        self.born[free] = np.arange(self.spawned, self.spawned + count)
+        self.spawned += count
+
+    def update(self, delta_time):
+        # Скорости частиц заданы в пикселях за кадр при 60 FPS
+        frame_scale = delta_time * 60
+        # Мёртвые частицы обновляются вместе с живыми: так дешевле, чем выбирать по маске
+        self.x += self.dx * frame_scale
+        self.y += self.dy * frame_scale
+        self.dy -= 0.1 * frame_scale
+        self.lifetime -= delta_time
+
+    def visible(self):
+        """Позиции, размеры и цвета RGBA живых частиц (прозрачность по оставшейся жизни)"""
+        alive = np.flatnonzero(self.lifetime > 0)
+        rgba = np.empty((len(alive), 4), dtype=np.uint8)
+        rgba[:, :3] = self.color[alive]
+        rgba[:, 3] = (255 * self.lifetime[alive] / self.max_lifetime[alive]).astype(np.uint8)
+        return self.x[alive], self.y[alive], self.size[alive], rgba
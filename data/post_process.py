@@ -0,0 +1,65 @@
+from arcade.gl import geometry
+from data.constants import DISPLAY_GAMMA
+
+POST_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_vert;
+in vec2 in_uv;
+
+out vec2 uv;
+
+void main() {
+    uv = in_uv;
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+}
+"""
+
+# Гамма, цветовой эффект поверх кадра (tint.a - сила) и яркость - за один проход
+POST_FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D scene;
+uniform float brightness;
+uniform float gamma;
+uniform vec4 tint;
+
+in vec2 uv;
+
+out vec4 fragColor;
+
+void main() {
+    vec3 color = texture(scene, uv).rgb;
+    color = pow(color, vec3(1.0 / gamma));
+    color = mix(color, tint.rgb, tint.a);
+    fragColor = vec4(color * brightness, 1.0);
+}
+"""
+
+
+class PostProcess:
+    """Кадр рисуется во внеэкранный буфер и выводится на экран одним проходом.
+
+    На выводе применяются яркость из настроек, гамма и общий цветовой
+    эффект экрана (tint, например вспышка), одинаково для всех видов.
+    """
+
+    def __init__(self, ctx, size):
+        self.ctx = ctx
+        self.texture = ctx.texture(size, components=4)
+        self.framebuffer = ctx.framebuffer(color_attachments=[self.texture])
+        self.quad = geometry.quad_2d_fs()
+        self.program = ctx.program(vertex_shader=POST_VERTEX_SHADER, fragment_shader=POST_FRAGMENT_SHADER)
+        self.program["scene"] = 0
+        self.brightness = 1.0
+        self.gamma = DISPLAY_GAMMA
+        self.tint = (0.0, 0.0, 0.0, 0.0)
+
+    def render(self):
+        """Вывести готовый кадр на экран"""
+        self.ctx.screen.use()
+        self.texture.use(0)
+        self.program["brightness"] = self.brightness
+        self.program["gamma"] = self.gamma
+        self.program["tint"] = self.tint
+        self.quad.render(self.program)
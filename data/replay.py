@@ -0,0 +1,134 @@
+import os
+import struct
+from data.constants import SIM_TICK_RATE
+from data.fight_logic import MOVEMENT_KEYS
+
+# Заголовок: метка, версия, тиков в секунду, зерно, длина боя в тиках и итог боя
+REPLAY_MAGIC = b"SUNR"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sBHIIBhII")
+SEED_MASK = 0xFFFFFFFF  # Зерно занимает в заголовке 4 байта без знака
+HP_RANGE = (-0x8000, 0x7FFF)
+# Серия одинаковых тиков: маска клавиш и сколько тиков она держалась
+RUN = struct.Struct("<BH")
+MAX_RUN = 0xFFFF
+
+
+def encode_keys(keys):
+    """Набор нажатых клавиш движения -> битовая маска (бит на клавишу MOVEMENT_KEYS)"""
+    mask = 0
+    for bit, key in enumerate(MOVEMENT_KEYS):
+        if key in keys:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask):
+    return tuple(key for bit, key in enumerate(MOVEMENT_KEYS) if mask & (1 << bit))
+
+
+class Replay:
+    """Запись боя: зерно случайностей и ввод по тикам, сжатый сериями.
+
+    Бой полностью определяется зерном и маской клавиш на каждом тике,
+    поэтому для воспроизведения больше ничего не нужно. Итог боя хранится
+    для проверки, что воспроизведение пришло к тому же результату.
+    """
+
+    def __init__(self, seed, tick_rate, runs=None, stats=None):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.runs = runs if runs is not None else []
+        self.ticks = 0
+        self.stats = stats
+
+    def to_bytes(self):
+        stats = self.stats or {}
+        # Итог нужен только для сверки: HP за пределами short просто обрезается
+        low, high = HP_RANGE
+        hp = min(max(stats.get("hp_remaining", 0), low), high)
+        parts = [HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, self.tick_rate, self.seed, self.ticks,
+            bool(stats.get("victory")), hp,
+            stats.get("bullets_dodged", 0), stats.get("total_bullets", 0)
+        )]
+        for mask, length in self.runs:
+            parts.append(RUN.pack(mask, length))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, tick_rate, seed, ticks, victory, hp, dodged, total = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Файл не является записью боя этой версии")
+        runs = [RUN.unpack_from(data, offset) for offset in range(HEADER.size, len(data), RUN.size)]
+        stats = {"victory": bool(victory), "hp_remaining": hp, "bullets_dodged": dodged, "total_bullets": total}
+        replay = cls(seed, tick_rate, runs, stats)
+        replay.ticks = ticks
+        return replay
+
+    def save(self, path):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Пишет ввод боя в Replay: одна запись на тик, одинаковые тики склеиваются"""
+
+    def __init__(self):
+        self.replay = None
+
+    def start(self, seed, tick_rate=SIM_TICK_RATE):
+        if not 0 <= seed <= SEED_MASK:
+            raise ValueError(f"Зерно {seed} не помещается в запись боя")
+        self.replay = Replay(seed, tick_rate)
+
+    def record(self, keys):
+        if self.replay is None:
+            return
+        mask = encode_keys(keys)
+        runs = self.replay.runs
+        if runs and runs[-1][0] == mask and runs[-1][1] < MAX_RUN:
+            runs[-1] = (mask, runs[-1][1] + 1)
+        else:
+            runs.append((mask, 1))
+        self.replay.ticks += 1
+
+    def finish(self, stats):
+        """Закончить запись и вернуть её (None, если запись не велась)"""
+        replay, self.replay = self.replay, None
+        if replay is not None:
+            replay.stats = stats
+        return replay
+
+
+class ReplayInput:
+    """Источник ввода по записи: клавиши для текущего тика боя.
+
+    Подходит и для HeadlessFight (input_source), и для GameView.
+    После конца записи ничего не нажато.
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.run_index = 0
+        self.run_end = replay.runs[0][1] if replay.runs else 0
+
+    def __call__(self, fight):
+        runs = self.replay.runs
+        tick = fight.clock.tick_count
+        while self.run_index < len(runs) and tick >= self.run_end:
+            self.run_index += 1
+            if self.run_index < len(runs):
+                self.run_end += runs[self.run_index][1]
+        if self.run_index >= len(runs):
+            return ()
+        return decode_keys(runs[self.run_index][0])
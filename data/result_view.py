@@ -1,17 +1,18 @@
 import arcade
 from pyglet.graphics import Batch
+from data.assets import get_assets
 from data.beautiful_button import BeautifulButton
+from data.mixer import get_mixer
+from data.settings_store import get_settings
+from data.text_binding import TextBindings
+from data.views import get_views
 from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BUTTON_WIDTH, BUTTON_HEIGHT, BACKGROUND_COLOR
 
 
 class ResultView(arcade.View):
-    def __init__(self, elapsed_time, victory, bullets_dodged=0, total_bullets=0, hp_remaining=0):
+    def __init__(self, elapsed_time=0.0, victory=False, bullets_dodged=0, total_bullets=0, hp_remaining=0):
         super().__init__()
-        self.elapsed_time = elapsed_time
-        self.victory = victory
-        self.bullets_dodged = bullets_dodged
-        self.total_bullets = total_bullets
-        self.hp_remaining = hp_remaining
+        self.set_results(elapsed_time, victory, bullets_dodged, total_bullets, hp_remaining)
 
         self.menu_button = None
         self.restart_button = None
@@ -20,21 +21,20 @@ class ResultView(arcade.View):
         self.time_text = None
         self.stats_text = None
         self.hp_text = None
+        self.texts = None
+        self.title_label = None
+        self.time_label = None
+        self.stats_label = None
+        self.hp_label = None
 
     def setup(self):
         self.batch = Batch()
 
         # ⚡ Загружаем настройки звуков
-        if hasattr(self.window, 'sounds_enabled'):
-            self.sound_enabled = self.window.sounds_enabled
-        else:
-            self.sound_enabled = True
+        self.sound_enabled = get_settings(self.window).get("sounds_enabled")
 
-        # Загружаем звук кнопки (можно добавить)
-        try:
-            self.click_sound = arcade.load_sound("materials/click.wav")
-        except:
-            self.click_sound = None
+        # Звук кнопки (файла может не быть - реестр запомнит это с первого раза)
+        self.click_sound = get_assets(self.window).sound("materials/click.wav")
 
         # Кнопка возврата в меню
         self.menu_button = BeautifulButton(
@@ -57,14 +57,11 @@ class ResultView(arcade.View):
         self.restart_button.create_text_object(self.batch)
 
         # Заголовок
-        result_title = "ПОБЕДА!" if self.victory else "ПОРАЖЕНИЕ"
-        title_color = arcade.color.GREEN if self.victory else arcade.color.RED
-
         self.title_text = arcade.Text(
-            result_title,
+            "",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 100,
-            title_color,
+            arcade.color.WHITE,
             48,
             anchor_x="center",
             anchor_y="center",
@@ -74,9 +71,8 @@ class ResultView(arcade.View):
         )
 
         # Время выживания
-        time_msg = f"Время: {self.elapsed_time:.1f} сек" if not self.victory else "Вы измотали это крутящееся чудо!"
         self.time_text = arcade.Text(
-            time_msg,
+            "",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT // 2 + 60,
             arcade.color.WHITE,
@@ -88,9 +84,8 @@ class ResultView(arcade.View):
         )
 
         # Статистика
-        stats_msg = f"Уклонений: {self.bullets_dodged} / {self.total_bullets}"
         self.stats_text = arcade.Text(
-            stats_msg,
+            "",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT // 2 + 10,
             arcade.color.LIGHT_GRAY,
@@ -102,12 +97,11 @@ class ResultView(arcade.View):
         )
 
         # Оставшееся HP
-        hp_msg = f"Осталось HP: {self.hp_remaining}/92"
         self.hp_text = arcade.Text(
-            hp_msg,
+            "",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT // 2 - 40,
-            arcade.color.YELLOW if self.hp_remaining > 46 else arcade.color.RED,
+            arcade.color.WHITE,
             24,
             anchor_x="center",
             anchor_y="center",
@@ -115,23 +109,49 @@ class ResultView(arcade.View):
             batch=self.batch
         )
 
+        self.texts = TextBindings()
+        self.title_label = self.texts.bind(self.title_text)
+        self.time_label = self.texts.bind(self.time_text)
+        self.stats_label = self.texts.bind(self.stats_text)
+        self.hp_label = self.texts.bind(self.hp_text)
+        self.update_texts()
+
+    def set_results(self, elapsed_time, victory, bullets_dodged=0, total_bullets=0, hp_remaining=0):
+        """Итоги очередного боя (тексты обновятся при показе вида)"""
+        self.elapsed_time = elapsed_time
+        self.victory = victory
+        self.bullets_dodged = bullets_dodged
+        self.total_bullets = total_bullets
+        self.hp_remaining = hp_remaining
+
+    def on_show_view(self):
+        # Вид переиспользуется: обновляем только итоги и настройки
+        self.sound_enabled = get_settings(self.window).get("sounds_enabled")
+        self.menu_button.reset()
+        self.restart_button.reset()
+        self.update_texts()
+
+    def update_texts(self):
+        """Записать итоги боя в тексты (разложатся при ближайшей отрисовке)"""
+        self.title_label.set("ПОБЕДА!" if self.victory else "ПОРАЖЕНИЕ")
+        self.title_text.color = arcade.color.GREEN if self.victory else arcade.color.RED
+        if self.victory:
+            self.time_label.set("Вы измотали это крутящееся чудо!")
+        else:
+            self.time_label.set(f"Время: {self.elapsed_time:.1f} сек")
+        self.stats_label.set(f"Уклонений: {self.bullets_dodged} / {self.total_bullets}")
+        self.hp_label.set(f"Осталось HP: {self.hp_remaining}/92")
+        self.hp_text.color = arcade.color.YELLOW if self.hp_remaining > 46 else arcade.color.RED
+
     def on_draw(self):
         self.clear()
         arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, BACKGROUND_COLOR)
 
         self.menu_button.draw()
         self.restart_button.draw()
+        self.texts.flush()
         self.batch.draw()
 
-        darkness = getattr(self.window, 'darkness_factor', 0)
-        if darkness > 0:
-            alpha = int(255 * darkness)
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH,
-                0, SCREEN_HEIGHT,
-                (0, 0, 0, alpha)
-            )
-
     def on_mouse_motion(self, x, y, dx, dy):
         if self.menu_button:
             self.menu_button.check_hover(x, y)
@@ -140,18 +160,11 @@ class ResultView(arcade.View):
 
         if self.menu_button.check_click(x, y):
             if self.sound_enabled and self.click_sound:
-                arcade.play_sound(self.click_sound)
-            from data.main_menu_view import MainMenuView
+                get_mixer(self.window).play("ui", self.click_sound)
 
     def on_mouse_press(self, x, y, button, modifiers):
         if button == arcade.MOUSE_BUTTON_LEFT:
             if self.menu_button and self.menu_button.check_click(x, y):
-                from data.main_menu_view import MainMenuView
-                menu_view = MainMenuView()
-                menu_view.setup()
-                self.window.show_view(menu_view)
+                get_views(self.window).show("menu")
             elif self.restart_button and self.restart_button.check_click(x, y):
-                from data.game_view import GameView
-                game_view = GameView()
-                game_view.setup()
-                self.window.show_view(game_view)
+                get_views(self.window).show("game")
@@ -0,0 +1,141 @@
+import csv
+import os
+import threading
+import time
+from data.constants import SETTINGS_FILE, SETTINGS_SAVE_DELAY
+
+# Имя -> (тип, значение по умолчанию). Порядок задаёт колонки в файле
+SETTINGS_SCHEMA = {
+    "brightness": (float, 1.0),
+    "sounds_enabled": (bool, True),
+}
+
+
+def parse_value(kind, text):
+    if kind is bool:
+        return text.strip().lower() == "true"
+    return kind(text)
+
+
+class SettingsStore:
+    """Настройки игры в памяти, с отложенной записью на диск.
+
+    Чтение и изменение - обычные операции со словарём. После изменения
+    файл перезаписывается фоновым потоком, когда изменения затихнут на
+    save_delay секунд: перетаскивание ползунка даёт одну запись, а не
+    сотни. Запись атомарная: во временный файл, затем os.replace.
+    Подписчики узнают об изменениях сразу, в потоке вызвавшего set.
+    """
+
+    def __init__(self, path=SETTINGS_FILE, schema=SETTINGS_SCHEMA, save_delay=SETTINGS_SAVE_DELAY):
+        self.path = path
+        self.schema = schema
+        self.save_delay = save_delay
+        self.values = {name: default for name, (kind, default) in schema.items()}
+        self.listeners = []
+
+        self.lock = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.dirty = False
+        self.save_at = 0.0
+        self.worker = None
+
+    def load(self):
+        """Прочитать файл. Битые и недостающие значения остаются по умолчанию"""
+        if not os.path.exists(self.path):
+            self.save()
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                row = next(csv.reader(f), [])
+        except OSError as e:
+            print(f"Ошибка загрузки настроек: {e}")
+            return
+        for (name, (kind, default)), text in zip(self.schema.items(), row):
+            try:
+                self.values[name] = parse_value(kind, text)
+            except ValueError:
+                print(f"Настройка {name}: неверное значение {text!r}, используется {default}")
+
+    def get(self, name):
+        return self.values[name]
+
+    def set(self, name, value):
+        kind, default = self.schema[name]
+        value = kind(value)
+        if self.values[name] == value:
+            return
+        with self.lock:
+            self.values[name] = value
+            self.dirty = True
+            self.save_at = time.monotonic() + self.save_delay
+            self.start_worker()
+            self.lock.notify()
+        for listener in list(self.listeners):
+            listener(name, value)
+
+    def subscribe(self, listener):
+        """listener(name, value) вызывается после каждого изменения"""
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    # ===== ЗАПИСЬ =====
+    def start_worker(self):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.run_worker, name="settings-save", daemon=True)
+            self.worker.start()
+
+    def run_worker(self):
+        while True:
+            with self.lock:
+                while not self.dirty:
+                    self.lock.wait()
+                # Каждое новое изменение отодвигает запись
+                while self.dirty and time.monotonic() < self.save_at:
+                    self.lock.wait(self.save_at - time.monotonic())
+                if not self.dirty:
+                    continue
+            self.save()
+
+    def snapshot(self):
+        return [self.values[name] for name in self.schema]
+
+    def write(self, row):
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="") as f:
+                csv.writer(f).writerow(row)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Ошибка сохранения настроек: {e}")
+
+    def save(self):
+        """Записать сразу, в текущем потоке"""
+        # Снимок и запись - под одним write_lock: пока запись идёт, dirty
+        # уже сброшен, и старый снимок не может лечь поверх нового
+        with self.write_lock:
+            with self.lock:
+                row = self.snapshot()
+                self.dirty = False
+            self.write(row)
+
+    def flush(self):
+        """Дописать отложенные изменения (при выходе из игры)"""
+        # write_lock дожидается записи, которую фоновый поток уже начал
+        with self.write_lock:
+            dirty = self.dirty
+        if dirty:
+            self.save()
+
+
+def get_settings(window):
+    """Настройки окна (создаются и читаются при первом обращении)"""
+    settings = getattr(window, "settings", None)
+    if settings is None:
+        settings = SettingsStore()
+        settings.load()
+        window.settings = settings
+    return settings
@@ -1,14 +1,12 @@
 import arcade
-import csv
-import os
 from pyglet.graphics import Batch
 from data.beautiful_button import BeautifulButton
+from data.settings_store import get_settings
+from data.text_binding import TextBindings
+from data.views import get_views
 from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BUTTON_WIDTH, BUTTON_HEIGHT, BACKGROUND_COLOR
 
 
-SETTINGS_FILE = "settings.csv"
-
-
 class SettingsView(arcade.View):
     def __init__(self):
         super().__init__()
@@ -26,6 +24,9 @@ class SettingsView(arcade.View):
         self.brightness_slider = None
         self.brightness_text = None
         self.back_button = None
+        self.texts = None
+        self.sounds_label = None
+        self.brightness_label = None
 
         # ===== ПОЛЗУНОК =====
         self.brightness_slider_x = 0
@@ -42,6 +43,7 @@ class SettingsView(arcade.View):
         self.batch = Batch()
 
         # Загружаем настройки
+        self.settings = get_settings(self.window)
         self.load_settings()
 
         # ===== ЗАГОЛОВОК =====
@@ -99,53 +101,42 @@ class SettingsView(arcade.View):
         self.back_button.create_text_object(self.batch)
         self.buttons.append(self.back_button)
 
+        self.texts = TextBindings()
+        self.sounds_label = self.texts.bind(self.sounds_toggle_button.text_object)
+        self.brightness_label = self.texts.bind(self.brightness_text)
+
         # Применяем настройки
         self.apply_all_settings()
 
     def load_settings(self):
-        """Загрузить настройки из CSV файла (только яркость и звуки)"""
-        if os.path.exists(SETTINGS_FILE):
-            try:
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
-                    if rows and len(rows[0]) >= 2:
-                        # Новый формат: яркость, звуки
-                        self.brightness = float(rows[0][0])
-                        self.sounds_enabled = rows[0][1].lower() == 'true'
-            except Exception as e:
-                print(f"Ошибка загрузки настроек: {e}")
-        else:
-            # Если файла нет, создаём с параметрами по умолчанию
-            self.save_settings()
-
-        self.window.brightness = self.brightness
-        self.window.sounds_enabled = self.sounds_enabled
+        """Взять текущие настройки (яркость и звуки) из хранилища окна"""
+        self.brightness = self.settings.get("brightness")
+        self.sounds_enabled = self.settings.get("sounds_enabled")
 
     def save_settings(self):
-        """Сохранить настройки в CSV файл (только 2 параметра)"""
-        try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    self.brightness,      # яркость
-                    self.sounds_enabled   # звуки
-                ])
-        except Exception as e:
-            print(f"Ошибка сохранения настроек: {e}")
-
-        self.window.brightness = self.brightness
-        self.window.sounds_enabled = self.sounds_enabled
+        """Передать настройки хранилищу (на диск оно запишет само, в фоне)"""
+        self.settings.set("brightness", self.brightness)
+        self.settings.set("sounds_enabled", self.sounds_enabled)
 
     def apply_all_settings(self):
         """Применить все настройки"""
         # Музыка не трогаем — она всегда играет
-        self.window.darkness_factor = 1.0 - self.brightness
+        # Яркость применяет окно при выводе кадра
+        self.settings.set("brightness", self.brightness)
+
+    def on_show_view(self):
+        # Вид переиспользуется: берём текущие настройки окна
+        self.load_settings()
+        self.brightness_slider_dragging = False
+        for button in self.buttons:
+            button.reset()
+        self.update_sounds_button_text()
+        self.brightness_label.set(f"ЯРКОСТЬ: {int(self.brightness * 100)}%")
 
     def update_sounds_button_text(self):
         status = "ВКЛ" if self.sounds_enabled else "ВЫКЛ"
         self.sounds_toggle_button.text = f"ЗВУКИ: {status}"
-        self.sounds_toggle_button.create_text_object(self.batch)
+        self.sounds_label.set(self.sounds_toggle_button.text)
 
     def on_draw(self):
         self.clear()
@@ -181,18 +172,9 @@ class SettingsView(arcade.View):
         # Кнопки и текст
         for button in self.buttons:
             button.draw()
+        self.texts.flush()
         self.batch.draw()
 
-        # ===== ЧЁРНЫЙ СЛОЙ ДЛЯ ЯРКОСТИ =====
-        darkness = getattr(self.window, 'darkness_factor', 0)
-        if darkness > 0:
-            alpha = int(255 * darkness)
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH,
-                0, SCREEN_HEIGHT,
-                (0, 0, 0, alpha)
-            )
-
     def on_mouse_motion(self, x, y, dx, dy):
         for button in self.buttons:
             button.check_hover(x, y)
@@ -208,10 +190,7 @@ class SettingsView(arcade.View):
 
             # ===== КНОПКА НАЗАД =====
             if self.back_button.check_click(x, y):
-                from data.main_menu_view import MainMenuView
-                menu_view = MainMenuView()
-                menu_view.setup()
-                self.window.show_view(menu_view)
+                get_views(self.window).show("menu")
                 return
 
             # ===== ПОЛЗУНОК ЯРКОСТИ =====
@@ -230,9 +209,8 @@ class SettingsView(arcade.View):
             self.brightness = (x - min_x) / self.slider_width
             self.brightness = max(0.25, min(1.0, self.brightness))
 
-            self.brightness_text.text = f"ЯРКОСТЬ: {int(self.brightness * 100)}%"
+            self.brightness_label.set(f"ЯРКОСТЬ: {int(self.brightness * 100)}%")
             self.apply_all_settings()
-            self.save_settings()
 
     def on_mouse_release(self, x, y, button, modifiers):
         if button == arcade.MOUSE_BUTTON_LEFT:
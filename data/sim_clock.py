@@ -0,0 +1,54 @@
+from data.constants import SIM_TICK_RATE, SIM_MAX_TICKS_PER_FRAME
+
+
+def lerp(a, b, t):
+    """Линейная интерполяция между двумя состояниями"""
+    return a + (b - a) * t
+
+
+class SimulationClock:
+    """Часы симуляции с фиксированным шагом.
+
+    Реальное время кадра накапливается, а симуляция продвигается только
+    целыми тиками длиной dt. Остаток (alpha) используется при отрисовке
+    для интерполяции между двумя последними состояниями.
+    """
+
+    def __init__(self, tick_rate=SIM_TICK_RATE, max_ticks_per_frame=SIM_MAX_TICKS_PER_FRAME):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        # Во сколько раз симуляция быстрее реального времени (для тестов)
+        self.time_scale = 1.0
+        self.tick_count = 0
+        self.time = 0.0
+        self.accumulator = 0.0
+
+    def reset(self):
+        self.tick_count = 0
+        self.time = 0.0
+        self.accumulator = 0.0
+
+    def advance(self, real_delta):
+        """Накопить реальное время и вернуть количество целых тиков к выполнению"""
+        self.accumulator += real_delta * self.time_scale
+        ticks = int(self.accumulator / self.dt)
+
+        # Защита от "спирали смерти": после долгого зависания не догоняем бесконечно
+        max_ticks = int(self.max_ticks_per_frame * self.time_scale)
+        if ticks > max_ticks:
+            ticks = max_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    def tick(self):
+        """Отметить выполненный тик"""
+        self.tick_count += 1
+        self.time = self.tick_count * self.dt
+
+    @property
+    def alpha(self):
+        """Доля следующего тика, прошедшая в реальном времени (0..1)"""
+        return min(1.0, self.accumulator / self.dt)
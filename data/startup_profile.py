@@ -0,0 +1,42 @@
+import importlib
+import time
+
+
+class StartupProfiler:
+    """Замеры холодного старта: импорты модулей и ключевые моменты запуска.
+
+    Все времена отсчитываются от создания профайлера, то есть от первого
+    импорта этого модуля в main.py. Модуль сам ничего тяжёлого не
+    импортирует, чтобы не искажать замеры.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.imports = {}
+        self.marks = {}
+        self.reported = False
+
+    def import_module(self, name):
+        """Импортировать модуль, запомнив время первого импорта"""
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        if name not in self.imports:
+            self.imports[name] = time.perf_counter() - start
+        return module
+
+    def mark(self, name):
+        """Отметить момент запуска (повторные отметки игнорируются)"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+
+    def report(self):
+        lines = ["Отчёт о запуске:"]
+        for name, elapsed in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  {name}: {elapsed * 1000:.0f} мс")
+        lines.append("  Импорт модулей:")
+        for name, elapsed in sorted(self.imports.items(), key=lambda item: -item[1]):
+            lines.append(f"    {name}: {elapsed * 1000:.0f} мс")
+        return "\n".join(lines)
+
+
+PROFILER = StartupProfiler()
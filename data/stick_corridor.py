@@ -0,0 +1,95 @@
+from bisect import bisect_left, bisect_right
+import numpy as np
+
+
+class StickCorridor:
+    """Коридор палок третьей фазы в кольцевом буфере фиксированной ёмкости.
+
+    Для каждой пары палок хранятся только время появления, стартовый x и
+    высоты верхней и нижней палки (0 - палки нет). Текущий x вычисляется
+    из времени, поэтому палки не двигаются по кадрам, а устаревшие пары
+    удаляются простым сдвигом головы буфера.
+
+    Пары в буфере упорядочены по x (более новые правее), поэтому коридор
+    можно опрашивать как карту высот: пары на отрезке x находятся
+    бинарным поиском, не перебирая весь буфер.
+    """
+
+    def __init__(self, speed, capacity=256):
+        self.speed = speed
+        self.capacity = capacity
+        self.spawn_time = np.zeros(capacity, dtype=np.float64)
+        self.spawn_x = np.zeros(capacity, dtype=np.float32)
+        self.top_height = np.zeros(capacity, dtype=np.float32)
+        self.bottom_height = np.zeros(capacity, dtype=np.float32)
+        # Время последнего удара каждой палкой (кулдаун урона у каждой своей)
+        self.top_last_hit = np.zeros(capacity, dtype=np.float64)
+        self.bottom_last_hit = np.zeros(capacity, dtype=np.float64)
+        # Счётчики пар за всё время: живые пары - [head, tail)
+        self.head = 0
+        self.tail = 0
+        # Номер очистки: по нему StickMesh узнаёт, что старые слоты устарели
+        self.generation = 0
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def clear(self):
+        self.head = self.tail = 0
+        self.generation += 1
+
+    def push(self, spawn_time, spawn_x, top_height, bottom_height, last_hit):
+        """Добавить пару. Если буфер полон, самая старая пара перезаписывается"""
+        if len(self) == self.capacity:
+            self.head += 1
+        slot = self.tail % self.capacity
+        self.spawn_time[slot] = spawn_time
+        self.spawn_x[slot] = spawn_x
+        self.top_height[slot] = top_height
+        self.bottom_height[slot] = bottom_height
+        self.top_last_hit[slot] = last_hit
+        self.bottom_last_hit[slot] = last_hit
+        self.tail += 1
+
+    def x_of(self, slot, time):
+        return self.spawn_x[slot] - self.speed * (time - self.spawn_time[slot])
+
+    def expire(self, time, min_x):
+        """Убрать пары, ушедшие левее min_x (самые старые всегда левее всех)"""
+        while self.head < self.tail and self.x_of(self.head % self.capacity, time) <= min_x:
+            self.head += 1
+
+    def slots(self):
+        """Индексы живых пар в порядке появления"""
+        return np.arange(self.head, self.tail) % self.capacity
+
+    def positions(self, time):
+        """Слоты живых пар и их x в момент time"""
+        slots = self.slots()
+        return slots, self.x_of(slots, time)
+
+    def span(self, time, left, right):
+        """Номера пар [first, last), у которых left < x < right в момент time"""
+        def x_key(i):
+            return self.x_of(i % self.capacity, time)
+
+        first = bisect_right(range(self.head, self.tail), left, key=x_key) + self.head
+        last = bisect_left(range(first, self.tail), right, key=x_key) + first
+        return first, last
+
+    def span_slots(self, time, left, right):
+        first, last = self.span(time, left, right)
+        return np.arange(first, last) % self.capacity
+
+    def limits(self, time, left, right, floor, ceiling):
+        """Самые жёсткие границы прохода на отрезке x: (пол, потолок).
+
+        floor и ceiling - низ и верх арены, если палок на отрезке нет.
+        """
+        slots = self.span_slots(time, left, right)
+        if len(slots) == 0:
+            return floor, ceiling
+        return (
+            floor + float(self.bottom_height[slots].max()),
+            ceiling - float(self.top_height[slots].max())
+        )
@@ -0,0 +1,85 @@
+import math
+from functools import lru_cache
+import arcade
+from PIL import Image, ImageDraw
+
+# Во сколько раз больше рисуется картинка перед уменьшением (сглаживание краёв)
+SUPERSAMPLE = 4
+RAY_WIDTH = 3
+
+
+def _canvas(half):
+    size = math.ceil(half * 2)
+    image = Image.new("RGBA", (size * SUPERSAMPLE, size * SUPERSAMPLE), (0, 0, 0, 0))
+    return image, ImageDraw.Draw(image), size * SUPERSAMPLE / 2
+
+
+def _circle(draw, x, y, radius, color):
+    draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=tuple(color))
+
+
+def _finish(image, name):
+    size = image.width // SUPERSAMPLE
+    return arcade.Texture(image.resize((size, size), Image.LANCZOS), hash=name)
+
+
+@lru_cache(maxsize=None)
+def sun_rays_texture(radius, color):
+    """Пять лучей солнца под углами 0, 72, ... градусов (вращается целиком)"""
+    half = radius * 1.5 + RAY_WIDTH
+    image, draw, center = _canvas(half)
+    length = radius * 1.5 * SUPERSAMPLE
+    for i in range(5):
+        angle = math.radians(i * 72)
+        # В картинке ось y направлена вниз
+        end = (center + math.cos(angle) * length, center - math.sin(angle) * length)
+        draw.line((center, center) + end, fill=tuple(color), width=RAY_WIDTH * SUPERSAMPLE)
+    return _finish(image, f"sun_rays_{radius}_{tuple(color)}")
+
+
+@lru_cache(maxsize=None)
+def sun_face_texture(radius, color, has_eyes, pupil_color):
+    """Диск солнца с глазами (не вращается)"""
+    image, draw, center = _canvas(radius + 1)
+    r = radius * SUPERSAMPLE
+    _circle(draw, center, center, r, color)
+    if has_eyes:
+        for side in (-1, 1):
+            eye_x = center + side * r * 0.4
+            eye_y = center - r * 0.3
+            _circle(draw, eye_x, eye_y, r * 0.2, arcade.color.BLACK)
+            _circle(draw, eye_x, eye_y, r * 0.1, pupil_color)
+    return _finish(image, f"sun_face_{radius}_{tuple(color)}_{has_eyes}_{tuple(pupil_color)}")
+
+
+class SunSprite:
+    """Солнце из двух заранее нарисованных спрайтов: лучи и лицо.
+
+    Каждый вариант (цвет, глаза, злость, размер) рисуется в текстуру один
+    раз за процесс, а за кадр меняются только позиция и угол лучей.
+    Оба спрайта в одном SpriteList, так что солнце - один вызов отрисовки.
+    """
+
+    def __init__(self):
+        self.rays = arcade.Sprite()
+        self.face = arcade.Sprite()
+        self.sprite_list = arcade.SpriteList()
+        self.sprite_list.append(self.rays)
+        self.sprite_list.append(self.face)
+        self.variant = None
+
+    def set_variant(self, radius, is_red, has_eyes, is_angry):
+        variant = (radius, is_red, has_eyes, is_angry)
+        if variant == self.variant:
+            return
+        self.variant = variant
+        color = arcade.color.RED if is_red else arcade.color.GOLD
+        pupil_color = arcade.color.RED if is_angry else arcade.color.WHITE
+        self.rays.texture = sun_rays_texture(radius, color)
+        self.face.texture = sun_face_texture(radius, color, has_eyes, pupil_color)
+
+    def draw(self, x, y, angle):
+        self.rays.position = self.face.position = (x, y)
+        # Углы спрайтов в arcade идут по часовой стрелке
+        self.rays.angle = -angle
+        self.sprite_list.draw()
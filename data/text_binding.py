@@ -0,0 +1,40 @@
+class TextBinding:
+    """Отложенная запись строки в arcade.Text.
+
+    Каждое присваивание text заставляет pyglet заново раскладывать текст,
+    даже если строка не поменялась. Здесь новое значение только
+    запоминается, а в сам объект уходит при flush и лишь если оно
+    отличается от уже показанного. Несколько set за кадр дают одну раскладку.
+    """
+
+    def __init__(self, text_object):
+        self.text_object = text_object
+        self.value = text_object.text
+        self.pending = None
+
+    def set(self, value):
+        self.pending = value
+
+    def flush(self):
+        if self.pending is None:
+            return
+        if self.pending != self.value:
+            self.text_object.text = self.pending
+            self.value = self.pending
+        self.pending = None
+
+
+class TextBindings:
+    """Все привязки экрана: flush раз за кадр перед отрисовкой"""
+
+    def __init__(self):
+        self.bindings = []
+
+    def bind(self, text_object):
+        binding = TextBinding(text_object)
+        self.bindings.append(binding)
+        return binding
+
+    def flush(self):
+        for binding in self.bindings:
+            binding.flush()
@@ -0,0 +1,124 @@
+import heapq
+import itertools
+import json
+import os
+
+TIMELINE_DIR = os.path.join(os.path.dirname(__file__), "timelines")
+
+
+def load_timeline(name):
+    """Прочитать сценарий боя из data/timelines/<name>.json.
+
+    Сценарий - список шагов, которые выполняются по очереди. Шаг ждёт
+    либо время ("after": секунд после предыдущего шага), либо условие
+    ("until": имя условия), и затем выполняет действия из "do":
+    [["имя_действия", {аргументы}], ...]. "label" - просто подпись.
+    """
+    with open(os.path.join(TIMELINE_DIR, name + ".json"), "r", encoding="utf-8") as f:
+        steps = json.load(f)["steps"]
+
+    for index, step in enumerate(steps):
+        if ("after" in step) == ("until" in step):
+            raise ValueError(f"Шаг {index} сценария {name}: нужен ровно один из after/until")
+        step["do"] = [(action, args or {}) for action, args in step.get("do", [])]
+    return steps
+
+
+def timeline_texts(steps, action):
+    """Все тексты действия (например, "dialog") в порядке сценария"""
+    return tuple(args["text"] for step in steps for name, args in step["do"] if name == action)
+
+
+class TimelineEvent:
+    __slots__ = ("time", "actions", "is_step", "cancelled")
+
+    def __init__(self, time, actions, is_step=False):
+        self.time = time
+        self.actions = actions
+        self.is_step = is_step
+        self.cancelled = False
+
+
+class Timeline:
+    """Исполнитель сценария боя: очередь событий по времени.
+
+    Все отложенные события (следующий шаг сценария, скрытие реплики или
+    баннера, конец тряски) лежат в одной куче по времени срабатывания,
+    поэтому за тик проверяется только её вершина. Условие проверяется
+    каждый тик лишь одно - то, которого сейчас ждёт сценарий.
+
+    Действие "имя" - это метод fight.action_имя(**аргументы),
+    условие "имя" - метод fight.condition_имя().
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.fight = None
+        self.queue = []
+        self.counter = itertools.count()
+        self.next_step = 0
+        self.waiting = None
+        self.now = 0.0
+
+    def validate(self, fight):
+        for index, step in enumerate(self.steps):
+            if "until" in step and not hasattr(fight, "condition_" + step["until"]):
+                raise ValueError(f"Шаг {index}: неизвестное условие {step['until']}")
+            for action, args in step["do"]:
+                if not hasattr(fight, "action_" + action):
+                    raise ValueError(f"Шаг {index}: неизвестное действие {action}")
+
+    def start(self, fight, now):
+        self.fight = fight
+        self.queue.clear()
+        self.next_step = 0
+        self.waiting = None
+        self.now = now
+        self.schedule_next_step()
+
+    def after(self, delay, actions):
+        """Выполнить действия через delay секунд. Возвращает событие (для cancel)"""
+        event = TimelineEvent(self.now + delay, actions)
+        self.push(event)
+        return event
+
+    def cancel(self, event):
+        # Из кучи событие не достаём - оно просто пропустится при срабатывании
+        if event is not None:
+            event.cancelled = True
+
+    def push(self, event):
+        heapq.heappush(self.queue, (event.time, next(self.counter), event))
+
+    def schedule_next_step(self):
+        if self.next_step >= len(self.steps):
+            return
+        step = self.steps[self.next_step]
+        self.next_step += 1
+        if "until" in step:
+            self.waiting = step
+        else:
+            self.push(TimelineEvent(self.now + step["after"], step["do"], is_step=True))
+
+    def update(self, now):
+        """Выполнить всё, что наступило к моменту now"""
+        self.now = now
+        while True:
+            if self.queue and self.queue[0][0] <= now:
+                event = heapq.heappop(self.queue)[2]
+                if not event.cancelled:
+                    self.run(event.actions)
+                    if event.is_step:
+                        self.schedule_next_step()
+            elif self.waiting is not None and getattr(self.fight, "condition_" + self.waiting["until"])():
+                step, self.waiting = self.waiting, None
+                self.run(step["do"])
+                self.schedule_next_step()
+            else:
+                break
+            if not self.fight.game_active:
+                break
+
+    def run(self, actions):
+        for action, args in actions:
+            getattr(self.fight, "action_" + action)(**args)
@@ -0,0 +1,66 @@
+from data.startup_profile import PROFILER
+
+# Имя вида -> (модуль, класс). Модуль импортируется при первом обращении
+VIEW_MODULES = {
+    "menu": ("data.main_menu_view", "MainMenuView"),
+    "game": ("data.game_view", "GameView"),
+    "results": ("data.result_view", "ResultView"),
+    "settings": ("data.settings_view", "SettingsView"),
+}
+
+
+class ViewRegistry:
+    """Виды игры по имени, с ленивым импортом их модулей.
+
+    Модуль вида (и всё, что он тянет за собой) импортируется только когда
+    вид понадобился впервые. preimport_next позволяет заранее импортировать
+    оставшиеся модули по одному, в свободные кадры меню.
+
+    Каждый вид создаётся и настраивается (setup) один раз и дальше
+    переиспользуется: при повторном показе вид обновляет своё состояние
+    в on_show_view, а тексты, батчи и шейдеры остаются прежними.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.classes = {}
+        self.pool = {}
+
+    def view_class(self, name):
+        if name not in self.classes:
+            module_name, class_name = VIEW_MODULES[name]
+            self.classes[name] = getattr(PROFILER.import_module(module_name), class_name)
+        return self.classes[name]
+
+    def create(self, name, *args, **kwargs):
+        view = self.view_class(name)(*args, **kwargs)
+        view.setup()
+        return view
+
+    def get(self, name):
+        """Вид из пула (создаётся при первом обращении)"""
+        if name not in self.pool:
+            self.pool[name] = self.create(name)
+        return self.pool[name]
+
+    def show(self, name):
+        view = self.get(name)
+        self.window.show_view(view)
+        return view
+
+    def preimport_next(self):
+        """Импортировать один ещё не загруженный модуль. False - все уже загружены"""
+        for name in VIEW_MODULES:
+            if name not in self.classes:
+                self.view_class(name)
+                return True
+        return False
+
+
+def get_views(window):
+    """Реестр видов окна (создаётся при первом обращении)"""
+    views = getattr(window, "views", None)
+    if views is None:
+        views = ViewRegistry(window)
+        window.views = views
+    return views
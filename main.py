@@ -1,61 +1,132 @@
-import csv
-import arcade
-from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, BACKGROUND_COLOR
-from data.main_menu_view import MainMenuView
+import argparse
+from data.startup_profile import PROFILER
+
+# arcade - самый тяжёлый импорт запуска, замеряем его отдельно
+arcade = PROFILER.import_module("arcade")
+
+from data.assets import AssetRegistry
+from data.mixer import Mixer
+from data.post_process import PostProcess
+from data.settings_store import SettingsStore
+from data.views import ViewRegistry
+from data.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, BACKGROUND_COLOR,
+    MUSIC_PATH, PRELOAD_TEXTURES, PRELOAD_SOUNDS, PREIMPORT_VIEWS
+)
 
 
 class GameWindow(arcade.Window):
     def __init__(self):
         super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+        PROFILER.mark("окно создано")
 
-        # Загружаем настройки из CSV (только яркость и звуки эффектов)
-        try:
-            with open('settings.csv', 'r', encoding='utf-8') as f:
-                reader = list(csv.reader(f))
-                data = reader[0]
-                self.brightness = float(data[2])
-                self.sounds_enabled = data[3].lower() == 'true'
-        except:
-            self.brightness = 1.0
-            self.sounds_enabled = True
+        # Настройки (яркость и звуки эффектов) живут в памяти, файл пишется в фоне
+        self.settings = SettingsStore()
+        self.settings.load()
 
         # Флаг: загружена ли фоновая музыка
         self.music_loaded = False
         self.background_music = None
 
-        # Загружаем музыку всегда (если файл есть)
-        try:
-            self.background_music = arcade.load_sound("materials/sounds/btt.mp3")
+        # Общий для всех видов реестр текстур и звуков. Музыка и ресурсы
+        # боя грузятся в фоне, меню показывается сразу
+        self.assets = AssetRegistry()
+        self.assets.preload(PRELOAD_TEXTURES, PRELOAD_SOUNDS)
+        arcade.schedule(self.update_preload, 1 / 60)
+
+        # Голоса для звуковых эффектов всех видов
+        self.mixer = Mixer()
+
+        # Виды создаются по имени, их модули импортируются по мере надобности
+        self.views = ViewRegistry(self)
+        self.views_imported = not PREIMPORT_VIEWS
+        arcade.schedule(self.update_startup, 1 / 20)
+
+        # Все виды рисуют во внеэкранный буфер, яркость применяется при выводе
+        self.background_color = BACKGROUND_COLOR
+        self.post = PostProcess(self.ctx, self.get_framebuffer_size())
+
+    @property
+    def brightness(self):
+        return self.settings.get("brightness")
+
+    @property
+    def sounds_enabled(self):
+        return self.settings.get("sounds_enabled")
+
+    def update_preload(self, delta_time):
+        self.assets.poll()
+
+        # Музыку включаем, как только она декодирована (если файл есть)
+        if not self.music_loaded and MUSIC_PATH not in self.assets.pending:
+            self.background_music = self.assets.sound(MUSIC_PATH)
             if self.background_music:
                 self.music_loaded = True
                 # Всегда играем с громкостью 0.3
                 self.background_music.play(volume=0.3, loop=True)
-        except Exception as e:
-            print(f"Не удалось загрузить фоновую музыку: {e}")
-            self.music_loaded = False
-            self.background_music = None
 
-        # Применяем яркость
-        brightness_factor = max(0.25, min(1.0, self.brightness))
-        self.background_color = (
-            int(BACKGROUND_COLOR[0] * brightness_factor),
-            int(BACKGROUND_COLOR[1] * brightness_factor),
-            int(BACKGROUND_COLOR[2] * brightness_factor),
-            BACKGROUND_COLOR[3] if len(BACKGROUND_COLOR) > 3 else 255
-        )
+        if self.assets.ready:
+            PROFILER.mark("ресурсы боя готовы")
+            arcade.unschedule(self.update_preload)
 
-        self.darkness_factor = 1.0 - self.brightness
+    def update_startup(self, delta_time):
+        """Свободные кадры после запуска: доимпорт видов и отчёт о старте"""
+        if "первый кадр" not in PROFILER.marks:
+            return
+        PROFILER.mark("меню отвечает на ввод")
 
-    def setup(self):
-        menu_view = MainMenuView()
-        menu_view.setup()
-        self.show_view(menu_view)
+        # По одному модулю за вызов, чтобы меню не замирало надолго
+        if not self.views_imported:
+            self.views_imported = not self.views.preimport_next()
+            return
+
+        if self.assets.ready:
+            arcade.unschedule(self.update_startup)
+            print(PROFILER.report())
+            print(self.assets.report())
+
+    def draw(self, delta_time):
+        self.switch_to()
+        self.post.framebuffer.use()
+        self.dispatch_event("on_draw")
+        self.dispatch_event("on_refresh", delta_time)
+
+        self.post.brightness = max(0.25, min(1.0, self.brightness))
+        self.post.render()
+        self.flip()
+
+    def use(self):
+        # Виды, переключающиеся обратно на окно, попадают в буфер кадра
+        self.post.framebuffer.use()
+
+    def clear(self, color=None, color_normalized=None, viewport=None):
+        if color is None and color_normalized is None:
+            color = self.background_color
+        self.post.framebuffer.clear(color=color, color_normalized=color_normalized, viewport=viewport)
+
+    def flip(self):
+        super().flip()
+        PROFILER.mark("первый кадр")
+
+    def setup(self, replay_path=None):
+        if replay_path:
+            # Сразу в бой, ввод берётся из записи
+            from data.replay import Replay
+            self.views.get("game").replay = Replay.load(replay_path)
+            self.views.show("game")
+        else:
+            self.views.show("menu")
 
 
 def main():
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument("--replay", help="Посмотреть запись боя (например replays/last_fight.rpl)")
+    args = parser.parse_args()
+
     window = GameWindow()
-    window.setup()
+    window.setup(args.replay)
     arcade.run()
+    window.settings.flush()
 
 
 if __name__ == "__main__":